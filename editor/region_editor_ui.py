@@ -11,8 +11,10 @@ except Exception:  # pragma: no cover - allow running tests without pygame
 import yaml
 
 from engine.hotspot import Hotspot
+from engine.hotspot_shapes import parse_polygon, shape_fields
 from engine.ui_overlay import UIOverlay
 from engine.asset_manager import AssetManager
+from engine.yaml_loader import load_yaml
 
 
 class RegionEditorUI:
@@ -44,8 +46,7 @@ class RegionEditorUI:
         path = self.scene_path_from_id(scene_id)
         if not os.path.exists(path):
             raise FileNotFoundError(path)
-        with open(path, "r") as fh:
-            data = yaml.safe_load(fh) or {}
+        data = load_yaml(path) or {}
         scene_info = data.get("scene", {})
         self.active_scene = scene_id
         self.scene_data = scene_info
@@ -61,6 +62,8 @@ class RegionEditorUI:
                     action=hs.get("action", ""),
                     target=hs.get("target"),
                     condition=hs.get("condition"),
+                    polygon=parse_polygon(hs.get("polygon")),
+                    mask=hs.get("mask"),
                 )
             )
         bg = scene_info.get("background")
@@ -127,7 +130,13 @@ class RegionEditorUI:
         label: str,
         action: Dict[str, Any],
     ) -> Hotspot:
-        hs = Hotspot(id=label, area=(x, y, width, height), action=action.get("action", ""), target=action.get("target"), condition=action.get("condition"))
+        hs = Hotspot(
+            id=label,
+            area=(x, y, width, height),
+            action=action.get("action", ""),
+            target=action.get("target"),
+            condition=action.get("condition"),
+        )
         self.hotspots.append(hs)
         return hs
 
@@ -167,6 +176,7 @@ class RegionEditorUI:
                     "action": hs.action,
                     "target": hs.target,
                     "condition": hs.condition,
+                    **shape_fields(hs),
                 }
                 for hs in self.hotspots
             ],
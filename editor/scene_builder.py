@@ -13,6 +13,8 @@ import yaml
 from engine.asset_manager import AssetManager
 from engine.ui_overlay import UIOverlay
 from engine.hotspot import Hotspot
+from engine.hotspot_shapes import parse_polygon, shape_fields
+from engine.yaml_loader import load_yaml
 
 
 class SceneBuilder:
@@ -38,8 +40,7 @@ class SceneBuilder:
         """Load a scene definition from a YAML file."""
         if not os.path.exists(path):
             raise FileNotFoundError(path)
-        with open(path, "r") as fh:
-            data = yaml.safe_load(fh) or {}
+        data = load_yaml(path) or {}
 
         scene = data.get("scene", {}) or {}
         self.scene_id = scene.get("id", "")
@@ -64,6 +65,8 @@ class SceneBuilder:
                     action=action,
                     target=target,
                     condition=hs.get("condition"),
+                    polygon=parse_polygon(hs.get("polygon")),
+                    mask=hs.get("mask"),
                 )
             )
 
@@ -86,6 +89,7 @@ class SceneBuilder:
                     "action": hs.action,
                     "target": hs.target,
                     "condition": hs.condition,
+                    **shape_fields(hs),
                 }
                 for hs in self.hotspots
             ],
@@ -107,7 +111,9 @@ class SceneBuilder:
     # ------------------------------------------------------------------
     # Rendering & Input (UI only)
     # ------------------------------------------------------------------
-    def render_preview(self, surface: "pygame.Surface") -> None:  # pragma: no cover - UI only
+    def render_preview(
+        self, surface: "pygame.Surface"
+    ) -> None:  # pragma: no cover - UI only
         if not pygame:
             return
         if self.background_image:
@@ -116,7 +122,9 @@ class SceneBuilder:
             pygame.draw.rect(surface, (255, 0, 0), hs.area, 2)
         self.ui_overlay.update_mouse_hover(self.hotspots)
 
-    def handle_input(self, event: "pygame.event.Event") -> None:  # pragma: no cover - UI only
+    def handle_input(
+        self, event: "pygame.event.Event"
+    ) -> None:  # pragma: no cover - UI only
         if not pygame:
             return
         # Placeholder for future interactive editing
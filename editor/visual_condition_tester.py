@@ -13,6 +13,7 @@ except Exception:  # pragma: no cover - allow tests without PyYAML
     yaml = None
 
 from engine.game_state import GameState
+from engine.yaml_loader import load_yaml
 
 
 class VisualConditionTester:
@@ -73,8 +74,7 @@ class VisualConditionTester:
         if not yaml:
             raise RuntimeError("PyYAML is required to load condition files")
 
-        with open(file_path, "r", encoding="utf-8") as fh:
-            data = yaml.safe_load(fh) or {}
+        data = load_yaml(file_path) or {}
 
         entries = data.get("triggers", [])
         self.preview_results = []
@@ -105,7 +105,9 @@ class VisualConditionTester:
             surface.blit(surf, (padding, y))
             y += surf.get_height() + 4
 
-    def handle_input(self, event: "pygame.event.Event") -> None:  # pragma: no cover - UI only
+    def handle_input(
+        self, event: "pygame.event.Event"
+    ) -> None:  # pragma: no cover - UI only
         if not pygame:
             return
         # Minimal: left/right arrow cycle through flags and toggle with space
@@ -16,6 +16,8 @@ try:  # pragma: no cover - allow running tests without pygame installed
 except Exception:  # pragma: no cover - allow running tests without pygame
     pygame = None
 
+from .yaml_loader import load_yaml
+
 if typing.TYPE_CHECKING:  # pragma: no cover - only for type hints
     from .ui_overlay import UIOverlay
 
@@ -47,14 +49,11 @@ class AccessibilityManager:
         """Load accessibility options from ``path``."""
         if not os.path.exists(path):
             return
-        with open(path, "r", encoding="utf-8") as fh:
-            if path.endswith(".json"):
+        if path.endswith(".json"):
+            with open(path, "r", encoding="utf-8") as fh:
                 data = json.load(fh)
-            else:
-                if yaml:
-                    data = yaml.safe_load(fh) or {}
-                else:  # pragma: no cover - fallback when PyYAML missing
-                    data = json.load(fh)
+        else:
+            data = load_yaml(path) or {}
         for key, value in data.items():
             if hasattr(self, key):
                 setattr(self, key, value)
@@ -105,7 +104,10 @@ class AccessibilityManager:
             from .ui_overlay import UIOverlay
 
             self.ui_overlay.theme["font_color"] = UIOverlay.DEFAULT_THEME["font_color"]
-            self.ui_overlay.theme["box_bg_color"] = UIOverlay.DEFAULT_THEME["box_bg_color"]
+            self.ui_overlay.theme["box_bg_color"] = UIOverlay.DEFAULT_THEME[
+                "box_bg_color"
+            ]
+        self.ui_overlay.invalidate_cache()
 
     # ------------------------------------------------------------------
     # Options API
@@ -1,28 +1,126 @@
 from __future__ import annotations
 
+import io
 import logging
 import os
-from typing import Dict, List, Optional
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Set, Tuple
 
 try:  # pragma: no cover - allow running tests without pygame
     import pygame
 except Exception:  # pragma: no cover - allow running tests without pygame
     pygame = None
 
+from .asset_manifest import AssetManifest
+from .asset_pack import AssetPack, PackFile
+from .asset_requests import AssetDecoder, AssetHandle
 from .scene import Scene
+from .texture_atlas import TextureAtlas
 
 logger = logging.getLogger(__name__)
 
+MB = 1024 * 1024
+
+Size = Tuple[int, int]
+
+
+def surface_bytes(surface) -> int:
+    """Return the pixel buffer size of ``surface`` in bytes.
+
+    Subsurfaces (atlas images) share their parent's pixels and count as 0.
+    """
+    try:
+        if surface.get_parent() is not None:
+            return 0
+    except Exception:
+        pass
+    try:
+        return surface.get_width() * surface.get_height() * surface.get_bytesize()
+    except Exception:
+        return 0
+
+
+def sound_bytes(sound) -> int:
+    """Return the decoded PCM size of ``sound`` in bytes."""
+    try:
+        frequency, fmt, channels = pygame.mixer.get_init()
+        return int(sound.get_length() * frequency * channels * (abs(fmt) // 8))
+    except Exception:
+        return 0
+
 
 class AssetManager:
-    """Load and cache game assets with smart caching and fallbacks."""
+    """Load and cache game assets with smart caching and fallbacks.
 
-    def __init__(self, base_path: str = "assets/", search_paths: Optional[List[str]] = None) -> None:
+    Images are converted to the display format on load: fully opaque images
+    with ``convert()`` (faster blits), the rest with ``convert_alpha()``.
+    When ``art_resolution`` and ``target_resolution`` differ, scene layers
+    are served from pre-scaled variants built once per target size (see
+    :meth:`get_scaled_image`) instead of being scaled while drawing.
+
+    Cached images, scaled variants and sounds are kept in one LRU with
+    their real footprint (pixel buffer or decoded PCM bytes). With
+    ``memory_limit_mb`` set, least recently used entries are evicted until
+    the cache fits; entries for :meth:`pin`-ned paths are never evicted.
+
+    Scenes hold references to the assets they use (:meth:`acquire_scene`);
+    :meth:`release_scene` unloads whatever no live or prefetched scene
+    still references.
+
+    :meth:`request_image` and :meth:`request_sound` decode on a pool of
+    ``decode_workers`` threads and return an :class:`AssetHandle`; call
+    :meth:`process_pending` once per frame to convert and cache finished
+    images on the main thread within a time budget.
+
+    With a :attr:`manifest` (:meth:`build_manifest` or :meth:`load_manifest`)
+    paths resolve through an index of the asset roots instead of ``stat``
+    calls on every root per cache miss; names missing from the index are
+    checked on disk once and then remembered as missing until the manifest
+    is rebuilt or the search paths change.
+
+    Mounted :class:`AssetPack` archives (:meth:`mount_pack`) are checked
+    before loose files; their data is decoded straight from the mapping.
+    """
+
+    def __init__(
+        self,
+        base_path: str = "assets/",
+        search_paths: Optional[List[str]] = None,
+        art_resolution: Optional[Size] = None,
+        target_resolution: Optional[Size] = None,
+        memory_limit_mb: Optional[float] = None,
+        decode_workers: int = 2,
+        manifest: Optional[AssetManifest] = None,
+    ) -> None:
         self.base_path = base_path
         self.search_paths: List[str] = search_paths or []
+        self.manifest = manifest
+        # names the manifest and the disk both lack, valid for _missing_roots
+        self._missing: Set[str] = set()
+        self._missing_roots: List[str] = []
+        self.packs: List[AssetPack] = []
+        self.art_resolution = tuple(art_resolution) if art_resolution else None
+        self.target_resolution = tuple(target_resolution) if target_resolution else None
         self.image_cache: Dict[str, "pygame.Surface"] = {}
+        self.scaled_cache: Dict[Tuple[str, Size], "pygame.Surface"] = {}
         self.music_cache: Dict[str, str] = {}
         self.sound_cache: Dict[str, "pygame.mixer.Sound"] = {}
+        self.atlases: List[TextureAtlas] = []
+        self.memory_limit: Optional[int] = (
+            int(memory_limit_mb * MB) if memory_limit_mb is not None else None
+        )
+        self.pinned: Set[str] = set()
+        # holder (scene id) -> paths it uses, and path -> number of holders
+        self.scene_refs: Dict[str, Set[str]] = {}
+        self.ref_counts: Dict[str, int] = {}
+        self.bytes_used = 0
+        self.evictions = 0
+        # (category, key) -> bytes, least recently used first
+        self._lru: "OrderedDict[Tuple[str, Hashable], int]" = OrderedDict()
+        self._lock = threading.RLock()
+        self.decoder = AssetDecoder(decode_workers)
+        self._stand_in: Optional["pygame.Surface"] = None
 
         # backward compatible attribute names
         self.images = self.image_cache
@@ -32,19 +130,111 @@ class AssetManager:
     # ------------------------------------------------------------------
     # Path helpers
     # ------------------------------------------------------------------
-    def _resolve_path(self, path: str) -> str:
+    def _locate(self, path: str) -> Optional[str]:
+        """Return the existing file for ``path``, or ``None`` when missing.
+
+        With a :attr:`manifest` relative names are a dict lookup first. Names
+        it does not list (files added after the scan, new search paths) and
+        names outside the asset roots (absolute or ``..``) are checked on disk;
+        relative names found nowhere are remembered so repeated lookups of a
+        missing asset do not ``stat`` every root again.
+        """
+        key = None
+        if self.manifest is not None and not os.path.isabs(path):
+            key = os.path.normpath(path)
+            if key == os.pardir or key.startswith(os.pardir + os.sep):
+                key = None
+            else:
+                resolved = self.manifest.resolve(key)
+                if resolved is not None:
+                    return resolved
+                roots = self.asset_roots()
+                if roots != self._missing_roots:
+                    self._missing.clear()
+                    self._missing_roots = roots
+                if key in self._missing:
+                    return None
         if os.path.isabs(path):
-            if os.path.exists(path):
-                return path
-        else:
-            candidate = os.path.join(self.base_path, path)
-            if os.path.exists(candidate):
-                return candidate
-        for root in self.search_paths:
+            return path if os.path.exists(path) else None
+        for root in self.asset_roots():
             candidate = os.path.join(root, path)
             if os.path.exists(candidate):
                 return candidate
-        return os.path.join(self.base_path, path)
+        if key is not None:
+            self._missing.add(key)
+        return None
+
+    def _resolve_path(self, path: str) -> str:
+        return self._locate(path) or os.path.join(self.base_path, path)
+
+    def asset_roots(self) -> List[str]:
+        return [self.base_path, *self.search_paths]
+
+    def build_manifest(self, hashes: bool = False) -> AssetManifest:
+        """Index :meth:`asset_roots` once and resolve names through the index.
+
+        Files added later are still found on disk unless they were already
+        looked up as missing; call again after adding files to pick them up.
+        """
+        self._missing.clear()
+        self.manifest = AssetManifest.scan(self.asset_roots(), hashes=hashes)
+        logger.debug("Indexed %d asset files", len(self.manifest))
+        return self.manifest
+
+    def load_manifest(self, index_path: str) -> Optional[AssetManifest]:
+        """Use a prebuilt index (see ``tools/asset_manifest.py``)."""
+        resolved = self._resolve_path(index_path)
+        try:
+            self.manifest = AssetManifest.load(resolved)
+            self._missing.clear()
+        except Exception as exc:
+            logger.error("Failed to load asset manifest '%s': %s", resolved, exc)
+            return None
+        return self.manifest
+
+    def missing_assets(self, paths: Iterable[str]) -> List[str]:
+        """Return the ``paths`` that are neither packed nor a file."""
+        keys = dict.fromkeys(os.path.normpath(p) for p in paths if p)
+        return [
+            key
+            for key in keys
+            if self._pack_data(key) is None and self._locate(key) is None
+        ]
+
+    # ------------------------------------------------------------------
+    # Packs
+    # ------------------------------------------------------------------
+    def mount_pack(self, pack: AssetPack | str) -> Optional[AssetPack]:
+        """Serve the files in ``pack`` (an :class:`AssetPack` or its path).
+
+        Packs mounted later are checked first, so patch packs can override
+        earlier ones.
+        """
+        if isinstance(pack, str):
+            resolved = self._resolve_path(pack)
+            try:
+                pack = AssetPack(resolved)
+            except Exception as exc:
+                logger.error("Failed to mount asset pack '%s': %s", resolved, exc)
+                return None
+        self.packs.insert(0, pack)
+        logger.debug("Mounted %d packed assets from %s", len(pack), pack.path)
+        return pack
+
+    def unmount_packs(self) -> None:
+        packs, self.packs = self.packs, []
+        for pack in packs:
+            try:
+                pack.close()
+            except BufferError:  # a decoder still holds a slice
+                pass
+
+    def _pack_data(self, key: str) -> Optional[memoryview]:
+        for pack in self.packs:
+            data = pack.view(key)
+            if data is not None:
+                return data
+        return None
 
     def _placeholder_image(self) -> Optional["pygame.Surface"]:
         if not pygame:
@@ -58,117 +248,565 @@ class AssetManager:
     # ------------------------------------------------------------------
     def get_image(self, path: str) -> Optional["pygame.Surface"]:
         key = os.path.normpath(path)
-        if key in self.image_cache:
-            return self.image_cache[key]
+        image = self._lookup("image", key)
+        if image is not None:
+            return image
+        pending = self.decoder.get(("image", key))
+        if pending is not None:
+            return self.decoder.finish(pending, self._finalize_request)
+        for atlas in self.atlases:
+            image = atlas.get(key)
+            if image is not None:
+                self._store("image", key, image)
+                return image
+        data = self._pack_data(key) if pygame else None
+        if data is not None:
+            try:
+                image = self._convert(self._decode_image(data, key))
+            except Exception as exc:
+                logger.error("Failed to load image '%s': %s", key, exc)
+                image = self._placeholder_image()
+            if image:
+                self._store("image", key, image)
+            return image
 
-        resolved = self._resolve_path(path)
+        resolved = self._locate(path)
         if not pygame:
-            logger.info("pygame not available, skipping image load: %s", resolved)
+            logger.info("pygame not available, skipping image load: %s", path)
             return None
-        if not os.path.exists(resolved):
-            logger.warning("Image not found: %s", resolved)
+        if resolved is None:
+            logger.warning("Image not found: %s", os.path.join(self.base_path, path))
             image = self._placeholder_image()
             if image:
-                self.image_cache[key] = image
+                self._store("image", key, image)
             return image
         try:
-            image = pygame.image.load(resolved).convert_alpha()
+            image = self._convert(pygame.image.load(resolved))
         except Exception as exc:  # pragma: no cover - only when pygame fails
             logger.error("Failed to load image '%s': %s", resolved, exc)
             image = self._placeholder_image()
         if image:
-            self.image_cache[key] = image
+            self._store("image", key, image)
         return image
 
+    @staticmethod
+    def is_opaque(image: "pygame.Surface") -> bool:
+        """Return ``True`` when no pixel of ``image`` is even partly transparent."""
+        if not image.get_flags() & pygame.SRCALPHA:
+            return True
+        width, height = image.get_size()
+        # pixels with alpha above 254 are set in the mask
+        return pygame.mask.from_surface(image, 254).count() == width * height
+
+    def _convert(self, image: "pygame.Surface") -> "pygame.Surface":
+        """Convert ``image`` to the display format, dropping alpha when unused.
+
+        Without a display mode (headless ``offscreen`` runs) the image is
+        returned as loaded.
+        """
+        if pygame.display.get_surface() is None:
+            return image
+        if self.is_opaque(image):
+            return image.convert()
+        return image.convert_alpha()
+
+    # ------------------------------------------------------------------
+    # Scaled variants
+    # ------------------------------------------------------------------
+    def set_resolution(
+        self, target_resolution: Optional[Size], art_resolution: Optional[Size] = None
+    ) -> None:
+        """Change the target (and optionally art) resolution.
+
+        Variants for other target sizes are dropped.
+        """
+        if art_resolution is not None:
+            self.art_resolution = tuple(art_resolution)
+        self.target_resolution = tuple(target_resolution) if target_resolution else None
+        self.clear_cache("scaled")
+
+    def scaled_size(self, size: Size) -> Size:
+        """Return ``size`` mapped from art to target resolution."""
+        if not self.art_resolution or not self.target_resolution:
+            return tuple(size)
+        (art_w, art_h), (target_w, target_h) = (
+            self.art_resolution,
+            self.target_resolution,
+        )
+        return (
+            max(1, round(size[0] * target_w / art_w)),
+            max(1, round(size[1] * target_h / art_h)),
+        )
+
+    def get_scaled_image(
+        self, path: str, size: Optional[Size] = None
+    ) -> Optional["pygame.Surface"]:
+        """Return ``path`` scaled to ``size``, or to the target resolution.
+
+        Variants are built once with ``smoothscale`` and cached by path and
+        size; when no scaling is needed the original image is returned.
+        """
+        image = self.get_image(path)
+        if image is None or not pygame:
+            return image
+        size = tuple(size) if size else self.scaled_size(image.get_size())
+        if size == image.get_size():
+            return image
+        key = (os.path.normpath(path), size)
+        variant = self._lookup("scaled", key)
+        if variant is None:
+            try:
+                variant = pygame.transform.smoothscale(image, size)
+            except ValueError:  # smoothscale needs 24 or 32 bit surfaces
+                variant = pygame.transform.scale(image, size)
+            self._store("scaled", key, variant)
+        return variant
+
+    # ------------------------------------------------------------------
+    # Atlas helpers
+    # ------------------------------------------------------------------
+    def add_atlas(self, atlas: TextureAtlas) -> None:
+        """Serve the images packed in ``atlas`` from its pages.
+
+        Separately loaded copies of those images are dropped from the cache.
+        """
+        self.atlases.append(atlas)
+        for key in atlas.keys():
+            self._remove("image", key)
+
+    def load_atlas(self, index_path: str) -> Optional[TextureAtlas]:
+        """Load an offline atlas (see ``tools/atlas_builder.py``)."""
+        resolved = self._locate(index_path)
+        if not pygame:
+            logger.info("pygame not available, skipping atlas load: %s", index_path)
+            return None
+        if resolved is None:
+            logger.warning(
+                "Atlas not found: %s", os.path.join(self.base_path, index_path)
+            )
+            return None
+        try:
+            atlas = TextureAtlas.load(resolved)
+        except Exception as exc:
+            logger.error("Failed to load atlas '%s': %s", resolved, exc)
+            return None
+        self.add_atlas(atlas)
+        return atlas
+
+    def build_atlas(
+        self,
+        paths: Iterable[str],
+        page_size: int = 1024,
+        max_size: int = 256,
+        padding: int = 1,
+    ) -> Optional[TextureAtlas]:
+        """Pack the images at ``paths`` into a new atlas, e.g. at region load.
+
+        Missing images and images larger than ``max_size`` on either side
+        are left to :meth:`get_image`.
+        """
+        if not pygame:
+            return None
+        images: Dict[str, "pygame.Surface"] = {}
+        for path in paths:
+            key = os.path.normpath(path)
+            if key in images or self.get_region(key) is not None:
+                continue
+            source = self._pack_data(key)
+            if source is None:
+                source = self._locate(path)
+            if source is None:
+                continue
+            try:
+                image = self._decode_image(source, key)
+            except Exception as exc:  # pragma: no cover - only when pygame fails
+                logger.error("Failed to load image '%s': %s", key, exc)
+                continue
+            width, height = image.get_size()
+            if width <= max_size and height <= max_size:
+                images[key] = image
+        if not images:
+            return None
+        atlas = TextureAtlas.build(images, page_size, padding)
+        self.add_atlas(atlas)
+        return atlas
+
+    def get_region(
+        self, path: str
+    ) -> Optional[Tuple["pygame.Surface", Tuple[int, int, int, int]]]:
+        """Return ``(page, rect)`` when ``path`` is packed in an atlas."""
+        key = os.path.normpath(path)
+        for atlas in self.atlases:
+            source = atlas.source(key)
+            if source is not None:
+                return source
+        return None
+
     # ------------------------------------------------------------------
     # Music helpers
     # ------------------------------------------------------------------
     def get_music(self, path: str) -> Optional[str]:
+        """Return the track to pass to :meth:`music_source`.
+
+        Loose files come back as their path, packed tracks as their name.
+        Only the path is resolved: ``pygame.mixer.music.load`` would stop
+        the playing track, so loading is left to whoever starts playback.
+        """
         key = os.path.normpath(path)
         if key in self.music_cache:
             return self.music_cache[key]
+        if pygame and self._pack_data(key) is not None:
+            self.music_cache[key] = key
+            return key
 
-        resolved = self._resolve_path(path)
-        if not pygame:
-            logger.info("pygame not available, skipping music load: %s", resolved)
-            self.music_cache[key] = resolved
-            return resolved
-        if not os.path.exists(resolved):
+        located = self._locate(path)
+        resolved = located or os.path.join(self.base_path, path)
+        if located is None:
             logger.warning("Music not found: %s", resolved)
-            self.music_cache[key] = resolved
-            return resolved
-        try:
-            pygame.mixer.music.load(resolved)
-        except Exception as exc:  # pragma: no cover - only when pygame fails
-            logger.error("Failed to load music '%s': %s", resolved, exc)
         self.music_cache[key] = resolved
         return resolved
 
+    def music_source(self, track: str) -> str | io.RawIOBase:
+        """Return what ``pygame.mixer.music.load`` should stream ``track`` from."""
+        data = self._pack_data(track) if not os.path.isabs(track) else None
+        return PackFile(data) if data is not None else track
+
     # ------------------------------------------------------------------
     # Sound effect helpers
     # ------------------------------------------------------------------
     def get_sound(self, path: str) -> Optional["pygame.mixer.Sound"]:
         key = os.path.normpath(path)
-        if key in self.sound_cache:
-            return self.sound_cache[key]
+        sound = self._lookup("sound", key)
+        if sound is not None:
+            return sound
+        pending = self.decoder.get(("sound", key))
+        if pending is not None:
+            return self.decoder.finish(pending, self._finalize_request)
+        data = self._pack_data(key) if pygame else None
+        if data is not None:
+            try:
+                sound = self._decode_sound(data)
+            except Exception as exc:
+                logger.error("Failed to load sound '%s': %s", key, exc)
+                return None
+            self._store("sound", key, sound)
+            return sound
 
-        resolved = self._resolve_path(path)
+        resolved = self._locate(path)
         if not pygame:
-            logger.info("pygame not available, skipping sound load: %s", resolved)
+            logger.info("pygame not available, skipping sound load: %s", path)
             return None
-        if not os.path.exists(resolved):
-            logger.warning("Sound not found: %s", resolved)
+        if resolved is None:
+            logger.warning("Sound not found: %s", os.path.join(self.base_path, path))
             return None
         try:
-            sound = pygame.mixer.Sound(resolved)
+            sound = self._decode_sound(resolved)
         except Exception as exc:  # pragma: no cover - only when pygame fails
             logger.error("Failed to load sound '%s': %s", resolved, exc)
             return None
-        self.sound_cache[key] = sound
+        self._store("sound", key, sound)
         return sound
 
+    # ------------------------------------------------------------------
+    # Asynchronous loading
+    # ------------------------------------------------------------------
+    def placeholder(self) -> Optional["pygame.Surface"]:
+        """Shared magenta stand-in shown while an image is decoding."""
+        if self._stand_in is None:
+            self._stand_in = self._placeholder_image()
+        return self._stand_in
+
+    def request_image(self, path: str) -> AssetHandle:
+        """Start decoding ``path`` on a worker and return its handle.
+
+        Cached and atlas images come back as completed handles; missing
+        files complete with the placeholder like :meth:`get_image`.
+        """
+        key = os.path.normpath(path)
+        image = self._lookup("image", key)
+        if image is None and any(key in atlas for atlas in self.atlases):
+            image = self.get_image(path)
+        if image is not None:
+            return AssetHandle.completed(("image", key), image)
+        source = self._pack_data(key) or self._locate(path)
+        if not pygame or source is None:
+            return AssetHandle.completed(("image", key), self.get_image(path))
+        return self.decoder.submit(
+            ("image", key),
+            self._decode_image,
+            source,
+            key,
+            placeholder=self.placeholder(),
+        )
+
+    def request_sound(self, path: str) -> AssetHandle:
+        """Start decoding the sound at ``path`` on a worker."""
+        key = os.path.normpath(path)
+        sound = self._lookup("sound", key)
+        if sound is not None:
+            return AssetHandle.completed(("sound", key), sound)
+        source = self._pack_data(key) or self._locate(path)
+        if not pygame or source is None:
+            return AssetHandle.completed(("sound", key), self.get_sound(path))
+        return self.decoder.submit(("sound", key), self._decode_sound, source)
+
+    @staticmethod
+    def _read(source: str | memoryview) -> io.RawIOBase:
+        if isinstance(source, memoryview):
+            return PackFile(source)
+        with open(source, "rb") as fh:
+            return io.BytesIO(fh.read())
+
+    @classmethod
+    def _decode_image(
+        cls, source: str | memoryview, name: str = ""
+    ) -> "pygame.Surface":
+        """Decode a file path or packed bytes; safe on a worker (no display access)."""
+        namehint = name or (source if isinstance(source, str) else "")
+        return pygame.image.load(cls._read(source), namehint)
+
+    @classmethod
+    def _decode_sound(cls, source: str | memoryview) -> "pygame.mixer.Sound":
+        # packed data is an encoded file (wav/ogg), not raw PCM for ``buffer=``
+        if isinstance(source, memoryview):
+            return pygame.mixer.Sound(file=cls._read(source))
+        return pygame.mixer.Sound(source)
+
+    def _finalize_request(self, handle: AssetHandle, result: Any) -> Any:
+        category, key = handle.key
+        if isinstance(result, BaseException):
+            logger.error("Failed to load %s '%s': %s", category, key, result)
+            if category != "image":
+                return None
+            result = self._placeholder_image()
+        elif category == "image":
+            result = self._convert(result)
+        if result is not None:
+            self._store(category, key, result)
+        return result
+
+    def process_pending(
+        self, budget_ms: float = 2.0, max_items: Optional[int] = None
+    ) -> int:
+        """Finish decoded requests on the main thread; returns how many landed."""
+        if not len(self.decoder):
+            return 0
+        return self.decoder.finish_ready(self._finalize_request, budget_ms, max_items)
+
     # ------------------------------------------------------------------
     # Scene helpers
     # ------------------------------------------------------------------
-    def preload_scene_assets(self, scene_data: Scene | Dict) -> None:
+    @staticmethod
+    def scene_assets(scene_data: Scene | Dict) -> Dict[str, List[str]]:
+        """Return the ``images``, ``sounds`` and ``music`` a scene uses."""
         if isinstance(scene_data, dict):
-            scene_dict = scene_data
+            background = scene_data.get("background")
+            overlays = scene_data.get("overlays")
+            features = scene_data.get("features")
         else:
-            scene_dict = {
-                "background": getattr(scene_data, "background", None),
-                "overlays": getattr(scene_data, "overlays", []),
-                "features": getattr(scene_data, "features", {}) or {},
-                "id": getattr(scene_data, "id", None),
-            }
-        if scene_dict.get("background"):
-            self.get_image(scene_dict["background"])
-        for overlay in scene_dict.get("overlays", []) or []:
-            self.get_image(overlay)
-        features = scene_dict.get("features") or {}
-        music_path = features.get("music")
-        if music_path:
-            self.get_music(music_path)
-        sound_path = features.get("sound")
-        if sound_path:
-            self.get_sound(sound_path)
-        for snd in features.get("sounds", []):
-            self.get_sound(snd)
-        logger.debug("Preloaded assets for scene: %s", scene_dict.get("id"))
+            background = getattr(scene_data, "background", None)
+            overlays = getattr(scene_data, "overlays", None)
+            features = getattr(scene_data, "features", None)
+        features = features or {}
+        images = [background] if background else []
+        images.extend(overlays or [])
+        sounds = [features["sound"]] if features.get("sound") else []
+        sounds.extend(features.get("sounds", []) or [])
+        music = [features["music"]] if features.get("music") else []
+        return {"images": images, "sounds": sounds, "music": music}
+
+    def preload_scene_assets(
+        self, scene_data: Scene | Dict, include_music: bool = True
+    ) -> None:
+        assets = self.scene_assets(scene_data)
+        for path in assets["images"]:
+            self.get_scaled_image(path)
+        if include_music:
+            for path in assets["music"]:
+                self.get_music(path)
+        for path in assets["sounds"]:
+            self.get_sound(path)
+        scene_id = (
+            scene_data.get("id")
+            if isinstance(scene_data, dict)
+            else getattr(scene_data, "id", None)
+        )
+        logger.debug("Preloaded assets for scene: %s", scene_id)
 
     # backward compatibility
     preload_scene = preload_scene_assets
 
+    def request_scene_assets(self, scene_data: Scene | Dict) -> List[AssetHandle]:
+        """Start decoding a scene's images and sounds on the worker pool.
+
+        Safe to call off the main thread: music is left alone, and the
+        decoded files are only converted and cached by :meth:`process_pending`
+        or by :meth:`get_image` when the scene is activated.
+        """
+        assets = self.scene_assets(scene_data)
+        handles = [self.request_image(path) for path in assets["images"]]
+        handles.extend(self.request_sound(path) for path in assets["sounds"])
+        return handles
+
+    # ------------------------------------------------------------------
+    # Scene references
+    # ------------------------------------------------------------------
+    def acquire_scene(self, holder: str, paths: Iterable[str]) -> None:
+        """Record that ``holder`` (a live or prefetched scene) uses ``paths``.
+
+        Acquiring again replaces the holder's previous set of paths.
+        """
+        keys = {os.path.normpath(p) for p in paths if p}
+        with self._lock:
+            previous = self.scene_refs.get(holder, set())
+            for key in keys - previous:
+                self.ref_counts[key] = self.ref_counts.get(key, 0) + 1
+            self.scene_refs[holder] = keys
+            self._drop_refs(previous - keys)
+
+    def release_scene(self, holder: str, unload: bool = True) -> List[str]:
+        """Drop ``holder``'s references and return the paths no holder uses.
+
+        With ``unload`` those paths (unless pinned) are removed from every
+        cache, including their scaled variants.
+        """
+        with self._lock:
+            released = self._drop_refs(self.scene_refs.pop(holder, set()))
+            if unload:
+                for key in released:
+                    self.unload(key)
+        return released
+
+    def _drop_refs(self, keys: Iterable[str]) -> List[str]:
+        released = []
+        for key in keys:
+            count = self.ref_counts.get(key, 0) - 1
+            if count > 0:
+                self.ref_counts[key] = count
+            else:
+                self.ref_counts.pop(key, None)
+                released.append(key)
+        return sorted(released)
+
+    def is_referenced(self, path: str) -> bool:
+        return os.path.normpath(path) in self.ref_counts
+
+    def unload(self, path: str) -> bool:
+        """Remove ``path`` from the caches unless it is pinned or referenced."""
+        key = os.path.normpath(path)
+        with self._lock:
+            if key in self.pinned or key in self.ref_counts:
+                return False
+            for category in ("image", "sound", "music"):
+                self._remove(category, key)
+            for scaled_key in [k for k in self.scaled_cache if k[0] == key]:
+                self._remove("scaled", scaled_key)
+        return True
+
     # ------------------------------------------------------------------
     # Cache management
     # ------------------------------------------------------------------
+    def _caches(self) -> Dict[str, Dict[Any, Any]]:
+        return {
+            "image": self.image_cache,
+            "scaled": self.scaled_cache,
+            "sound": self.sound_cache,
+            "music": self.music_cache,
+        }
+
+    def _lookup(self, category: str, key: Hashable) -> Any:
+        with self._lock:
+            value = self._caches()[category].get(key)
+            if value is not None and (category, key) in self._lru:
+                self._lru.move_to_end((category, key))
+            return value
+
+    def _store(self, category: str, key: Hashable, value: Any) -> None:
+        size = sound_bytes(value) if category == "sound" else surface_bytes(value)
+        with self._lock:
+            self._remove(category, key)
+            self._caches()[category][key] = value
+            self._lru[(category, key)] = size
+            self.bytes_used += size
+            if self.memory_limit is not None:
+                self.enforce_budget(keep=(category, key))
+
+    def _remove(self, category: str, key: Hashable) -> None:
+        with self._lock:
+            self._caches()[category].pop(key, None)
+            self.bytes_used -= self._lru.pop((category, key), 0)
+
+    def is_pinned(self, category: str, key: Hashable) -> bool:
+        path = key[0] if category == "scaled" else key
+        return path in self.pinned
+
+    def pin(self, paths: Iterable[str]) -> None:
+        """Protect the assets at ``paths`` (and their scaled variants) from eviction."""
+        self.pinned.update(os.path.normpath(p) for p in paths if p)
+
+    def unpin(self, paths: Iterable[str]) -> None:
+        self.pinned.difference_update(os.path.normpath(p) for p in paths if p)
+
+    def set_pinned(self, paths: Iterable[str]) -> None:
+        """Replace the pinned set, e.g. with the active scene's assets."""
+        self.pinned = {os.path.normpath(p) for p in paths if p}
+
+    def set_memory_limit(self, limit_mb: Optional[float]) -> None:
+        self.memory_limit = int(limit_mb * MB) if limit_mb is not None else None
+        if self.memory_limit is not None:
+            self.enforce_budget()
+
+    def enforce_budget(
+        self, limit: Optional[int] = None, keep: Optional[Tuple[str, Hashable]] = None
+    ) -> int:
+        """Evict least recently used, unpinned entries until under ``limit`` bytes.
+
+        ``limit`` defaults to :attr:`memory_limit`. Returns the bytes freed.
+        """
+        limit = self.memory_limit if limit is None else limit
+        if limit is None:
+            return 0
+        freed = 0
+        with self._lock:
+            for entry in list(self._lru):
+                if self.bytes_used <= limit:
+                    break
+                if entry == keep or self.is_pinned(*entry):
+                    continue
+                size = self._lru[entry]
+                self._remove(*entry)
+                freed += size
+                self.evictions += 1
+        if freed:
+            logger.debug("Evicted %.2f MB of assets", freed / MB)
+        return freed
+
+    def clear_unpinned(self) -> int:
+        """Drop every cached asset that is not pinned. Returns the bytes freed."""
+        return self.enforce_budget(limit=0)
+
+    def memory_usage(self) -> Dict[str, int]:
+        """Return cached bytes per category (``image``, ``scaled``, ``sound``)."""
+        usage = {"image": 0, "scaled": 0, "sound": 0}
+        with self._lock:
+            for (category, _), size in self._lru.items():
+                usage[category] = usage.get(category, 0) + size
+        return usage
+
     def clear_cache(self, category: Optional[str] = None) -> None:
         if category is None:
-            self.image_cache.clear()
-            self.music_cache.clear()
-            self.sound_cache.clear()
+            categories = ["image", "scaled", "sound", "music"]
         elif category in {"images", "image"}:
-            self.image_cache.clear()
+            categories = ["image", "scaled"]
+        elif category in {"scaled"}:
+            categories = ["scaled"]
         elif category in {"music", "musics"}:
-            self.music_cache.clear()
+            categories = ["music"]
         elif category in {"sounds", "sound"}:
-            self.sound_cache.clear()
+            categories = ["sound"]
+        else:
+            return
+        with self._lock:
+            for name in categories:
+                for key in list(self._caches()[name]):
+                    self._remove(name, key)
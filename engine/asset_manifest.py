@@ -0,0 +1,172 @@
+"""Index of the files below the asset roots, built once per run."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from dataclasses import dataclass
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence
+
+INDEX_VERSION = 1
+
+
+@dataclass(frozen=True)
+class ManifestEntry:
+    """One asset file: where it lives, its size and (optionally) content hash."""
+
+    path: str
+    size: int
+    mtime_ns: int
+    hash: Optional[str] = None
+
+
+def file_hash(path: str) -> str:
+    """Return the SHA-1 hex digest of the file at ``path``."""
+    digest = hashlib.sha1()
+    with open(path, "rb") as fh:
+        for chunk in iter(lambda: fh.read(1 << 16), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class AssetManifest:
+    """Map logical asset names (``"icons/key.png"``) to the files they resolve to.
+
+    :meth:`scan` walks every root once with ``os.scandir``; like
+    ``AssetManager`` lookups, a name found under several roots resolves to
+    the first root. Resolution is then a dict lookup with no ``stat`` calls.
+    ``AssetManager`` checks names the manifest lacks on disk once and
+    remembers the misses until the manifest is rebuilt or its search paths
+    change.
+    """
+
+    def __init__(
+        self, roots: Sequence[str], entries: Optional[Dict[str, ManifestEntry]] = None
+    ) -> None:
+        self.roots: List[str] = list(roots)
+        self.entries: Dict[str, ManifestEntry] = entries or {}
+
+    def __contains__(self, name: str) -> bool:
+        return os.path.normpath(name) in self.entries
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def names(self) -> Iterator[str]:
+        return iter(self.entries)
+
+    def get(self, name: str) -> Optional[ManifestEntry]:
+        return self.entries.get(os.path.normpath(name))
+
+    def resolve(self, name: str) -> Optional[str]:
+        """Return the file for ``name``, or ``None`` when no root has it."""
+        entry = self.entries.get(os.path.normpath(name))
+        return entry.path if entry is not None else None
+
+    def missing(self, names: Iterable[str]) -> List[str]:
+        """Return the ``names`` that are not in the manifest, normalised."""
+        keys = dict.fromkeys(os.path.normpath(n) for n in names if n)
+        return [key for key in keys if key not in self.entries]
+
+    def total_bytes(self) -> int:
+        return sum(entry.size for entry in self.entries.values())
+
+    def diff(self, newer: "AssetManifest") -> Dict[str, List[str]]:
+        """Return the names ``added``, ``removed`` and ``changed`` in ``newer``.
+
+        Entries are compared by hash when both sides have one, otherwise by
+        size and modification time.
+        """
+        changed = []
+        for key in sorted(self.entries.keys() & newer.entries.keys()):
+            old, new = self.entries[key], newer.entries[key]
+            if old.hash and new.hash:
+                if old.hash != new.hash:
+                    changed.append(key)
+            elif (old.size, old.mtime_ns) != (new.size, new.mtime_ns):
+                changed.append(key)
+        return {
+            "added": sorted(newer.entries.keys() - self.entries.keys()),
+            "removed": sorted(self.entries.keys() - newer.entries.keys()),
+            "changed": changed,
+        }
+
+    # ------------------------------------------------------------------
+    # Building
+    # ------------------------------------------------------------------
+    @classmethod
+    def scan(
+        cls, roots: Sequence[str], hashes: bool = False, skip: Iterable[str] = ()
+    ) -> "AssetManifest":
+        """Index every file below ``roots``; ``hashes`` also reads each file.
+
+        Hidden files and folders (``.git``, ``.cache``) and the files in
+        ``skip`` (e.g. the index itself) are left out.
+        """
+        skipped = {os.path.abspath(path) for path in skip}
+        entries: Dict[str, ManifestEntry] = {}
+        for root in roots:
+            if not os.path.isdir(root):
+                continue
+            stack = [root]
+            while stack:
+                with os.scandir(stack.pop()) as found:
+                    for entry in found:
+                        if entry.name.startswith("."):
+                            continue
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                            continue
+                        if not entry.is_file():
+                            continue
+                        if skipped and os.path.abspath(entry.path) in skipped:
+                            continue
+                        key = os.path.normpath(os.path.relpath(entry.path, root))
+                        if key in entries:
+                            continue
+                        stat = entry.stat()
+                        entries[key] = ManifestEntry(
+                            entry.path,
+                            stat.st_size,
+                            stat.st_mtime_ns,
+                            file_hash(entry.path) if hashes else None,
+                        )
+        return cls(roots, entries)
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+    def save(self, index_path: str) -> None:
+        """Write the manifest as a JSON index at ``index_path``."""
+        folder = os.path.dirname(os.path.abspath(index_path))
+        os.makedirs(folder, exist_ok=True)
+        index = {
+            "version": INDEX_VERSION,
+            "roots": self.roots,
+            "entries": {
+                key: [e.path, e.size, e.mtime_ns, e.hash]
+                for key, e in sorted(self.entries.items())
+            },
+        }
+        with open(index_path, "w", encoding="utf-8") as fh:
+            json.dump(index, fh, indent=1)
+
+    @classmethod
+    def load(cls, index_path: str) -> "AssetManifest":
+        """Load a manifest written by :meth:`save`.
+
+        Paths are used as stored, so the index must be built from the
+        directory the game runs in (the project root).
+        """
+        with open(index_path, "r", encoding="utf-8") as fh:
+            index = json.load(fh)
+        if index.get("version") != INDEX_VERSION:
+            raise ValueError(f"Unsupported asset manifest version in {index_path}")
+        entries = {
+            os.path.normpath(key): ManifestEntry(
+                os.path.normpath(path), size, mtime, digest
+            )
+            for key, (path, size, mtime, digest) in index["entries"].items()
+        }
+        return cls(index.get("roots", []), entries)
@@ -0,0 +1,211 @@
+"""Single-file asset archives read through ``mmap``.
+
+Layout: a fixed header (magic, format version, index length), a JSON index
+mapping asset names to ``[offset, size, sha1]`` and the file data, each
+blob aligned to :data:`ALIGNMENT` bytes. Offsets count from the first byte
+after the index, so the index can be written before the data.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import io
+import json
+import mmap
+import os
+import shutil
+import struct
+from dataclasses import dataclass
+from typing import Dict, Iterator, Mapping, Optional, Union
+
+from .asset_manifest import file_hash
+
+MAGIC = b"SGEPACK\0"
+FORMAT_VERSION = 1
+ALIGNMENT = 16
+HEADER = struct.Struct("<8sII")
+
+
+@dataclass(frozen=True)
+class PackEntry:
+    """Where one file lives in the pack data section."""
+
+    offset: int
+    size: int
+    hash: str
+
+
+def _padding(position: int) -> int:
+    return -position % ALIGNMENT
+
+
+class PackFile(io.RawIOBase):
+    """Seekable, read-only file object over a ``memoryview`` slice.
+
+    Decoders that take file objects (``pygame.image.load``,
+    ``pygame.mixer.Sound(file=...)``, ``pygame.mixer.music.load``) read
+    from the mapping directly instead of from a ``BytesIO`` copy.
+    """
+
+    def __init__(self, data: memoryview) -> None:
+        super().__init__()
+        self._data = data
+        self._pos = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        chunk = self._data[self._pos : self._pos + len(buffer)]
+        size = len(chunk)
+        buffer[:size] = chunk
+        self._pos += size
+        return size
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_CUR:
+            offset += self._pos
+        elif whence == io.SEEK_END:
+            offset += len(self._data)
+        if offset < 0:
+            raise ValueError("negative seek position")
+        self._pos = offset
+        return self._pos
+
+    def tell(self) -> int:
+        return self._pos
+
+
+class AssetPack:
+    """Read-only view of a pack file written by :func:`write_pack`.
+
+    The file is mapped once; :meth:`view` returns ``memoryview`` slices of
+    the mapping, so reading an asset costs no ``open``/``stat`` call and no
+    copy until the decoder consumes it.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._file = open(path, "rb")
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # empty file
+            self._file.close()
+            raise ValueError(f"Not an asset pack: {path}") from None
+        try:
+            self.entries = self._read_index()
+        except Exception:
+            self.close()
+            raise
+        self._view = memoryview(self._map)
+
+    def _read_index(self) -> Dict[str, PackEntry]:
+        if len(self._map) < HEADER.size:
+            raise ValueError(f"Not an asset pack: {self.path}")
+        magic, version, index_size = HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC:
+            raise ValueError(f"Not an asset pack: {self.path}")
+        if version != FORMAT_VERSION:
+            raise ValueError(f"Unsupported asset pack version {version} in {self.path}")
+        index_end = HEADER.size + index_size
+        index = json.loads(self._map[HEADER.size : index_end].decode("utf-8"))
+        self.data_start = index_end + _padding(index_end)
+        return {
+            os.path.normpath(name): PackEntry(offset, size, digest)
+            for name, (offset, size, digest) in index.items()
+        }
+
+    def __enter__(self) -> "AssetPack":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def __contains__(self, name: str) -> bool:
+        return os.path.normpath(name) in self.entries
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def names(self) -> Iterator[str]:
+        return iter(self.entries)
+
+    def view(self, name: str) -> Optional[memoryview]:
+        """Return a zero-copy slice of the mapped data for ``name``."""
+        entry = self.entries.get(os.path.normpath(name))
+        if entry is None:
+            return None
+        start = self.data_start + entry.offset
+        return self._view[start : start + entry.size]
+
+    def open(self, name: str) -> Optional[PackFile]:
+        data = self.view(name)
+        return PackFile(data) if data is not None else None
+
+    def read(self, name: str) -> Optional[bytes]:
+        data = self.view(name)
+        return bytes(data) if data is not None else None
+
+    def verify(self, name: str) -> bool:
+        """Return ``True`` when the stored bytes of ``name`` match their hash."""
+        entry = self.entries.get(os.path.normpath(name))
+        data = self.view(name)
+        return entry is not None and hashlib.sha1(data).hexdigest() == entry.hash
+
+    def close(self) -> None:
+        """Unmap the file.
+
+        Fails with ``BufferError`` while slices from :meth:`view` are alive;
+        the mapping is then released when they are garbage collected.
+        """
+        view = getattr(self, "_view", None)
+        if view is not None:
+            view.release()
+            self._view = None
+        self._map.close()
+        self._file.close()
+
+
+def write_pack(
+    files: Mapping[str, Union[str, bytes]], out: str
+) -> Dict[str, PackEntry]:
+    """Write ``files`` (name -> source path or bytes) as a pack at ``out``.
+
+    Source files are hashed first and then streamed into the pack, so
+    large asset folders are never held in memory at once.
+    """
+    entries: Dict[str, PackEntry] = {}
+    sources = {}
+    offset = 0
+    for name in sorted(files):
+        source = files[name]
+        if isinstance(source, (bytes, bytearray)):
+            size, digest = len(source), hashlib.sha1(source).hexdigest()
+        else:
+            size, digest = os.path.getsize(source), file_hash(source)
+        key = os.path.normpath(name).replace(os.sep, "/")
+        entries[key] = PackEntry(offset, size, digest)
+        sources[key] = source
+        offset += size + _padding(size)
+
+    index = json.dumps(
+        {key: [e.offset, e.size, e.hash] for key, e in entries.items()},
+        separators=(",", ":"),
+    ).encode("utf-8")
+    folder = os.path.dirname(os.path.abspath(out))
+    os.makedirs(folder, exist_ok=True)
+    with open(out, "wb") as fh:
+        fh.write(HEADER.pack(MAGIC, FORMAT_VERSION, len(index)))
+        fh.write(index)
+        fh.write(b"\0" * _padding(HEADER.size + len(index)))
+        for key, source in sources.items():
+            if isinstance(source, (bytes, bytearray)):
+                fh.write(source)
+            else:
+                with open(source, "rb") as src:
+                    shutil.copyfileobj(src, fh)
+            fh.write(b"\0" * _padding(entries[key].size))
+    return entries
@@ -0,0 +1,158 @@
+"""Background decoding of assets with main-thread finalisation."""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Hashable, List, Optional
+
+
+class AssetHandle:
+    """Future-like handle returned by :meth:`AssetManager.request_image`.
+
+    ``get()`` returns the finished asset, or the ``placeholder`` (the magenta
+    stand-in for images) while it is still decoding. Callbacks added with
+    :meth:`add_done_callback` run on the main thread when the asset lands.
+    """
+
+    def __init__(
+        self,
+        key: Hashable,
+        future: Optional[Future] = None,
+        placeholder: Any = None,
+    ) -> None:
+        self.key = key
+        self.future = future
+        self.placeholder = placeholder
+        self.value: Any = None
+        self.error: Optional[BaseException] = None
+        self.ready = future is None
+        self._callbacks: List[Callable[["AssetHandle"], None]] = []
+
+    @classmethod
+    def completed(cls, key: Hashable, value: Any) -> "AssetHandle":
+        handle = cls(key)
+        handle.value = value
+        return handle
+
+    @property
+    def decoded(self) -> bool:
+        """``True`` once the worker finished, even if not finalised yet."""
+        return self.ready or (self.future is not None and self.future.done())
+
+    def get(self, default: Any = None) -> Any:
+        if self.ready:
+            return self.value
+        return self.placeholder if self.placeholder is not None else default
+
+    def add_done_callback(self, callback: Callable[["AssetHandle"], None]) -> None:
+        if self.ready:
+            callback(self)
+        else:
+            self._callbacks.append(callback)
+
+    def _finish(self, value: Any, error: Optional[BaseException] = None) -> None:
+        self.value = value
+        self.error = error
+        self.ready = True
+        callbacks, self._callbacks = self._callbacks, []
+        for callback in callbacks:
+            callback(self)
+
+
+class AssetDecoder:
+    """Run decode jobs on a small thread pool and finish them in request order.
+
+    Workers only do file reads and decoding. :meth:`finish_ready` runs on
+    the main thread once per frame and hands finished jobs to ``finalize``
+    (display conversion, caching) until ``budget_ms`` is used up, so a burst
+    of requests is spread over several frames instead of causing a hitch.
+    """
+
+    def __init__(self, workers: int = 2) -> None:
+        self.workers = max(1, int(workers))
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._pending: "OrderedDict[Hashable, AssetHandle]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.finished = 0
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def get(self, key: Hashable) -> Optional[AssetHandle]:
+        with self._lock:
+            return self._pending.get(key)
+
+    def submit(
+        self,
+        key: Hashable,
+        job: Callable[..., Any],
+        *args: Any,
+        placeholder: Any = None,
+    ) -> AssetHandle:
+        """Queue ``job(*args)``; a pending request for ``key`` is reused."""
+        with self._lock:
+            handle = self._pending.get(key)
+            if handle is not None:
+                return handle
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.workers, thread_name_prefix="asset-decode"
+                )
+            handle = AssetHandle(key, self._executor.submit(job, *args), placeholder)
+            self._pending[key] = handle
+            return handle
+
+    def finish(
+        self, handle: AssetHandle, finalize: Callable[[AssetHandle, Any], Any]
+    ) -> Any:
+        """Wait for ``handle`` and finalise it now (synchronous loads).
+
+        The handle is claimed under the lock, so when two callers race only
+        the first finalises it; the other gets :meth:`AssetHandle.get`.
+        """
+        with self._lock:
+            if handle.ready or self._pending.get(handle.key) is not handle:
+                return handle.get()
+            del self._pending[handle.key]
+        try:
+            raw = handle.future.result()
+        except Exception as exc:
+            handle._finish(finalize(handle, exc), exc)
+        else:
+            handle._finish(finalize(handle, raw))
+        self.finished += 1
+        return handle.value
+
+    def finish_ready(
+        self,
+        finalize: Callable[[AssetHandle, Any], Any],
+        budget_ms: float = 2.0,
+        max_items: Optional[int] = None,
+    ) -> int:
+        """Finalise decoded jobs until ``budget_ms`` or ``max_items`` is reached.
+
+        ``finalize(handle, result)`` receives the decoded object, or the
+        exception the job raised. At least one job is finished per call.
+        """
+        deadline = time.perf_counter() + budget_ms / 1000.0
+        with self._lock:
+            ready = [h for h in self._pending.values() if h.future.done()]
+        count = 0
+        for handle in ready:
+            if count and (
+                time.perf_counter() >= deadline
+                or (max_items is not None and count >= max_items)
+            ):
+                break
+            self.finish(handle, finalize)
+            count += 1
+        return count
+
+    def shutdown(self, wait: bool = False) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait)
@@ -0,0 +1,218 @@
+"""Parallel bulk loading of game content at startup."""
+
+from __future__ import annotations
+
+import logging
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+
+from .yaml_loader import load_yaml
+
+if TYPE_CHECKING:  # pragma: no cover - only for type hints
+    from .dialogue_engine import DialogueEngine
+    from .inventory_system import InventorySystem
+    from .locale_manager import LocaleManager
+    from .puzzle_engine import PuzzleEngine
+
+logger = logging.getLogger(__name__)
+
+# first path component below the content root -> content kind
+CONTENT_FOLDERS: Dict[str, str] = {
+    "items": "items",
+    "recipes": "recipes",
+    "dialogues": "dialogues",
+    "puzzles": "puzzles",
+}
+# single files directly in the content root -> content kind
+CONTENT_FILES: Dict[str, str] = {
+    "dialogues.yaml": "dialogues",
+    "puzzles.yaml": "puzzles",
+}
+
+
+@dataclass
+class ContentFile:
+    """A content file found during discovery."""
+
+    kind: str
+    path: str
+
+
+@dataclass
+class FileTiming:
+    """Parse time for a single content file."""
+
+    path: str
+    kind: str
+    seconds: float
+
+
+@dataclass
+class ContentReport:
+    """Summary of a bulk content load."""
+
+    timings: List[FileTiming] = field(default_factory=list)
+    errors: Dict[str, str] = field(default_factory=dict)
+    counts: Dict[str, int] = field(default_factory=dict)
+    discover_seconds: float = 0.0
+    total_seconds: float = 0.0
+    parallel: bool = False
+
+    def slowest(self, count: int = 5) -> List[FileTiming]:
+        return sorted(self.timings, key=lambda t: t.seconds, reverse=True)[:count]
+
+    def summary(self) -> str:
+        parse_total = sum(t.seconds for t in self.timings)
+        mode = "process pool" if self.parallel else "serial"
+        lines = [
+            f"Loaded {len(self.timings)} files in {self.total_seconds * 1000:.1f} ms"
+            f" ({mode}, {parse_total * 1000:.1f} ms parse time)"
+        ]
+        for timing in self.slowest():
+            lines.append(
+                f"  {timing.seconds * 1000:7.2f} ms  {timing.kind:<9} {timing.path}"
+            )
+        for path, error in self.errors.items():
+            lines.append(f"  failed: {path}: {error}")
+        return "\n".join(lines)
+
+
+def _parse_content_file(path: str) -> Tuple[str, Any, float, Optional[str]]:
+    """Worker entry point: parse ``path`` and time it."""
+    start = time.perf_counter()
+    try:
+        data = load_yaml(path, use_cache=False) or {}
+        error = None
+    except Exception as exc:
+        data, error = None, str(exc)
+    return path, data, time.perf_counter() - start, error
+
+
+class ContentLoader:
+    """Discover items, recipes, locales, dialogues and puzzles and parse them.
+
+    Discovery is a single ``os.scandir`` walk over ``content_root`` plus the
+    locale folder. Parsing runs in a process pool once there are at least
+    ``min_parallel_files`` files (below that, pool start-up costs more than
+    it saves) and falls back to in-process parsing if the pool can't start.
+    """
+
+    def __init__(
+        self,
+        content_root: str = "game",
+        locales_dir: str = "locales",
+        max_workers: Optional[int] = None,
+        min_parallel_files: int = 16,
+    ) -> None:
+        self.content_root = content_root
+        self.locales_dir = locales_dir
+        self.max_workers = max_workers
+        self.min_parallel_files = min_parallel_files
+
+    # ------------------------------------------------------------------
+    # Discovery
+    # ------------------------------------------------------------------
+    def discover(self) -> List[ContentFile]:
+        """Return all known content files, sorted by path."""
+        found: List[ContentFile] = []
+        if os.path.isdir(self.content_root):
+            self._scan(self.content_root, None, found)
+        if os.path.isdir(self.locales_dir):
+            with os.scandir(self.locales_dir) as entries:
+                for entry in entries:
+                    if entry.is_file() and entry.name.endswith(".yaml"):
+                        found.append(ContentFile("locales", entry.path))
+        found.sort(key=lambda item: item.path)
+        return found
+
+    def _scan(self, folder: str, kind: Optional[str], found: List[ContentFile]) -> None:
+        with os.scandir(folder) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    sub_kind = kind or CONTENT_FOLDERS.get(entry.name)
+                    if sub_kind:
+                        self._scan(entry.path, sub_kind, found)
+                elif entry.name.endswith(".yaml"):
+                    file_kind = kind or CONTENT_FILES.get(entry.name)
+                    if file_kind:
+                        found.append(ContentFile(file_kind, entry.path))
+
+    # ------------------------------------------------------------------
+    # Parsing
+    # ------------------------------------------------------------------
+    def parse(self, files: List[ContentFile], report: ContentReport) -> Dict[str, Any]:
+        """Parse ``files`` and record timings in ``report``."""
+        paths = [item.path for item in files]
+        results = None
+        if len(paths) >= self.min_parallel_files:
+            try:
+                with ProcessPoolExecutor(max_workers=self.max_workers) as pool:
+                    results = list(pool.map(_parse_content_file, paths))
+                report.parallel = True
+            except (OSError, NotImplementedError, BrokenProcessPool) as exc:
+                logger.warning("Process pool unavailable, parsing serially: %s", exc)
+        if results is None:
+            results = [_parse_content_file(path) for path in paths]
+
+        kinds = {item.path: item.kind for item in files}
+        parsed: Dict[str, Any] = {}
+        for path, data, seconds, error in results:
+            report.timings.append(FileTiming(path, kinds[path], seconds))
+            if error:
+                report.errors[path] = error
+            else:
+                parsed[path] = data
+        return parsed
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+    def load(
+        self,
+        inventory: Optional["InventorySystem"] = None,
+        locales: Optional["LocaleManager"] = None,
+        dialogues: Optional["DialogueEngine"] = None,
+        puzzles: Optional["PuzzleEngine"] = None,
+    ) -> ContentReport:
+        """Load every content file into the given subsystems."""
+        report = ContentReport()
+        start = time.perf_counter()
+        files = self.discover()
+        report.discover_seconds = time.perf_counter() - start
+
+        wanted = {
+            "items": inventory,
+            "recipes": inventory,
+            "locales": locales,
+            "dialogues": dialogues,
+            "puzzles": puzzles,
+        }
+        files = [item for item in files if wanted.get(item.kind) is not None]
+        parsed = self.parse(files, report)
+
+        for item in files:
+            data = parsed.get(item.path)
+            if not isinstance(data, dict):
+                continue
+            if item.kind == "items":
+                inventory.register_item(data)
+            elif item.kind == "recipes":
+                inventory.register_recipe(data)
+            elif item.kind == "locales":
+                code = os.path.splitext(os.path.basename(item.path))[0]
+                locales.register_locale(code, data)
+            elif item.kind == "dialogues":
+                dialogues.load_data(data)
+            elif item.kind == "puzzles":
+                puzzles.load_data(data)
+            report.counts[item.kind] = report.counts.get(item.kind, 0) + 1
+        if locales is not None and os.path.isdir(self.locales_dir):
+            locales.locales_dir = self.locales_dir
+
+        report.total_seconds = time.perf_counter() - start
+        logger.debug(report.summary())
+        return report
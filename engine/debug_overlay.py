@@ -11,6 +11,11 @@ from .game_state import GameState
 from .scene_manager import SceneManager
 from .world_manager import WorldManager
 from .dialogue_engine import DialogueEngine
+from .ui_cache import PanelPool
+
+# panel widths are rounded up to this step so a changing FPS readout
+# keeps reusing the same background surface
+PANEL_WIDTH_STEP = 32
 
 
 class DebugOverlay:
@@ -31,6 +36,7 @@ class DebugOverlay:
         self.dialogue_engine = dialogue_engine
         self.visible: bool = False
         self.fps: float = 0.0
+        self.panels = PanelPool(max_entries=8)
         if pygame:
             self.font = pygame.font.Font(font_path, font_size)
             self.clock = pygame.time.Clock()
@@ -65,6 +71,13 @@ class DebugOverlay:
             info.append(f"World: {self.world_manager.world_id}")
             info.append(f"Region: {self.world_manager.current_region_id}")
         info.append(f"Scene: {self.scene_manager.current_scene_id}")
+        scene_cache = getattr(self.scene_manager, "scene_cache", None)
+        if scene_cache:
+            stats = scene_cache.stats()
+            info.append(
+                f"Scene cache: {stats['hits']} hit / {stats['disk_hits']} disk"
+                f" / {stats['misses']} miss"
+            )
         # Game state flags
         flags = [name for name, val in self.game_state.flags.items() if val]
         if flags:
@@ -93,15 +106,13 @@ class DebugOverlay:
         padding = 8
         line_height = self.font.get_height()
         width = max(self.font.size(line)[0] for line in lines) + padding * 2
+        width = -(-width // PANEL_WIDTH_STEP) * PANEL_WIDTH_STEP
         height = line_height * len(lines) + padding * 2
         rect = pygame.Rect(5, 5, width, height)
-        box = pygame.Surface((width, height), pygame.SRCALPHA)
-        box.fill((0, 0, 0, 180))
+        box = self.panels.get((width, height), (0, 0, 0, 180))
         surface.blit(box, rect.topleft)
         y = rect.top + padding
         for line in lines:
             text_surf = self.font.render(line, True, (255, 255, 255))
             surface.blit(text_surf, (rect.left + padding, y))
             y += line_height
-
-
@@ -5,17 +5,13 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Any
 
-try:  # pragma: no cover - optional dependency for runtime
-    import yaml  # type: ignore
-except Exception:  # pragma: no cover - fallback when PyYAML is missing
-    yaml = None
-
 try:  # pragma: no cover - allow running tests without pygame installed
     import pygame
 except Exception:  # pragma: no cover - allow running tests without pygame
     pygame = None
 
 from .game_state import GameState
+from .yaml_loader import load_yaml
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:  # pragma: no cover - only for type hints
@@ -72,10 +68,15 @@ class DialogueEngine:
         game_state: GameState,
         ui_overlay: Optional["UIOverlay"] = None,
         locale_manager: Optional["LocaleManager"] = None,
+        text_speed: float = 0.0,
     ) -> None:
         self.game_state = game_state
         self.ui_overlay = ui_overlay
         self.locale_manager = locale_manager
+        # characters revealed per second; 0 shows whole lines at once
+        self.text_speed = text_speed
+        self.visible_chars: float = 0.0
+        self._reveal_key: Optional[tuple] = None
 
         self.dialogues: Dict[str, Dialogue] = {}
         self.active_dialogue_id: Optional[str] = None
@@ -92,41 +93,45 @@ class DialogueEngine:
     def load_dialogue(self, dialogue_id: str, data: Dict) -> None:
         """Parse a single dialogue entry from a mapping."""
 
+        self.dialogues[dialogue_id] = self._parse_dialogue(dialogue_id, data)
+
+    def _parse_dialogue(self, dialogue_id: str, data: Dict) -> Dialogue:
         lines: List[DialogueLine] = []
         for item in data.get("lines", []) or []:
             lines.append(self._parse_line(item))
 
-        dialogue = Dialogue(
+        return Dialogue(
             id=dialogue_id,
             lines=lines,
             memory_flag=data.get("memory_flag"),
             on_complete=data.get("on_complete", {}) or {},
         )
-        self.dialogues[dialogue_id] = dialogue
 
     def load_file(self, path: str) -> None:
         """Load one or many dialogues from a YAML or JSON file."""
 
-        with open(path, "r", encoding="utf-8") as fh:
-            if yaml:
-                data = yaml.safe_load(fh) or {}
-            else:  # pragma: no cover - fallback when PyYAML missing
-                import json
+        self.load_data(load_yaml(path) or {})
 
-                data = json.load(fh)
+    def load_data(self, data: Dict) -> None:
+        """Register every dialogue in an already parsed dialogue file."""
+        self.dialogues.update(self.parse_data(data))
 
+    def parse_data(self, data: Dict) -> Dict[str, Dialogue]:
+        """Return the dialogues in parsed file ``data`` without registering them."""
         entries = []
         if "dialogues" in data:
             entries = data.get("dialogues", []) or []
         elif "dialogue" in data:
             entries = [data.get("dialogue", {})]
 
+        parsed: Dict[str, Dialogue] = {}
         for entry in entries:
             if not isinstance(entry, dict):
                 continue
             dialogue_id = entry.get("id")
             if dialogue_id:
-                self.load_dialogue(dialogue_id, entry)
+                parsed[dialogue_id] = self._parse_dialogue(dialogue_id, entry)
+        return parsed
 
     def _parse_line(self, item: Dict) -> DialogueLine:
         options: List[DialogueOption] = []
@@ -223,7 +228,9 @@ class DialogueEngine:
             return str(value) != right
         return value is not None
 
-    def _set_memory(self, data: Dict[str, Any], dialogue_id: Optional[str] = None) -> None:
+    def _set_memory(
+        self, data: Dict[str, Any], dialogue_id: Optional[str] = None
+    ) -> None:
         dlg_id = dialogue_id or (self.active_dialogue_id or "")
         store = self._memory_store.setdefault(dlg_id, {})
         store.update({k: str(v) for k, v in (data or {}).items()})
@@ -285,7 +292,9 @@ class DialogueEngine:
                 opt
                 for opt in node.options
                 if self.game_state.check_condition(opt.condition)
-                and (not opt.requires_flag or self.game_state.get_flag(opt.requires_flag))
+                and (
+                    not opt.requires_flag or self.game_state.get_flag(opt.requires_flag)
+                )
                 and self._check_memory(opt.requires_memory)
             ]
             self.awaiting_choice = True
@@ -316,7 +325,9 @@ class DialogueEngine:
                 opt
                 for opt in node.options
                 if self.game_state.check_condition(opt.condition)
-                and (not opt.requires_flag or self.game_state.get_flag(opt.requires_flag))
+                and (
+                    not opt.requires_flag or self.game_state.get_flag(opt.requires_flag)
+                )
                 and self._check_memory(opt.requires_memory)
             ]
             self.awaiting_choice = True
@@ -325,7 +336,11 @@ class DialogueEngine:
     def choose(self, option_index: int) -> Optional[DialogueLine]:
         """Resolve a choice from the current options."""
 
-        if not self.awaiting_choice or option_index < 0 or option_index >= len(self._option_cache):
+        if (
+            not self.awaiting_choice
+            or option_index < 0
+            or option_index >= len(self._option_cache)
+        ):
             return None
 
         choice = self._option_cache[option_index]
@@ -366,8 +381,31 @@ class DialogueEngine:
     # ------------------------------------------------------------------
     # Update/Render/Input
     # ------------------------------------------------------------------
-    def update(self) -> None:
-        """Placeholder for potential timed behaviour."""
+    def _sync_reveal(self) -> None:
+        key = (self.active_dialogue_id, self.current_line_index)
+        if key != self._reveal_key:
+            self._reveal_key = key
+            self.visible_chars = 0.0
+
+    def update(self, dt: float = 0.0) -> None:
+        """Advance the typewriter reveal of the current line by ``dt`` seconds."""
+        if not self.is_active() or self.text_speed <= 0:
+            return
+        self._sync_reveal()
+        self.visible_chars += dt * self.text_speed
+
+    def line_revealed(self) -> bool:
+        """Return True once the current line is fully shown."""
+        if self.text_speed <= 0:
+            return True
+        self._sync_reveal()
+        text = self.get_current_line() or ""
+        return self.visible_chars >= len(text)
+
+    def reveal_line(self) -> None:
+        """Show the rest of the current line immediately."""
+        self._sync_reveal()
+        self.visible_chars = float("inf")
 
     def render(self, surface: "pygame.Surface") -> None:  # pragma: no cover - UI only
         if not pygame or not self.ui_overlay or not self.is_active():
@@ -379,16 +417,25 @@ class DialogueEngine:
 
         text = self.resolve_localized_text(node.text or "")
         speaker = node.speaker
-        self.ui_overlay.draw_dialogue_box(text, speaker)
-
-        if self.awaiting_choice:
-            options_text = [self.resolve_localized_text(opt.text) for opt in self._option_cache]
+        reveal = None
+        if self.text_speed > 0:
+            self._sync_reveal()
+            if self.visible_chars < len(text):
+                reveal = int(self.visible_chars)
+        self.ui_overlay.draw_dialogue_box(text, speaker, reveal)
+
+        if self.awaiting_choice and reveal is None:
+            options_text = [
+                self.resolve_localized_text(opt.text) for opt in self._option_cache
+            ]
             self.ui_overlay.draw_options(options_text)
 
     # Backwards compatibility -------------------------------------------------
     draw = render
 
-    def handle_input(self, event: "pygame.event.Event") -> None:  # pragma: no cover - UI only
+    def handle_input(
+        self, event: "pygame.event.Event"
+    ) -> None:  # pragma: no cover - UI only
         if not pygame or not self.is_active():
             return
 
@@ -396,7 +443,10 @@ class DialogueEngine:
             if self.awaiting_choice and pygame.K_1 <= event.key <= pygame.K_9:
                 self.choose(event.key - pygame.K_1)
             elif event.key == pygame.K_SPACE:
-                self.advance()
+                if self.line_revealed():
+                    self.advance()
+                else:
+                    self.reveal_line()
 
     # ------------------------------------------------------------------
     # Convenience helpers
@@ -420,4 +470,3 @@ class DialogueEngine:
         if not node:
             return None
         return self.resolve_localized_text(node.text or "")
-
@@ -1,27 +1,71 @@
 from __future__ import annotations
 
-from typing import List
+from typing import TYPE_CHECKING, List, Optional, Tuple
 
 try:
     import pygame  # type: ignore
 except Exception:  # pragma: no cover - allow running tests without pygame
     pygame = None
 
+from .frame_scheduler import FrameScheduler
+from .renderer import Renderer
 from .scene_manager import SceneManager
+from .scene_transition import SceneTransition
 
+if TYPE_CHECKING:  # pragma: no cover - only for type hints
+    from .performance_manager import PerformanceManager
 
-class EngineLoop:
-    """Central game loop manager with scene stack support."""
 
-    def __init__(self, screen: "pygame.Surface", initial_scene_path: str, scene_manager: SceneManager, debug: bool = False) -> None:
+class EngineLoop:
+    """Central game loop manager with scene stack support.
+
+    With ``async_transitions`` enabled, scene changes made while the loop
+    is running are loaded off-thread through :class:`SceneTransition` and
+    the loop keeps rendering the previous scene until the new one is ready.
+    The :class:`Renderer` and :class:`FrameScheduler` come from
+    :meth:`SceneManager.create_renderer` and
+    :meth:`SceneManager.create_scheduler`, so frames are drawn (and clicks
+    mapped back) at the same logical size the scene's hotspots use.
+    ``dirty_rects``, ``scale_mode``, ``target_fps`` and
+    ``performance_manager`` override the scene manager's config when given.
+    """
+
+    def __init__(
+        self,
+        screen: "pygame.Surface",
+        initial_scene_path: str,
+        scene_manager: SceneManager,
+        debug: bool = False,
+        async_transitions: bool = True,
+        transition_overlay: bool = True,
+        dirty_rects: Optional[bool] = None,
+        logical_size: Optional[Tuple[int, int]] = None,
+        scale_mode: Optional[str] = None,
+        target_fps: Optional[int] = None,
+        performance_manager: Optional["PerformanceManager"] = None,
+    ) -> None:
         self.screen = screen
         self.initial_scene = initial_scene_path
         self.scene_manager = scene_manager
         self.scene_stack: List[str] = []
-        self.clock = pygame.time.Clock() if pygame else None
         self.running = False
         self.debug = debug
         self.fps_font = pygame.font.Font(None, 18) if debug and pygame else None
+        self.async_transitions = async_transitions
+        self.transition_overlay = transition_overlay
+        managed_size = scene_manager.logical_size
+        if logical_size and tuple(logical_size) != tuple(managed_size or ()):
+            raise ValueError(
+                f"logical_size {tuple(logical_size)} differs from the scene "
+                f"manager's {managed_size}; set window.logical_size instead"
+            )
+        self.renderer: Renderer = scene_manager.create_renderer(
+            dirty_rects=dirty_rects, scale_mode=scale_mode
+        )
+        self.scheduler: FrameScheduler = scene_manager.create_scheduler(
+            target_fps=target_fps, performance=performance_manager
+        )
+        self.clock = self.scheduler.clock
 
     # ------------------------------------------------------------------
     # Scene stack helpers
@@ -52,53 +96,71 @@ class EngineLoop:
     # ------------------------------------------------------------------
     # Main loop
     # ------------------------------------------------------------------
-    def run(self) -> None:  # pragma: no cover - UI loop
+    def run(
+        self, max_frames: Optional[int] = None
+    ) -> None:  # pragma: no cover - UI loop
+        """Run until stopped, or for ``max_frames`` frames when given."""
         if not pygame:
             return
         if not self.scene_stack:
             self.change_scene(self.initial_scene)
+        transition = None
+        if self.async_transitions:
+            transition = SceneTransition(
+                self.scene_manager, show_overlay=self.transition_overlay
+            )
+            self.scene_manager.transition = transition
         self.running = True
         while self.running:
+            if max_frames is not None and self.scheduler.frames >= max_frames:
+                break
+            timing = self.scheduler.tick()
+            if transition:
+                transition.poll()
+            if self.scene_manager.hot_reloader:
+                self.scene_manager.hot_reloader.poll()
+            self.scene_manager.assets.process_pending(
+                self.scene_manager.asset_budget_ms
+            )
+            loading = bool(transition and transition.loading)
+            prefetcher = self.scene_manager.prefetcher
+            if prefetcher:
+                prefetcher.process_releases()
             for event in pygame.event.get():
+                if prefetcher and event.type != pygame.ACTIVEEVENT:
+                    prefetcher.notify_activity()
                 if event.type == pygame.QUIT:
                     self.running = False
-                if self.scene_manager.dialogue_engine.active:
-                    self.scene_manager.dialogue_engine.handle_event(event)
+                if self.scene_manager.dialogue_engine.is_active():
+                    self.scene_manager.dialogue_engine.handle_input(event)
+                    continue
+                if loading:
                     continue
                 if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-                    for hs in self.scene_manager.hotspots:
-                        if not hs.is_active(self.scene_manager.game_state):
-                            continue
-                        if hs.check_click(event.pos):
-                            hs.trigger(self.scene_manager)
-
-            self.screen.fill((0, 0, 0))
+                    self.scene_manager.handle_click(self.renderer.to_logical(event.pos))
 
-            for overlay in self.scene_manager.overlays:
-                self.screen.blit(overlay, (0, 0))
+            for _ in range(timing.steps):
+                self.scene_manager.update(self.scheduler.step)
+            if not timing.render:
+                continue
 
-            self.scene_manager.timeline_engine.update(
-                pygame.time.get_ticks(), self.scene_manager.current_scene_id
+            renderer = self.renderer
+            renderer.begin_frame(
+                self.scene_manager.static_layers, self.scene_manager.current_scene_id
             )
+            target = renderer.target
 
-            if self.scene_manager.active_features.get("time_loop"):
-                duration = self.scene_manager.active_features.get("time_loop")
-                if isinstance(duration, bool):
-                    duration = 5000
-                try:
-                    duration = int(duration)
-                except (TypeError, ValueError):
-                    duration = 5000
-                if pygame.time.get_ticks() - self.scene_manager.scene_start_time >= duration:
-                    self.scene_manager.activate_scene(self.scene_manager.current_scene)
-
-            self.scene_manager.dialogue_engine.draw(self.screen)
+            self.scene_manager.dialogue_engine.draw(target)
+            if transition:
+                transition.draw_overlay(target)
 
             if self.debug and self.fps_font:
                 fps_text = f"{self.clock.get_fps():.1f} FPS" if self.clock else "0 FPS"
                 surf = self.fps_font.render(fps_text, True, (255, 0, 0))
-                self.screen.blit(surf, (5, 5))
+                target.blit(surf, (5, 5))
+
+            renderer.end_frame()
 
-            pygame.display.flip()
-            if self.clock:
-                self.clock.tick(60)
+        if transition:
+            transition.shutdown()
+            self.scene_manager.transition = None
@@ -0,0 +1,131 @@
+"""Fixed-timestep simulation with variable-rate rendering."""
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Callable, Optional
+
+try:
+    import pygame  # type: ignore
+except Exception:  # pragma: no cover - allow running tests without pygame
+    pygame = None
+
+if TYPE_CHECKING:  # pragma: no cover - only for type hints
+    from .performance_manager import PerformanceManager
+
+
+@dataclass
+class FrameTiming:
+    """What a frame should do, as decided by :meth:`FrameScheduler.tick`."""
+
+    dt: float
+    steps: int
+    alpha: float
+    render: bool
+
+
+class FrameScheduler:
+    """Run simulation updates at a fixed ``step`` and render once per frame.
+
+    Real elapsed time is accumulated and spent in whole ``step`` updates, so
+    timers and animations advance identically whether the game renders at
+    30 or 144 FPS. When a frame takes longer than ``load_skip_ratio`` times
+    the target frame time, rendering is skipped (at most ``max_frame_skip``
+    frames in a row) to let the simulation catch up; time beyond
+    ``max_steps`` updates per frame is dropped instead of piling up.
+
+    The frame rate cap comes from ``performance.target_fps`` when a
+    :class:`PerformanceManager` is given, so profile changes apply at once;
+    ``0`` runs uncapped.
+    """
+
+    def __init__(
+        self,
+        step: float = 1 / 60,
+        target_fps: int = 60,
+        max_steps: int = 5,
+        max_frame_skip: int = 2,
+        load_skip_ratio: float = 2.0,
+        performance: Optional["PerformanceManager"] = None,
+        clock: Optional["pygame.time.Clock"] = None,
+        time_source: Callable[[], float] = time.perf_counter,
+    ) -> None:
+        self.step = float(step)
+        self._target_fps = int(target_fps)
+        self.max_steps = max(1, int(max_steps))
+        self.max_frame_skip = max(0, int(max_frame_skip))
+        self.load_skip_ratio = load_skip_ratio
+        self.performance = performance
+        self.clock = clock
+        self.time_source = time_source
+        self.accumulator = 0.0
+        self.frames = 0
+        self.updates = 0
+        self.skipped_frames = 0
+        self.dropped_time = 0.0
+        self._skipped_in_row = 0
+        self._last: Optional[float] = None
+
+    @property
+    def target_fps(self) -> int:
+        if self.performance is not None:
+            return int(self.performance.target_fps)
+        return self._target_fps
+
+    @target_fps.setter
+    def target_fps(self, fps: int) -> None:
+        if self.performance is not None:
+            self.performance.set_target_fps(fps)
+        else:
+            self._target_fps = int(fps)
+
+    def tick(self) -> FrameTiming:
+        """Wait for the frame cap and return this frame's update plan."""
+        fps = self.target_fps
+        if self.clock is not None:
+            self.clock.tick(fps)
+        now = self.time_source()
+        dt = 0.0 if self._last is None else max(now - self._last, 0.0)
+        self._last = now
+        self.frames += 1
+
+        self.accumulator += dt
+        # the epsilon keeps float drift from losing a step on exact boundaries
+        steps = int((self.accumulator + 1e-9) // self.step)
+        if steps > self.max_steps:
+            dropped = (steps - self.max_steps) * self.step
+            self.accumulator -= dropped
+            self.dropped_time += dropped
+            steps = self.max_steps
+        self.accumulator = max(self.accumulator - steps * self.step, 0.0)
+        self.updates += steps
+
+        budget = 1.0 / fps if fps > 0 else self.step
+        render = True
+        if (
+            dt > budget * self.load_skip_ratio
+            and self._skipped_in_row < self.max_frame_skip
+        ):
+            render = False
+            self._skipped_in_row += 1
+            self.skipped_frames += 1
+        else:
+            self._skipped_in_row = 0
+        return FrameTiming(dt, steps, self.accumulator / self.step, render)
+
+    def run_frame(
+        self, update: Callable[[float], None], render: Callable[[float], None]
+    ) -> FrameTiming:
+        """Tick, call ``update(step)`` for each step and ``render(alpha)`` if due."""
+        timing = self.tick()
+        for _ in range(timing.steps):
+            update(self.step)
+        if timing.render:
+            render(timing.alpha)
+        return timing
+
+    def reset(self) -> None:
+        """Forget elapsed time, e.g. after a blocking load."""
+        self.accumulator = 0.0
+        self._last = None
@@ -15,15 +15,19 @@ class GameState:
     current_scene: str = ""
     clues: List[str] = field(default_factory=list)
     unlocked_scenes: List[str] = field(default_factory=list)
+    # bumped whenever ``flags`` change, so condition caches know to refresh
+    flags_revision: int = field(default=0, compare=False)
 
     def set_flag(self, name: str, value: bool = True) -> None:
         self.flags[name] = bool(value)
+        self.flags_revision += 1
 
     def get_flag(self, name: str) -> bool:
         return self.flags.get(name, False)
 
     def toggle_flag(self, name: str) -> None:
         self.flags[name] = not self.flags.get(name, False)
+        self.flags_revision += 1
 
     def set_var(self, key: str, value: Any) -> None:
         """Store an arbitrary value in ``variables``."""
@@ -67,6 +71,7 @@ class GameState:
     def clear(self) -> None:
         """Reset all tracked state to defaults."""
         self.flags.clear()
+        self.flags_revision += 1
         self.variables.clear()
         self.inventory.clear()
         self.current_scene = ""
@@ -118,6 +123,7 @@ class GameState:
         except (OSError, json.JSONDecodeError):
             return
         self.flags = data.get("flags", {})
+        self.flags_revision += 1
         self.variables = data.get("variables", {})
         self.inventory = data.get("inventory", [])
         self.current_scene = data.get("current_scene", "")
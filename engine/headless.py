@@ -0,0 +1,81 @@
+"""Window creation with optional headless (no display) modes.
+
+``window.headless`` in ``config.yaml`` selects how the screen is created:
+
+``false``
+    A normal window through ``pygame.display.set_mode``.
+``true`` / ``"dummy"``
+    SDL's dummy video driver: ``set_mode`` and ``display.flip`` work but
+    nothing is shown, so the full loop runs on machines without a display.
+``"offscreen"``
+    A plain ``pygame.Surface``; the display is never set and
+    :class:`Renderer` skips presenting, which measures drawing alone.
+
+Headless modes also select SDL's dummy audio driver so the mixer does not
+need a sound card.
+"""
+
+from __future__ import annotations
+
+import os
+from typing import Any, Dict, Optional, Tuple, Union
+
+try:
+    import pygame  # type: ignore
+except Exception:  # pragma: no cover - allow running tests without pygame
+    pygame = None
+
+HEADLESS_MODES = ("dummy", "offscreen")
+
+
+def headless_mode(value: Union[bool, str, None]) -> Optional[str]:
+    """Normalise ``window.headless`` to ``None`` or one of :data:`HEADLESS_MODES`."""
+    if value is None or value is False:
+        return None
+    if value is True:
+        return "dummy"
+    mode = str(value).strip().lower()
+    if mode in ("", "false", "no", "off", "0"):
+        return None
+    if mode in ("true", "yes", "on", "1"):
+        return "dummy"
+    if mode not in HEADLESS_MODES:
+        raise ValueError(f"Unknown headless mode: {value!r}")
+    return mode
+
+
+def use_dummy_drivers() -> None:
+    """Point SDL at its dummy video and audio drivers.
+
+    Must run before ``pygame.init()``/``pygame.display.init()`` to take
+    effect. An audio driver set explicitly in the environment is kept.
+    """
+    os.environ["SDL_VIDEODRIVER"] = "dummy"
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+
+def create_display(
+    size: Tuple[int, int],
+    title: str = "game-engine",
+    headless: Union[bool, str, None] = None,
+) -> "pygame.Surface":
+    """Initialise pygame and return the screen surface for ``headless`` mode."""
+    mode = headless_mode(headless)
+    if mode:
+        use_dummy_drivers()
+    pygame.init()
+    if mode == "offscreen":
+        return pygame.Surface(size)
+    screen = pygame.display.set_mode(size)
+    pygame.display.set_caption(title)
+    return screen
+
+
+def create_window(config: Dict[str, Any]) -> "pygame.Surface":
+    """Create the screen described by the ``window`` block of ``config``."""
+    window = config.get("window") or {}
+    return create_display(
+        (int(window.get("width", 800)), int(window.get("height", 600))),
+        window.get("title", "game-engine"),
+        window.get("headless", False),
+    )
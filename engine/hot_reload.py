@@ -0,0 +1,320 @@
+"""Hot reload of scenes, dialogues, locales and puzzles while the game runs."""
+
+from __future__ import annotations
+
+import logging
+import os
+import time
+from dataclasses import dataclass, field, fields
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
+
+from .hotspot import Hotspot
+from .yaml_loader import clear_cache, load_yaml
+
+if TYPE_CHECKING:  # pragma: no cover - only for type hints
+    from .content_loader import ContentReport
+    from .dialogue_engine import DialogueEngine
+    from .locale_manager import LocaleManager
+    from .puzzle_engine import PuzzleEngine
+    from .scene_manager import SceneManager
+
+logger = logging.getLogger(__name__)
+
+Stamp = Tuple[int, int]
+
+
+@dataclass
+class ReloadDiff:
+    """Keys added, changed and removed by a reload."""
+
+    added: List[str] = field(default_factory=list)
+    changed: List[str] = field(default_factory=list)
+    removed: List[str] = field(default_factory=list)
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.changed or self.removed)
+
+    def __str__(self) -> str:
+        return f"+{len(self.added)} ~{len(self.changed)} -{len(self.removed)}"
+
+
+# ----------------------------------------------------------------------
+# Structural diff helpers
+# ----------------------------------------------------------------------
+def patch_mapping(
+    live: Dict[str, Any], new: Dict[str, Any], owned: Iterable[str] = ()
+) -> ReloadDiff:
+    """Update ``live`` in place to match ``new``.
+
+    Keys in ``owned`` that are missing from ``new`` are deleted; other keys
+    of ``live`` are left alone because they came from other files.
+    """
+    diff = ReloadDiff()
+    for key, value in new.items():
+        if key not in live:
+            diff.added.append(key)
+            live[key] = value
+        elif live[key] != value:
+            diff.changed.append(key)
+            live[key] = value
+    for key in owned:
+        if key not in new and key in live:
+            diff.removed.append(key)
+            del live[key]
+    return diff
+
+
+def patch_hotspots(live: List[Hotspot], new: List[Hotspot]) -> ReloadDiff:
+    """Update the ``live`` hotspot list in place to match ``new``.
+
+    Hotspots are matched by id. Unchanged hotspots keep their identity and
+    changed ones are updated field by field, so anything holding on to a
+    hotspot object keeps working. Their cached rect and mask bits are
+    dropped; the scene's hotspot index re-attaches masks on rebuild.
+    """
+    diff = ReloadDiff()
+    by_id = {hs.id: hs for hs in live}
+    result: List[Hotspot] = []
+    for hs in new:
+        current = by_id.pop(hs.id, None)
+        if current is None:
+            diff.added.append(hs.id)
+            result.append(hs)
+            continue
+        if current != hs:
+            diff.changed.append(hs.id)
+            for f in fields(hs):
+                if f.init:
+                    setattr(current, f.name, getattr(hs, f.name))
+            current._rect_cache = None
+            current._mask_bits = None
+        result.append(current)
+    diff.removed.extend(by_id)
+    live[:] = result
+    return diff
+
+
+@dataclass
+class _Watch:
+    callback: Callable[[str], None]
+    stamp: Optional[Stamp]
+
+
+class HotReloader:
+    """Poll watched files and apply incremental reloads when they change.
+
+    Polling uses ``os.stat``/``os.scandir`` only, so it works everywhere
+    without extra dependencies. Call :meth:`poll` once per frame; it does
+    nothing until ``interval`` seconds have passed since the last check.
+    Errors raised by a reload (for example a half-saved YAML file) are
+    logged and the previous state is kept.
+    """
+
+    def __init__(self, interval: float = 0.5) -> None:
+        self.interval = float(interval)
+        self._files: Dict[str, _Watch] = {}
+        self._dirs: Dict[str, Tuple[str, Callable[[str], None]]] = {}
+        self._last_poll = 0.0
+
+    # ------------------------------------------------------------------
+    # Watching
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _stamp(path: str) -> Optional[Stamp]:
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        return st.st_mtime_ns, st.st_size
+
+    def watch_file(self, path: str, callback: Callable[[str], None]) -> None:
+        """Call ``callback(path)`` whenever ``path`` changes."""
+        key = os.path.abspath(path)
+        self._files[key] = _Watch(callback, self._stamp(key))
+
+    def watch_directory(
+        self, path: str, callback: Callable[[str], None], suffix: str = ".yaml"
+    ) -> None:
+        """Watch every ``suffix`` file in ``path``, including new ones."""
+        folder = os.path.abspath(path)
+        self._dirs[folder] = (suffix, callback)
+        for name in self._list_dir(folder, suffix):
+            self.watch_file(os.path.join(folder, name), callback)
+
+    @staticmethod
+    def _list_dir(folder: str, suffix: str) -> List[str]:
+        try:
+            with os.scandir(folder) as entries:
+                return [
+                    e.name for e in entries if e.is_file() and e.name.endswith(suffix)
+                ]
+        except OSError:
+            return []
+
+    # ------------------------------------------------------------------
+    # Polling
+    # ------------------------------------------------------------------
+    def poll(self, force: bool = False) -> List[str]:
+        """Reload changed files and return their paths."""
+        now = time.monotonic()
+        if not force and now - self._last_poll < self.interval:
+            return []
+        self._last_poll = now
+
+        for folder, (suffix, callback) in self._dirs.items():
+            for name in self._list_dir(folder, suffix):
+                path = os.path.join(folder, name)
+                if path not in self._files:
+                    self._files[path] = _Watch(callback, None)
+
+        changed: List[str] = []
+        for path, watch in self._files.items():
+            stamp = self._stamp(path)
+            if stamp == watch.stamp or stamp is None:
+                continue
+            watch.stamp = stamp
+            # drop the old parse now; the callback re-reads the file
+            clear_cache(path)
+            start = time.perf_counter()
+            try:
+                watch.callback(path)
+            except Exception as exc:
+                logger.error("Hot reload of '%s' failed: %s", path, exc)
+                continue
+            logger.info(
+                "Reloaded %s in %.1f ms", path, (time.perf_counter() - start) * 1000
+            )
+            changed.append(path)
+        return changed
+
+    # ------------------------------------------------------------------
+    # Subsystem bindings
+    # ------------------------------------------------------------------
+    def watch_scenes(self, scene_manager: "SceneManager") -> None:
+        """Reload scene files from ``scene_manager.scenes_dir``."""
+        self.watch_directory(
+            scene_manager.scenes_dir, lambda path: reload_scene(scene_manager, path)
+        )
+
+    def watch_dialogues(self, engine: "DialogueEngine", path: str) -> None:
+        """Reload the dialogues defined in ``path``."""
+        owned: Set[str] = set(engine.parse_data(load_yaml(path) or {}))
+
+        def reload(changed: str) -> None:
+            new = engine.parse_data(load_yaml(changed) or {})
+            diff = patch_mapping(engine.dialogues, new, owned)
+            owned.clear()
+            owned.update(new)
+            dialogue = engine.dialogues.get(engine.active_dialogue_id or "")
+            if engine.active_dialogue_id and dialogue is None:
+                engine.active_dialogue_id = None
+            elif dialogue and engine.current_line_index >= len(dialogue.lines):
+                engine.current_line_index = max(len(dialogue.lines) - 1, 0)
+            logger.debug("Dialogues %s: %s", changed, diff)
+
+        self.watch_file(path, reload)
+
+    def watch_locales(
+        self, manager: "LocaleManager", path: Optional[str] = None
+    ) -> None:
+        """Reload locale files from ``path`` (defaults to ``locales_dir``)."""
+
+        def reload(changed: str) -> None:
+            code = manager.merge_file(changed)
+            logger.debug("Locale %s: %d strings", code, len(manager.translations[code]))
+
+        self.watch_directory(path or manager.locales_dir, reload)
+
+    def watch_puzzles(self, engine: "PuzzleEngine", path: str) -> None:
+        """Reload the puzzles defined in ``path``, keeping solved state."""
+        owned: Set[str] = {meta.id for meta in engine.parse_data(load_yaml(path) or {})}
+
+        def reload(changed: str) -> None:
+            new = {}
+            for meta in engine.parse_data(load_yaml(changed) or {}):
+                current = engine.registry.get(meta.id)
+                if current is not None:
+                    meta.solved = current.solved
+                new[meta.id] = meta
+            diff = patch_mapping(engine.registry, new, owned)
+            owned.clear()
+            owned.update(new)
+            logger.debug("Puzzles %s: %s", changed, diff)
+
+        self.watch_file(path, reload)
+
+    def watch_content(
+        self,
+        report: "ContentReport",
+        dialogues: Optional["DialogueEngine"] = None,
+        locales: Optional["LocaleManager"] = None,
+        puzzles: Optional["PuzzleEngine"] = None,
+    ) -> None:
+        """Watch the dialogue, locale and puzzle files a content load parsed.
+
+        Files that failed to parse in ``report`` are skipped.
+        """
+        locale_dirs: Set[str] = set()
+        for timing in report.timings:
+            if timing.path in report.errors:
+                continue
+            if timing.kind == "dialogues" and dialogues is not None:
+                self.watch_dialogues(dialogues, timing.path)
+            elif timing.kind == "puzzles" and puzzles is not None:
+                self.watch_puzzles(puzzles, timing.path)
+            elif timing.kind == "locales" and locales is not None:
+                locale_dirs.add(os.path.dirname(timing.path))
+        for folder in sorted(locale_dirs):
+            self.watch_locales(locales, folder)
+
+
+def reload_scene(scene_manager: "SceneManager", path: str) -> ReloadDiff:
+    """Apply changes in scene file ``path`` to the live scene.
+
+    If only hotspots changed they are patched in place. Changes to
+    overlays, features or events re-activate the scene; game state is
+    never touched. Scenes other than the current one are simply picked up
+    by :class:`SceneCache` on their next load.
+    """
+    current_path, _ = scene_manager.resolve_scene_path(
+        scene_manager.current_scene_id or ""
+    )
+    prefetcher = getattr(scene_manager, "prefetcher", None)
+    scene_id = os.path.splitext(os.path.basename(path))[0]
+    if prefetcher:
+        prefetcher.forget(scene_id)
+    if os.path.abspath(current_path) != os.path.abspath(path):
+        return ReloadDiff()
+
+    old = scene_manager.current_scene
+    new = scene_manager.load_scene(path)
+    if old is None or new is old:
+        return ReloadDiff()
+    same_layout = (
+        old.background == new.background
+        and old.overlays == new.overlays
+        and old.features == new.features
+        and old.events == new.events
+        and old.mode == new.mode
+    )
+    if same_layout:
+        diff = patch_hotspots(scene_manager.hotspots, new.hotspots)
+        refresh = getattr(scene_manager, "refresh_hotspot_index", None)
+        if refresh:
+            refresh()
+    else:
+        diff = ReloadDiff(changed=[scene_id])
+        scene_manager.current_scene = new
+        scene_manager.activate_scene(new)
+    logger.debug("Scene %s: %s", scene_id, diff)
+    return diff
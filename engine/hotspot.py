@@ -1,26 +1,61 @@
-from dataclasses import dataclass
-from typing import Tuple, Optional
+from dataclasses import dataclass, field
+from typing import Any, Tuple, Optional
 
 from .game_state import GameState
+from .hotspot_shapes import mask_contains, point_in_polygon, polygon_bounds
 import pygame
 
+
 @dataclass
 class Hotspot:
-    """Interactive region that triggers an action when clicked."""
+    """Interactive region that triggers an action when clicked.
+
+    ``area`` is the bounding box. A hotspot may additionally be shaped by a
+    ``polygon`` (screen points) or an alpha ``mask`` image placed at the
+    top-left of ``area``; the mask bits are attached by the scene's hotspot
+    index (see :class:`~engine.hotspot_index.ShapedHotspotIndex`).
+    """
 
     id: str
     area: Tuple[int, int, int, int]
     action: str
     target: Optional[str] = None
     condition: Optional[str] = None
+    polygon: Optional[Tuple[Tuple[int, int], ...]] = None
+    mask: Optional[str] = None
+    _rect_cache: Optional[Tuple[Any, "pygame.Rect"]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _mask_bits: Any = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        if self.polygon and not any(self.area[2:]):
+            self.area = polygon_bounds(self.polygon)
+
+    @property
+    def shaped(self) -> bool:
+        return bool(self.polygon or self.mask)
 
     def rect(self) -> pygame.Rect:
-        """Return the pygame.Rect representing this hotspot's area."""
-        return pygame.Rect(self.area)
+        """Return the pygame.Rect representing this hotspot's area.
+
+        The rect is cached until ``area`` changes; treat it as read-only.
+        """
+        cached = self._rect_cache
+        if cached is None or cached[0] != self.area:
+            cached = (self.area, pygame.Rect(self.area))
+            self._rect_cache = cached
+        return cached[1]
 
     def check_click(self, pos: Tuple[int, int]) -> bool:
         """Return True if the given position is inside the hotspot."""
-        return self.rect().collidepoint(pos)
+        if not self.rect().collidepoint(pos):
+            return False
+        if self.polygon:
+            return point_in_polygon(pos[0] + 0.5, pos[1] + 0.5, self.polygon)
+        if self.mask and self._mask_bits is not None:
+            return mask_contains(self._mask_bits, self.area, pos)
+        return True
 
     def trigger(self, manager: "SceneManager") -> None:
         """Execute the hotspot's action using the provided scene manager."""
@@ -37,4 +72,3 @@ class Hotspot:
     def is_active(self, state: GameState) -> bool:
         """Return ``True`` if this hotspot's condition is met."""
         return state.check_condition(self.condition)
-
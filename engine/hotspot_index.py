@@ -0,0 +1,268 @@
+"""Spatial indexes for fast hotspot hit-testing."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Dict, List, Optional, Sequence, Tuple, Union
+
+try:
+    import numpy as np
+except Exception:  # pragma: no cover - numpy is optional
+    np = None
+
+from .hotspot import Hotspot
+from .hotspot_shapes import HotspotIdBuffer, MaskLoader
+
+if TYPE_CHECKING:  # pragma: no cover - only for type hints
+    from .game_state import GameState
+
+Cell = Tuple[int, int]
+
+# ``auto`` switches to the numpy backend at this many hotspots
+NUMPY_MIN_HOTSPOTS = 256
+
+
+class HotspotGrid:
+    """Uniform grid over hotspot areas for sub-linear point queries.
+
+    Each hotspot is registered in every ``cell_size`` square its area
+    touches. A query only tests the hotspots of one cell, and returns them
+    in declaration order so click handling matches a linear scan. The grid
+    keeps a reference to ``hotspots``; call :meth:`rebuild` after that list
+    or any hotspot ``area`` changes.
+    """
+
+    def __init__(self, hotspots: List[Hotspot], cell_size: int = 64) -> None:
+        self.hotspots = hotspots
+        self.cell_size = max(1, int(cell_size))
+        self.cells: Dict[Cell, List[int]] = {}
+        self.rebuild()
+
+    def rebuild(self) -> None:
+        """Re-register every hotspot in the grid."""
+        size = self.cell_size
+        cells: Dict[Cell, List[int]] = {}
+        for idx, hs in enumerate(self.hotspots):
+            x, y, w, h = hs.area
+            if w <= 0 or h <= 0:
+                continue
+            for cx in range(x // size, (x + w - 1) // size + 1):
+                for cy in range(y // size, (y + h - 1) // size + 1):
+                    cells.setdefault((cx, cy), []).append(idx)
+        self.cells = cells
+
+    def candidates(self, pos: Sequence[int]) -> List[Hotspot]:
+        """Return hotspots whose grid cell contains ``pos``."""
+        indices = self.cells.get(
+            (int(pos[0]) // self.cell_size, int(pos[1]) // self.cell_size)
+        )
+        if not indices:
+            return []
+        return [self.hotspots[idx] for idx in indices]
+
+    def query(self, pos: Sequence[int]) -> List[Hotspot]:
+        """Return hotspots whose area contains ``pos``, in declaration order."""
+        return [hs for hs in self.candidates(pos) if hs.check_click(pos)]
+
+    def __len__(self) -> int:
+        return len(self.hotspots)
+
+
+class HotspotArrayIndex:
+    """Vectorised hit-testing over hotspot areas packed into numpy arrays.
+
+    Areas live in an ``(N, 4)`` int array next to an ``active`` mask, so a
+    point query is one vectorised comparison instead of ``N`` Python calls.
+    Meant for generated scenes with thousands of hotspots; requires numpy.
+    Like :class:`HotspotGrid`, call :meth:`rebuild` after edits.
+    """
+
+    def __init__(self, hotspots: List[Hotspot]) -> None:
+        if np is None:
+            raise RuntimeError("HotspotArrayIndex requires numpy")
+        self.hotspots = hotspots
+        self.rebuild()
+
+    def rebuild(self) -> None:
+        """Repack hotspot areas and reset the active mask."""
+        areas = np.array([hs.area for hs in self.hotspots], dtype=np.int64).reshape(
+            -1, 4
+        )
+        self.x0 = areas[:, 0]
+        self.y0 = areas[:, 1]
+        self.x1 = areas[:, 0] + areas[:, 2]
+        self.y1 = areas[:, 1] + areas[:, 3]
+        # zero or negative sized areas never collide, matching pygame.Rect
+        self.valid = (areas[:, 2] > 0) & (areas[:, 3] > 0)
+        self.active = np.ones(len(self.hotspots), dtype=bool)
+        self._conditional = [
+            idx for idx, hs in enumerate(self.hotspots) if hs.condition
+        ]
+        self._synced: Optional[Tuple[int, int]] = None
+
+    def update_active(self, state: "GameState") -> None:
+        """Refresh :attr:`active` from hotspot conditions in ``state``."""
+        for idx in self._conditional:
+            self.active[idx] = self.hotspots[idx].is_active(state)
+        self._synced = (id(state), state.flags_revision)
+
+    def sync_active(self, state: "GameState") -> None:
+        """Call :meth:`update_active` only if ``state``'s flags changed since."""
+        if self._synced != (id(state), state.flags_revision):
+            self.update_active(state)
+
+    def _mask(self, x, y, active_only: bool):
+        mask = (
+            (self.x0 <= x) & (x < self.x1) & (self.y0 <= y) & (y < self.y1) & self.valid
+        )
+        if active_only:
+            mask &= self.active
+        return mask
+
+    def candidates(self, pos: Sequence[int]) -> List[Hotspot]:
+        return self.query(pos)
+
+    def query(self, pos: Sequence[int], active_only: bool = False) -> List[Hotspot]:
+        """Return hotspots containing ``pos``, in declaration order."""
+        hits = np.flatnonzero(self._mask(int(pos[0]), int(pos[1]), active_only))
+        return [self.hotspots[idx] for idx in hits]
+
+    def query_many(
+        self,
+        points: Union[Sequence[Sequence[int]], "np.ndarray"],
+        active_only: bool = False,
+        chunk: int = 1024,
+    ) -> List[List[Hotspot]]:
+        """Answer many point queries at once, e.g. when replaying input logs.
+
+        Points are tested ``chunk`` at a time against every hotspot, which
+        bounds the temporary ``(chunk, N)`` boolean matrix.
+        """
+        pts = np.asarray(points, dtype=np.int64).reshape(-1, 2)
+        results: List[List[Hotspot]] = []
+        for start in range(0, len(pts), chunk):
+            block = pts[start : start + chunk]
+            xs = block[:, 0:1]
+            ys = block[:, 1:2]
+            matrix = self._mask(xs, ys, active_only)
+            for row in matrix:
+                results.append([self.hotspots[idx] for idx in np.flatnonzero(row)])
+        return results
+
+    def __len__(self) -> int:
+        return len(self.hotspots)
+
+
+def _rect_index(
+    hotspots: List[Hotspot], backend: str, cell_size: int
+) -> Union[HotspotGrid, HotspotArrayIndex]:
+    use_numpy = backend == "numpy" or (
+        backend == "auto" and len(hotspots) >= NUMPY_MIN_HOTSPOTS
+    )
+    if use_numpy and np is not None:
+        return HotspotArrayIndex(hotspots)
+    return HotspotGrid(hotspots, cell_size)
+
+
+class ShapedHotspotIndex:
+    """Index mixing rectangular hotspots with polygon and mask shapes.
+
+    Shaped hotspots are rasterized once into a :class:`HotspotIdBuffer`
+    covering ``size`` at ``1/scale`` resolution, so looking one up is a
+    single array read however complex the shapes are. Rectangles stay in a
+    grid or numpy index. Where shaped hotspots overlap, the later active
+    one wins (see :meth:`query`).
+    """
+
+    def __init__(
+        self,
+        hotspots: List[Hotspot],
+        size: Tuple[int, int],
+        scale: int = 2,
+        backend: str = "auto",
+        cell_size: int = 64,
+        mask_loader: Optional[MaskLoader] = None,
+    ) -> None:
+        self.hotspots = hotspots
+        self.size = size
+        self.scale = scale
+        self.backend = backend
+        self.cell_size = cell_size
+        self.mask_loader = mask_loader
+        self.rebuild()
+
+    def rebuild(self) -> None:
+        """Re-rasterize shapes and rebuild the rectangle index."""
+        self.buffer = HotspotIdBuffer(self.size[0], self.size[1], self.scale)
+        self._order = {id(hs): idx for idx, hs in enumerate(self.hotspots)}
+        rects: List[Hotspot] = []
+        for idx, hs in enumerate(self.hotspots):
+            if hs.polygon:
+                self.buffer.paint_polygon(hs.polygon, idx + 1)
+            elif hs.mask:
+                bits = self.mask_loader(hs.mask) if self.mask_loader else None
+                hs._mask_bits = bits
+                if bits is not None:
+                    self.buffer.paint_mask(bits, hs.area, idx + 1)
+                else:
+                    rects.append(hs)
+            else:
+                rects.append(hs)
+        self.rects = _rect_index(rects, self.backend, self.cell_size)
+
+    def query(
+        self, pos: Sequence[int], state: Optional["GameState"] = None
+    ) -> List[Hotspot]:
+        """Return hotspots under ``pos`` in declaration order.
+
+        Of the shaped hotspots under ``pos`` only the top one is returned.
+        With ``state`` that is the top one whose condition holds, so an
+        inactive shape does not hide an active one underneath.
+        """
+        hits = self.rects.query(pos)
+        shaped = None
+        for value in reversed(self.buffer.lookup_all(pos)):
+            hs = self.hotspots[value - 1]
+            if state is None or hs.is_active(state):
+                shaped = hs
+                break
+        if shaped is not None:
+            hits.append(shaped)
+            if len(hits) > 1:
+                hits.sort(key=lambda hs: self._order[id(hs)])
+        return hits
+
+    candidates = query
+
+    def __len__(self) -> int:
+        return len(self.hotspots)
+
+
+HotspotIndex = Union[HotspotGrid, HotspotArrayIndex, ShapedHotspotIndex]
+
+
+def build_hotspot_index(
+    hotspots: List[Hotspot],
+    backend: str = "auto",
+    cell_size: int = 64,
+    size: Optional[Tuple[int, int]] = None,
+    scale: int = 2,
+    mask_loader: Optional[MaskLoader] = None,
+) -> HotspotIndex:
+    """Create the hotspot index for ``backend`` (``auto``, ``grid`` or ``numpy``).
+
+    ``auto`` uses numpy for scenes with at least :data:`NUMPY_MIN_HOTSPOTS`
+    hotspots when it is installed, and the grid otherwise. Asking for
+    ``numpy`` without numpy installed falls back to the grid. Scenes with
+    polygon or mask hotspots get a :class:`ShapedHotspotIndex` sized to
+    ``size`` (the screen), or to the hotspots' bounds when it is not given.
+    """
+    if any(hs.shaped for hs in hotspots):
+        if size is None:
+            size = (
+                max((hs.area[0] + hs.area[2] for hs in hotspots), default=1),
+                max((hs.area[1] + hs.area[3] for hs in hotspots), default=1),
+            )
+        return ShapedHotspotIndex(
+            hotspots, size, scale, backend, cell_size, mask_loader
+        )
+    return _rect_index(hotspots, backend, cell_size)
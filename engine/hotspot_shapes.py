@@ -0,0 +1,163 @@
+"""Irregular hotspot shapes and the ID buffer they are rasterized into."""
+
+from __future__ import annotations
+
+from array import array
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+Point = Tuple[int, int]
+Polygon = Sequence[Sequence[float]]
+
+# Loads the alpha mask for a hotspot ``mask`` path; returns a pygame.mask.Mask
+MaskLoader = Callable[[str], Optional[Any]]
+
+
+def polygon_bounds(points: Polygon) -> Tuple[int, int, int, int]:
+    """Return the ``(x, y, w, h)`` box enclosing ``points``."""
+    if not points:
+        return (0, 0, 0, 0)
+    xs = [p[0] for p in points]
+    ys = [p[1] for p in points]
+    x, y = int(min(xs)), int(min(ys))
+    return (x, y, int(max(xs)) - x + 1, int(max(ys)) - y + 1)
+
+
+def parse_polygon(points: Optional[Polygon]) -> Optional[Tuple[Point, ...]]:
+    """Return YAML polygon ``points`` as a tuple of points, ``None`` if empty."""
+    if not points:
+        return None
+    return tuple(tuple(point) for point in points)
+
+
+def shape_fields(hotspot: Any) -> Dict[str, Any]:
+    """Return the ``polygon``/``mask`` entries to save for ``hotspot``."""
+    fields: Dict[str, Any] = {}
+    if hotspot.polygon:
+        fields["polygon"] = [list(point) for point in hotspot.polygon]
+    if hotspot.mask:
+        fields["mask"] = hotspot.mask
+    return fields
+
+
+def point_in_polygon(x: float, y: float, points: Polygon) -> bool:
+    """Even-odd test for whether ``(x, y)`` lies inside ``points``."""
+    inside = False
+    count = len(points)
+    for idx in range(count):
+        x1, y1 = points[idx][0], points[idx][1]
+        x2, y2 = points[idx - 1][0], points[idx - 1][1]
+        if (y1 > y) != (y2 > y) and x < (x2 - x1) * (y - y1) / (y2 - y1) + x1:
+            inside = not inside
+    return inside
+
+
+def mask_contains(mask: Any, area: Sequence[int], pos: Sequence[int]) -> bool:
+    """Return True if the mask placed at ``area`` has a set bit under ``pos``."""
+    mx, my = int(pos[0]) - area[0], int(pos[1]) - area[1]
+    width, height = mask.get_size()
+    if not (0 <= mx < width and 0 <= my < height):
+        return False
+    return bool(mask.get_at((mx, my)))
+
+
+class HotspotIdBuffer:
+    """Overlap-set id per cell of a reduced-resolution screen grid.
+
+    ``scale`` screen pixels map to one cell on each axis, and each cell is
+    sampled at its centre while painting. Painters pass ``index + 1`` as the
+    value, ``0`` meaning no hotspot. A cell stores the id of the set of
+    values painted over it, in paint order, so overlapping shapes are all
+    kept; :meth:`lookup_all` returns that set and :meth:`lookup` its top.
+    """
+
+    def __init__(self, width: int, height: int, scale: int = 1) -> None:
+        self.scale = max(1, int(scale))
+        self.cols = max(1, -(-int(width) // self.scale))
+        self.rows = max(1, -(-int(height) // self.scale))
+        self.clear()
+
+    def clear(self) -> None:
+        self.cells = array("I", bytes(4 * self.cols * self.rows))
+        # set id -> painted values; set 0 is the empty set
+        self.sets: List[Tuple[int, ...]] = [()]
+        self._set_ids: Dict[Tuple[int, ...], int] = {(): 0}
+        self._added: Dict[Tuple[int, int], int] = {}
+
+    def _add(self, set_id: int, value: int) -> int:
+        """Return the id of set ``set_id`` with ``value`` painted on top."""
+        key = (set_id, value)
+        new_id = self._added.get(key)
+        if new_id is None:
+            values = tuple(v for v in self.sets[set_id] if v != value) + (value,)
+            new_id = self._set_ids.get(values)
+            if new_id is None:
+                new_id = len(self.sets)
+                self.sets.append(values)
+                self._set_ids[values] = new_id
+            self._added[key] = new_id
+        return new_id
+
+    def _row_span(self, x0: float, x1: float) -> Tuple[int, int]:
+        """Columns whose centres lie in ``[x0, x1)``."""
+        scale = self.scale
+        start = max(0, int(-(-(x0 - scale / 2) // scale)))
+        end = min(self.cols, int(-(-(x1 - scale / 2) // scale)))
+        return start, end
+
+    def _fill(self, row: int, start: int, end: int, value: int) -> None:
+        if end <= start:
+            return
+        first, last = row * self.cols + start, row * self.cols + end
+        span = self.cells[first:last]
+        new_ids = {set_id: self._add(set_id, value) for set_id in set(span)}
+        self.cells[first:last] = array("I", map(new_ids.__getitem__, span))
+
+    def paint_polygon(self, points: Polygon, value: int) -> None:
+        """Scanline-fill ``points`` with ``value``."""
+        if len(points) < 3:
+            return
+        _, y, _, h = polygon_bounds(points)
+        scale = self.scale
+        first_row = max(0, y // scale)
+        last_row = min(self.rows, (y + h) // scale + 1)
+        count = len(points)
+        for row in range(first_row, last_row):
+            cy = row * scale + scale / 2
+            crossings = []
+            for idx in range(count):
+                x1, y1 = points[idx][0], points[idx][1]
+                x2, y2 = points[idx - 1][0], points[idx - 1][1]
+                if (y1 > cy) != (y2 > cy):
+                    crossings.append((x2 - x1) * (cy - y1) / (y2 - y1) + x1)
+            crossings.sort()
+            for left, right in zip(crossings[::2], crossings[1::2]):
+                self._fill(row, *self._row_span(left, right), value)
+
+    def paint_mask(self, mask: Any, area: Sequence[int], value: int) -> None:
+        """Fill every cell whose centre hits a set bit of ``mask`` at ``area``."""
+        width, height = mask.get_size()
+        x, y = area[0], area[1]
+        scale = self.scale
+        start, end = self._row_span(x, x + width)
+        for row in range(max(0, y // scale), min(self.rows, (y + height) // scale + 1)):
+            my = int(row * scale + scale / 2) - y
+            if not 0 <= my < height:
+                continue
+            offset = row * self.cols
+            for col in range(start, end):
+                if mask.get_at((int(col * scale + scale / 2) - x, my)):
+                    cell = offset + col
+                    self.cells[cell] = self._add(self.cells[cell], value)
+
+    def lookup_all(self, pos: Sequence[int]) -> Tuple[int, ...]:
+        """Return every value painted under ``pos``, the last painted last."""
+        col = int(pos[0]) // self.scale
+        row = int(pos[1]) // self.scale
+        if 0 <= col < self.cols and 0 <= row < self.rows:
+            return self.sets[self.cells[row * self.cols + col]]
+        return ()
+
+    def lookup(self, pos: Sequence[int]) -> int:
+        """Return the last value painted under ``pos``, or ``0``."""
+        values = self.lookup_all(pos)
+        return values[-1] if values else 0
@@ -15,6 +15,7 @@ try:  # pragma: no cover - allow running tests without pygame installed
 except Exception:  # pragma: no cover - allow running tests without pygame
     pygame = None
 
+from .yaml_loader import load_yaml
 
 DEFAULT_BINDINGS: Dict[str, str] = {
     "move_up": "W",
@@ -55,14 +56,11 @@ class InputManager:
         """Load bindings from a YAML or JSON file."""
         if not os.path.exists(path):
             return
-        with open(path, "r", encoding="utf-8") as fh:
-            if path.endswith(".json"):
+        if path.endswith(".json"):
+            with open(path, "r", encoding="utf-8") as fh:
                 data = json.load(fh)
-            else:
-                if yaml:
-                    data = yaml.safe_load(fh) or {}
-                else:  # pragma: no cover - fallback when PyYAML missing
-                    data = json.load(fh)
+        else:
+            data = load_yaml(path) or {}
         self.bindings.update(data.get("controls", {}))
         self.gamepad_bindings.update(data.get("gamepad", {}))
 
@@ -90,7 +88,9 @@ class InputManager:
     # ------------------------------------------------------------------
     # Input handling
     # ------------------------------------------------------------------
-    def handle_event(self, event: "pygame.event.Event") -> None:  # pragma: no cover - interactive
+    def handle_event(
+        self, event: "pygame.event.Event"
+    ) -> None:  # pragma: no cover - interactive
         if not pygame:
             return
         if event.type in (pygame.KEYDOWN, pygame.KEYUP):
@@ -127,6 +127,3 @@ class InputManager:
                         self.input_state[action] = True
                     else:
                         self.input_state[action] = False
-
-
-
@@ -4,17 +4,13 @@ from dataclasses import dataclass, field
 from typing import Dict, List, Optional
 import os
 
-try:
-    import yaml  # type: ignore
-except Exception:  # pragma: no cover - allow tests without PyYAML
-    yaml = None
-
 try:
     import pygame  # type: ignore
 except Exception:  # pragma: no cover - allow running tests without pygame
     pygame = None
 
 from .game_state import GameState
+from .yaml_loader import load_yaml
 from .ui_overlay import UIOverlay
 
 
@@ -39,17 +35,7 @@ class InventorySystem:
         for fname in os.listdir(path):
             if not fname.endswith(".yaml"):
                 continue
-            fpath = os.path.join(path, fname)
-            with open(fpath, "r", encoding="utf-8") as fh:
-                if yaml:
-                    data = yaml.safe_load(fh) or {}
-                else:  # pragma: no cover - fallback when PyYAML missing
-                    import json
-
-                    data = json.load(fh)
-            entry = data.get("item")
-            if isinstance(entry, dict) and entry.get("id"):
-                self.item_data[entry["id"]] = entry
+            self.register_item(load_yaml(os.path.join(path, fname)) or {})
 
     def load_recipes_from_folder(self, path: str) -> None:
         """Load crafting recipes from ``path``."""
@@ -58,17 +44,23 @@ class InventorySystem:
         for fname in os.listdir(path):
             if not fname.endswith(".yaml"):
                 continue
-            fpath = os.path.join(path, fname)
-            with open(fpath, "r", encoding="utf-8") as fh:
-                if yaml:
-                    data = yaml.safe_load(fh) or {}
-                else:  # pragma: no cover - fallback when PyYAML missing
-                    import json
-
-                    data = json.load(fh)
-            entry = data.get("recipe")
-            if isinstance(entry, dict) and entry.get("id"):
-                self.recipes[entry["id"]] = entry
+            self.register_recipe(load_yaml(os.path.join(path, fname)) or {})
+
+    def register_item(self, data: Dict) -> None:
+        """Add the ``item`` entry of a parsed item file to ``item_data``."""
+        entry = data.get("item")
+        if isinstance(entry, dict) and entry.get("id"):
+            self.item_data[entry["id"]] = entry
+
+    def icon_paths(self) -> List[str]:
+        """Return the ``icon`` image of every registered item, e.g. for an atlas."""
+        return [data["icon"] for data in self.item_data.values() if data.get("icon")]
+
+    def register_recipe(self, data: Dict) -> None:
+        """Add the ``recipe`` entry of a parsed recipe file to ``recipes``."""
+        entry = data.get("recipe")
+        if isinstance(entry, dict) and entry.get("id"):
+            self.recipes[entry["id"]] = entry
 
     # ------------------------------------------------------------------
     # Inventory management
@@ -145,7 +137,9 @@ class InventorySystem:
     # ------------------------------------------------------------------
     # UI helpers
     # ------------------------------------------------------------------
-    def render_inventory(self, surface: "pygame.Surface") -> None:  # pragma: no cover - UI only
+    def render_inventory(
+        self, surface: "pygame.Surface"
+    ) -> None:  # pragma: no cover - UI only
         if not pygame:
             return
         icon_size = 32
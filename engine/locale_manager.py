@@ -4,10 +4,7 @@ from dataclasses import dataclass, field
 from typing import Dict, Set, List
 import os
 
-try:  # pragma: no cover - allow tests without PyYAML
-    import yaml  # type: ignore
-except Exception:  # pragma: no cover - fallback when PyYAML missing
-    yaml = None
+from .yaml_loader import load_yaml
 
 
 @dataclass
@@ -32,17 +29,30 @@ class LocaleManager:
             if not fname.endswith(".yaml"):
                 continue
             locale_code = os.path.splitext(fname)[0]
-            fpath = os.path.join(path, fname)
-            with open(fpath, "r", encoding="utf-8") as fh:
-                if yaml:
-                    data = yaml.safe_load(fh) or {}
-                else:  # pragma: no cover - fallback when PyYAML missing
-                    import json
-
-                    data = json.load(fh)
-            flat: Dict[str, str] = {}
-            self._flatten(data, flat)
-            self.translations[locale_code] = flat
+            self.register_locale(
+                locale_code, load_yaml(os.path.join(path, fname)) or {}
+            )
+
+    def register_locale(self, locale_code: str, data: Dict) -> None:
+        """Flatten parsed locale ``data`` into ``translations[locale_code]``."""
+        flat: Dict[str, str] = {}
+        self._flatten(data, flat)
+        self.translations[locale_code] = flat
+
+    def merge_file(self, path: str) -> str:
+        """Reload locale file ``path`` and return its locale code.
+
+        The existing ``translations`` dict for the locale is updated in place,
+        so keys removed from the file disappear and holders of the dict see
+        the new strings.
+        """
+        locale_code = os.path.splitext(os.path.basename(path))[0]
+        flat: Dict[str, str] = {}
+        self._flatten(load_yaml(path) or {}, flat)
+        live = self.translations.setdefault(locale_code, {})
+        live.clear()
+        live.update(flat)
+        return locale_code
 
     def _flatten(self, data: Dict, out: Dict[str, str], prefix: str = "") -> None:
         for key, value in (data or {}).items():
@@ -102,4 +112,3 @@ class LocaleManager:
         with open(file_path, "w", encoding="utf-8") as fh:
             for key in sorted(self.missing_keys):
                 fh.write(key + "\n")
-
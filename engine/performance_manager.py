@@ -2,7 +2,6 @@ from __future__ import annotations
 
 import logging
 import os
-import sys
 from typing import List, Dict, Optional
 
 try:  # pragma: no cover - allow running tests without pygame
@@ -10,12 +9,8 @@ try:  # pragma: no cover - allow running tests without pygame
 except Exception:  # pragma: no cover - allow running tests without pygame
     pygame = None
 
-try:
-    import yaml
-except Exception:  # pragma: no cover - allow running tests without PyYAML
-    yaml = None
-
-from .asset_manager import AssetManager
+from .asset_manager import MB, AssetManager
+from .yaml_loader import load_yaml
 
 logger = logging.getLogger(__name__)
 
@@ -23,26 +18,30 @@ logger = logging.getLogger(__name__)
 class PerformanceManager:
     """Runtime performance tuning and diagnostics."""
 
-    def __init__(self, config_path: str = "config/performance.yaml") -> None:
+    def __init__(
+        self,
+        config_path: str = "config/performance.yaml",
+        asset_manager: Optional[AssetManager] = None,
+    ) -> None:
         self.config: Dict = self._load_config(config_path)
         perf = self.config.get("performance", {})
         self.target_fps: int = int(perf.get("target_fps", 60))
         self.clock = pygame.time.Clock() if pygame else None
-        self.asset_cache = AssetManager()
+        self.asset_cache = asset_manager or AssetManager()
         self.resource_log: List[str] = []
         self.frame_times: List[float] = []
         self.diagnostics_enabled: bool = bool(perf.get("diagnostics_enabled", False))
         self.max_cache_size_mb: int = int(perf.get("asset_cache_limit_mb", 200))
+        self.asset_cache.set_memory_limit(self.max_cache_size_mb)
         self._profiles: Dict[str, Dict] = self.config.get("profiles", {})
 
     # ------------------------------------------------------------------
     # Config helpers
     # ------------------------------------------------------------------
     def _load_config(self, path: str) -> Dict:
-        if not yaml or not os.path.exists(path):
+        if not os.path.exists(path):
             return {}
-        with open(path, "r", encoding="utf-8") as fh:
-            return yaml.safe_load(fh) or {}
+        return load_yaml(path) or {}
 
     # ------------------------------------------------------------------
     # Framerate helpers
@@ -74,21 +73,16 @@ class PerformanceManager:
         logger.debug(msg)
 
     def cache_size_mb(self) -> float:
-        size = 0
-        for coll in (self.asset_cache.image_cache, self.asset_cache.sound_cache, self.asset_cache.music_cache):
-            for obj in coll.values():
-                try:
-                    size += sys.getsizeof(obj)
-                except Exception:
-                    pass
-        return size / (1024 * 1024)
+        """Pixel and PCM bytes held by the asset cache, in MB."""
+        return self.asset_cache.bytes_used / MB
 
     def clear_unused_assets(self) -> None:
-        self.asset_cache.clear_cache()
+        """Drop every cached asset the active scene has not pinned."""
+        self.asset_cache.clear_unpinned()
 
     def trim_cache(self) -> None:
-        if self.cache_size_mb() > self.max_cache_size_mb:
-            self.clear_unused_assets()
+        """Evict least recently used assets until under ``max_cache_size_mb``."""
+        self.asset_cache.enforce_budget(int(self.max_cache_size_mb * MB))
 
     def get_diagnostics(self) -> Dict:
         avg_fps = 0.0
@@ -97,11 +91,13 @@ class PerformanceManager:
         return {
             "average_fps": avg_fps,
             "cache_size_mb": self.cache_size_mb(),
+            "cache_evictions": self.asset_cache.evictions,
             "frames_tracked": len(self.frame_times),
         }
 
-    def flush_scene_cache(self, scene_id: str) -> None:
-        self.clear_unused_assets()
+    def flush_scene_cache(self, scene_id: str) -> List[str]:
+        """Release ``scene_id``'s assets; return the paths no other scene uses."""
+        return self.asset_cache.release_scene(scene_id)
 
     def apply_performance_profile(self, profile_name: str) -> None:
         profile = self._profiles.get(profile_name, {})
@@ -111,5 +107,6 @@ class PerformanceManager:
             self.target_fps = int(profile["target_fps"])
         if "cache_limit" in profile:
             self.max_cache_size_mb = int(profile["cache_limit"])
+            self.asset_cache.set_memory_limit(self.max_cache_size_mb)
         if "diagnostics" in profile:
             self.diagnostics_enabled = bool(profile["diagnostics"])
@@ -5,17 +5,13 @@ from importlib import import_module
 from pathlib import Path
 from typing import Any, Dict, Optional, Type
 
-try:
-    import yaml  # type: ignore
-except Exception:  # pragma: no cover - allow tests without PyYAML
-    yaml = None
-
 try:
     import pygame
 except Exception:  # pragma: no cover - allow running tests without pygame
     pygame = None
 
 from .game_state import GameState
+from .yaml_loader import load_yaml
 
 
 @dataclass
@@ -45,8 +41,8 @@ class PuzzleBase:
         """Initialize puzzle state when activated."""
         return None
 
-    def update(self) -> None:
-        """Update internal state each frame."""
+    def update(self, dt: float = 0.0) -> None:
+        """Update internal state; ``dt`` is the step length in seconds."""
         return None
 
     def render(self, screen) -> None:  # pragma: no cover - UI only
@@ -150,14 +146,17 @@ class PuzzleEngine:
     # ------------------------------------------------------------------
     def load_file(self, path: str) -> None:
         """Load puzzle metadata from a YAML or JSON file."""
-        with open(path, "r", encoding="utf-8") as fh:
-            if yaml:
-                data = yaml.safe_load(fh) or {}
-            else:  # pragma: no cover - fallback when PyYAML missing
-                import json
+        self.load_data(load_yaml(path) or {})
 
-                data = json.load(fh)
+    def load_data(self, data: Dict[str, Any]) -> None:
+        """Register every puzzle in an already parsed puzzle file."""
+        for puzzle in self.parse_data(data):
+            self.registry[puzzle.id] = puzzle
 
+    @staticmethod
+    def parse_data(data: Dict[str, Any]) -> list[PuzzleMeta]:
+        """Return the puzzles in parsed file ``data`` without registering them."""
+        parsed: list[PuzzleMeta] = []
         entries = []
         if "puzzles" in data and isinstance(data["puzzles"], list):
             entries = data["puzzles"]
@@ -178,7 +177,8 @@ class PuzzleEngine:
                 condition=entry.get("condition"),
                 on_solve=entry.get("on_solve", {}) or {},
             )
-            self.registry[puzzle.id] = puzzle
+            parsed.append(puzzle)
+        return parsed
 
     def load_from_yaml(self, scene_id: str, data: Dict[str, Any]) -> None:
         """Load puzzle definitions from already parsed scene YAML."""
@@ -258,9 +258,9 @@ class PuzzleEngine:
     # ------------------------------------------------------------------
     # Active Puzzle
     # ------------------------------------------------------------------
-    def update(self) -> None:
+    def update(self, dt: float = 0.0) -> None:
         if self.active_puzzle:
-            self.active_puzzle.update()
+            self.active_puzzle.update(dt)
 
     def render(self, surface) -> None:  # pragma: no cover - UI only
         if self.active_puzzle:
@@ -70,9 +70,9 @@ class PuzzleManager:
         if self.active:
             self.active.render(screen)
 
-    def update(self) -> None:
-        if self.active:
-            self.active.update()
+    def update(self, dt: float = 0.0) -> None:
+        """Advance the active puzzle, also one started with ``engine.load_puzzle``."""
+        self.engine.update(dt)
 
     def check(self, puzzle_id: str, player_input) -> bool:
         """Validate ``player_input`` for puzzle and mark solved if correct."""
@@ -0,0 +1,277 @@
+"""Frame composition shared by :class:`SceneManager` and :class:`EngineLoop`."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import Any, List, Optional, Sequence, Tuple
+
+try:
+    import pygame  # type: ignore
+except Exception:  # pragma: no cover - allow running tests without pygame
+    pygame = None
+
+
+class DirtySurface:
+    """Wrap a surface and record the rect touched by every ``blit``/``fill``.
+
+    Everything else is forwarded to the wrapped surface, so UI code can draw
+    on it unchanged. Use :meth:`mark_dirty` for drawing that bypasses it
+    (for example ``pygame.draw`` calls on :attr:`surface`).
+    """
+
+    def __init__(self, surface: "pygame.Surface") -> None:
+        self.surface = surface
+        self.rects: List["pygame.Rect"] = []
+
+    def blit(self, source, dest, area=None, special_flags: int = 0) -> "pygame.Rect":
+        rect = self.surface.blit(source, dest, area, special_flags)
+        self.rects.append(rect)
+        return rect
+
+    def blits(self, blit_sequence, doreturn: int = 1):
+        rects = [self.blit(*item) for item in blit_sequence]
+        return rects if doreturn else None
+
+    def fill(self, color, rect=None, special_flags: int = 0) -> "pygame.Rect":
+        rect = self.surface.fill(color, rect, special_flags)
+        self.rects.append(rect)
+        return rect
+
+    def mark_dirty(self, rect) -> None:
+        self.rects.append(pygame.Rect(rect))
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.surface, name)
+
+
+class Renderer:
+    """Draw the scene layers each frame and present them to the display.
+
+    The static layers of a scene (background and overlays) are flattened
+    once into a display-format composite, so drawing them costs one blit
+    per frame however many overlays there are. Composites are cached per
+    layer list (the last ``composite_cache`` lists) and rebuilt only when a
+    different list is passed to :meth:`begin_frame`.
+
+    In the default mode every frame blits the composite and flips. With
+    ``dirty_rects`` enabled only the regions drawn through :attr:`target` in
+    this or the previous frame (tooltips, dialogue, debug text, ...) are
+    restored from the composite and sent to ``pygame.display.update``. A
+    scene change, a new layer list, a resize or :meth:`invalidate` falls
+    back to a full flip, as does a frame whose dirty area exceeds
+    ``full_redraw_ratio`` of the screen.
+
+    ``present`` controls whether frames are sent to the display at all; by
+    default they are whenever a display mode is set, so an off-screen
+    ``screen`` (headless benchmarks) is drawn but never flipped.
+
+    With ``logical_size`` the frame is drawn on a canvas of that size
+    (:attr:`screen`/:attr:`target`) and copied to the window (:attr:`window`)
+    with a single scale per frame, keeping the aspect ratio: ``smooth``
+    uses ``smoothscale``, ``fast`` nearest-neighbour ``scale`` and
+    ``integer`` the largest whole multiple that fits. Window coordinates
+    such as mouse positions map back through :meth:`to_logical`.
+    """
+
+    SCALE_MODES = ("smooth", "fast", "integer")
+
+    def __init__(
+        self,
+        screen: "pygame.Surface",
+        dirty_rects: bool = False,
+        clear_color: Tuple[int, int, int] = (0, 0, 0),
+        full_redraw_ratio: float = 0.5,
+        composite_cache: int = 4,
+        present: Optional[bool] = None,
+        logical_size: Optional[Tuple[int, int]] = None,
+        scale_mode: str = "smooth",
+    ) -> None:
+        if scale_mode not in self.SCALE_MODES:
+            raise ValueError(f"Unknown scale mode: {scale_mode!r}")
+        self.window = screen
+        self.logical_size = tuple(logical_size) if logical_size else None
+        self.scale_mode = scale_mode
+        self.canvas: Optional["pygame.Surface"] = None
+        if self.logical_size:
+            canvas = pygame.Surface(self.logical_size)
+            if pygame.display.get_surface() is not None:
+                canvas = canvas.convert()
+            self.canvas = canvas
+        self.screen = self.canvas or screen
+        self.viewport: Optional["pygame.Rect"] = None
+        self._viewport_surface: Optional["pygame.Surface"] = None
+        self._window_size: Optional[Tuple[int, int]] = None
+        self.present = present
+        self.dirty_rects = dirty_rects
+        self.clear_color = clear_color
+        self.full_redraw_ratio = full_redraw_ratio
+        self.composite_cache = max(1, composite_cache)
+        self.target = DirtySurface(self.screen) if dirty_rects else self.screen
+        self.frames = 0
+        self.full_frames = 0
+        self.last_update_area = 0
+        self.composites_built = 0
+        self._composites: "OrderedDict[int, Tuple[Sequence[Any], pygame.Surface]]" = (
+            OrderedDict()
+        )
+        self._base: Optional["pygame.Surface"] = None
+        self._layers: Optional[Sequence[Any]] = None
+        self._scene_key: Any = None
+        self._size: Optional[Tuple[int, int]] = None
+        self._previous: List["pygame.Rect"] = []
+        self._full = True
+
+    def invalidate(self) -> None:
+        """Force a full redraw and flip on the next frame."""
+        self._full = True
+
+    def clear_composites(self) -> None:
+        """Drop cached composites, e.g. after overlay images were edited."""
+        self._composites.clear()
+        self._layers = None
+        self._full = True
+
+    # ------------------------------------------------------------------
+    # Logical resolution
+    # ------------------------------------------------------------------
+    def _update_viewport(self) -> None:
+        """Recompute where the canvas lands in the window after a resize."""
+        size = self.window.get_size()
+        if size == self._window_size:
+            return
+        (lw, lh), (ww, wh) = self.logical_size, size
+        scale = min(ww // lw, wh // lh) if self.scale_mode == "integer" else 0
+        if scale < 1:
+            scale = min(ww / lw, wh / lh)
+        vw, vh = max(1, min(ww, round(lw * scale))), max(1, min(wh, round(lh * scale)))
+        self.viewport = pygame.Rect((ww - vw) // 2, (wh - vh) // 2, vw, vh)
+        self._viewport_surface = self.window.subsurface(self.viewport)
+        self._window_size = size
+        self.window.fill((0, 0, 0))
+        self._full = True
+
+    def to_logical(self, pos: Tuple[int, int]) -> Tuple[int, int]:
+        """Map a window position (e.g. a mouse click) to canvas coordinates."""
+        if self.canvas is None:
+            return pos
+        self._update_viewport()
+        vp = self.viewport
+        lw, lh = self.logical_size
+        return (
+            int((pos[0] - vp.x) * lw // vp.width),
+            int((pos[1] - vp.y) * lh // vp.height),
+        )
+
+    def _to_window(self, rect: "pygame.Rect") -> "pygame.Rect":
+        vp = self.viewport
+        lw, lh = self.logical_size
+        left = vp.x + rect.left * vp.width // lw
+        top = vp.y + rect.top * vp.height // lh
+        right = vp.x - (-rect.right * vp.width // lw)
+        bottom = vp.y - (-rect.bottom * vp.height // lh)
+        # smoothscale blends neighbouring pixels across the edge
+        return pygame.Rect(left, top, right - left, bottom - top).inflate(2, 2)
+
+    def _scale_to_window(self) -> None:
+        dest = self._viewport_surface
+        if dest.get_size() == self.logical_size:
+            dest.blit(self.canvas, (0, 0))
+        elif self.scale_mode == "smooth":
+            try:
+                pygame.transform.smoothscale(self.canvas, dest.get_size(), dest)
+            except ValueError:  # smoothscale needs 24 or 32 bit surfaces
+                pygame.transform.scale(self.canvas, dest.get_size(), dest)
+        else:
+            pygame.transform.scale(self.canvas, dest.get_size(), dest)
+
+    # ------------------------------------------------------------------
+    # Static layers
+    # ------------------------------------------------------------------
+    def composite(self, layers: Sequence[Any]) -> "pygame.Surface":
+        """Return the flattened surface for ``layers``, building it if needed."""
+        size = self.screen.get_size()
+        key = id(layers)
+        entry = self._composites.get(key)
+        if entry is not None and entry[0] is layers and entry[1].get_size() == size:
+            self._composites.move_to_end(key)
+            return entry[1]
+        surface = pygame.Surface(size)
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert()
+        surface.fill(self.clear_color)
+        for layer in layers:
+            surface.blit(layer, (0, 0))
+        # keep a reference to ``layers`` so its id can't be reused
+        self._composites[key] = (layers, surface)
+        while len(self._composites) > self.composite_cache:
+            self._composites.popitem(last=False)
+        self.composites_built += 1
+        return surface
+
+    # ------------------------------------------------------------------
+    # Frame
+    # ------------------------------------------------------------------
+    def begin_frame(self, layers: Sequence[Any], scene_key: Any = None) -> None:
+        """Draw the static scene layers, or restore last frame's dirty areas."""
+        size = self.screen.get_size()
+        if (
+            layers is not self._layers
+            or scene_key != self._scene_key
+            or size != self._size
+        ):
+            self._layers = layers
+            self._scene_key = scene_key
+            self._size = size
+            self._base = self.composite(layers)
+            self._full = True
+
+        if not self.dirty_rects:
+            self.screen.blit(self._base, (0, 0))
+            return
+        if self._full:
+            self.screen.blit(self._base, (0, 0))
+        else:
+            for rect in self._previous:
+                self.screen.blit(self._base, rect, rect)
+        self.target.rects = []
+
+    def end_frame(self) -> None:
+        """Present the frame with a full flip or a dirty-rect update."""
+        self.frames += 1
+        width, height = self.screen.get_size()
+        if self.canvas is not None:
+            self._update_viewport()
+            self._scale_to_window()
+        if not self.dirty_rects:
+            self._present_full(width * height)
+            return
+
+        current = [rect for rect in self.target.rects if rect.width and rect.height]
+        full = self._full
+        self._full = False
+        if not full:
+            bounds = self.screen.get_rect()
+            rects = [rect.clip(bounds) for rect in self._previous + current]
+            rects = [rect for rect in rects if rect.width and rect.height]
+            area = sum(rect.width * rect.height for rect in rects)
+            if area <= width * height * self.full_redraw_ratio:
+                self._previous = current
+                self.last_update_area = area
+                if rects and self._presenting():
+                    if self.canvas is not None:
+                        rects = [self._to_window(rect) for rect in rects]
+                    pygame.display.update(rects)
+                return
+        self._previous = current
+        self._present_full(width * height)
+
+    def _present_full(self, area: int) -> None:
+        self.full_frames += 1
+        self.last_update_area = area
+        if self._presenting():
+            pygame.display.flip()
+
+    def _presenting(self) -> bool:
+        if self.present is not None:
+            return self.present
+        return pygame.display.get_surface() is not None
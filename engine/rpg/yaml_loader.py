@@ -1,12 +1,15 @@
 """
 YAML Loader for RPG Data (Characters, Items, Spells, Quests, Campaigns)
 """
-import yaml
+
 import os
 
+from engine.yaml_loader import load_yaml
+
+
 def load_yaml_data(filepath):
-    with open(filepath, 'r', encoding='utf-8') as f:
-        return yaml.safe_load(f)
+    return load_yaml(filepath)
+
 
 # Example: load character data from YAML
 # data = load_yaml_data('game/characters.yaml')
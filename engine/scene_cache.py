@@ -0,0 +1,145 @@
+"""Compiled scene cache used by :class:`SceneManager`."""
+
+from __future__ import annotations
+
+import logging
+import marshal
+import os
+import threading
+from typing import Callable, Dict, Optional, Tuple
+
+from .scene import Scene
+from .yaml_loader import load_yaml
+
+logger = logging.getLogger(__name__)
+
+CACHE_DIR_NAME = "__scenecache__"
+CACHE_VERSION = 1
+
+
+class SceneCache:
+    """Cache parsed scenes keyed by file path, mtime and size.
+
+    Parsed :class:`Scene` objects are kept in memory. The raw scene mapping
+    is also written as a ``marshal`` blob into a ``__scenecache__`` folder
+    next to the YAML file so later runs skip the YAML parser entirely.
+    """
+
+    def __init__(self, write_disk: bool = True) -> None:
+        self.write_disk = write_disk
+        self._entries: Dict[str, Tuple[Tuple[int, int], Scene]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    # ------------------------------------------------------------------
+    # Path helpers
+    # ------------------------------------------------------------------
+    @staticmethod
+    def compiled_path(path: str) -> str:
+        """Return the on-disk cache location for the scene at ``path``."""
+        folder, name = os.path.split(os.path.abspath(path))
+        return os.path.join(folder, CACHE_DIR_NAME, f"{name}.marshal")
+
+    @staticmethod
+    def _stamp(path: str) -> Tuple[int, int]:
+        st = os.stat(path)
+        return st.st_mtime_ns, st.st_size
+
+    # ------------------------------------------------------------------
+    # Loading
+    # ------------------------------------------------------------------
+    def load(self, path: str, build: Callable[[dict], Scene]) -> Scene:
+        """Return the scene at ``path``, building it with ``build`` on a miss."""
+        key = os.path.abspath(path)
+        stamp = self._stamp(key)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and entry[0] == stamp:
+                self.hits += 1
+                return entry[1]
+
+        data = self._read_compiled(key, stamp)
+        if data is None:
+            data = load_yaml(key, use_cache=False) or {}
+            self._write_compiled(key, stamp, data)
+            with self._lock:
+                self.misses += 1
+        else:
+            with self._lock:
+                self.disk_hits += 1
+
+        scene = build(data)
+        with self._lock:
+            self._entries[key] = (stamp, scene)
+        return scene
+
+    def _read_compiled(self, path: str, stamp: Tuple[int, int]) -> Optional[dict]:
+        compiled = self.compiled_path(path)
+        if not os.path.exists(compiled):
+            return None
+        try:
+            with open(compiled, "rb") as fh:
+                version, mtime, size, data = marshal.load(fh)
+        except Exception as exc:
+            logger.debug("Ignoring unreadable scene cache '%s': %s", compiled, exc)
+            return None
+        if version != CACHE_VERSION or (mtime, size) != stamp:
+            return None
+        return data
+
+    def _write_compiled(self, path: str, stamp: Tuple[int, int], data: dict) -> None:
+        if not self.write_disk:
+            return
+        compiled = self.compiled_path(path)
+        try:
+            blob = marshal.dumps((CACHE_VERSION, stamp[0], stamp[1], data))
+        except ValueError:
+            # YAML produced a type marshal can't store (dates, sets, ...)
+            logger.debug("Scene '%s' is not marshallable, skipping disk cache", path)
+            return
+        tmp = f"{compiled}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(compiled), exist_ok=True)
+            with open(tmp, "wb") as fh:
+                fh.write(blob)
+            os.replace(tmp, compiled)
+        except OSError as exc:
+            logger.debug("Could not write scene cache '%s': %s", compiled, exc)
+
+    # ------------------------------------------------------------------
+    # Cache management
+    # ------------------------------------------------------------------
+    def get_cached(self, path: str) -> Optional[Scene]:
+        """Return the in-memory scene for ``path`` if it is still fresh."""
+        key = os.path.abspath(path)
+        try:
+            stamp = self._stamp(key)
+        except OSError:
+            return None
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry and entry[0] == stamp:
+            return entry[1]
+        return None
+
+    def invalidate(self, path: Optional[str] = None) -> None:
+        """Forget ``path`` or every cached scene when ``path`` is ``None``."""
+        with self._lock:
+            if path is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(os.path.abspath(path), None)
+
+    def stats(self) -> Dict[str, float]:
+        """Return hit/miss counters for diagnostics."""
+        with self._lock:
+            total = self.hits + self.disk_hits + self.misses
+            return {
+                "hits": self.hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "entries": len(self._entries),
+                "hit_rate": (self.hits + self.disk_hits) / total if total else 0.0,
+            }
@@ -1,7 +1,6 @@
 """Scene loading and basic game loop management."""
 
 import os
-import yaml
 import pygame
 
 from .asset_manager import AssetManager
@@ -10,30 +9,135 @@ from .timeline_engine import TimelineEngine
 
 from .game_state import GameState
 from .dialogue_engine import DialogueEngine
+from .content_loader import ContentLoader, ContentReport
+from .inventory_system import InventorySystem
+from .locale_manager import LocaleManager
+from .performance_manager import PerformanceManager
+from .puzzle_manager import PuzzleManager
 
 from .scene import Scene
+from .scene_cache import SceneCache
+from .scene_pool import ActivatedScene, ActivatedScenePool
+from .scene_prefetcher import ScenePrefetcher
+from .scene_transition import PreparedScene, SceneTransition
+from .hot_reload import HotReloader
+from .frame_scheduler import FrameScheduler
+from .renderer import Renderer
 from .hotspot import Hotspot
+from .hotspot_shapes import parse_polygon
+from .hotspot_index import (
+    HotspotArrayIndex,
+    HotspotIndex,
+    ShapedHotspotIndex,
+    build_hotspot_index,
+)
 from .world_manager import WorldManager, Region
 
 
 class SceneManager:
     """Manage scene loading and update the main loop."""
 
-    def __init__(self, screen, config):
+    def __init__(
+        self, screen, config, performance_manager: PerformanceManager | None = None
+    ):
         self.screen = screen
         self.config = config
         self.running = True
         self.current_scene = None
         self.overlays = []
+        self.static_layers = []
         self.active_features = {}
         self.hotspots = []
+        self.hotspot_index: HotspotIndex | None = None
+        self.hotspot_cell_size = int(self.config.get("hotspot_cell_size", 64))
+        self.hotspot_backend = self.config.get("hotspot_index", "auto")
+        self.hotspot_id_scale = int(self.config.get("hotspot_id_scale", 2))
         self.game_state = GameState(self.config.get("save_file", "save.json"))
         self.game_state.load()
-        self.dialogue_engine = DialogueEngine(self.game_state)
+        self.locale_manager = LocaleManager()
+        self.dialogue_engine = DialogueEngine(
+            self.game_state,
+            locale_manager=self.locale_manager,
+            text_speed=float(self.config.get("text_speed", 0)),
+        )
         self.timeline_engine = TimelineEngine(self.game_state)
-        self.assets = AssetManager()
-        self.scene_start_time = 0
+        self.puzzle_manager = PuzzleManager(self.game_state, scene_manager=self)
+        self.inventory = InventorySystem(self.game_state)
+        self.content_report: ContentReport | None = self.load_content()
+        window_cfg = self.config.get("window") or {}
+        # scenes are drawn at ``window.logical_size`` when set, else window size
+        logical_size = window_cfg.get("logical_size")
+        self.logical_size: tuple[int, int] | None = (
+            tuple(logical_size) if logical_size else None
+        )
+        # art drawn for ``window.art_size`` is pre-scaled to the view size
+        art_size = window_cfg.get("art_size")
+        decode_cfg = self.config.get("asset_decode") or {}
+        view_size = self.view_size()
+        self.assets = AssetManager(
+            art_resolution=art_size,
+            target_resolution=view_size if art_size else None,
+            memory_limit_mb=self.config.get("asset_cache_limit_mb"),
+            decode_workers=int(decode_cfg.get("workers", 2)),
+        )
+        # main-thread time per frame for finishing background decodes
+        self.asset_budget_ms = float(decode_cfg.get("budget_ms", 2.0))
+        # resolve asset paths through one index of the asset folders
+        manifest_cfg = self.config.get("asset_manifest") or {}
+        if manifest_cfg.get("index"):
+            if self.assets.load_manifest(manifest_cfg["index"]) is None:
+                self.assets.build_manifest()
+        elif manifest_cfg.get("enabled", True):
+            self.assets.build_manifest()
+        # packed archives from ``python -m tools.asset_pack``, later ones win
+        for pack_path in self.config.get("asset_packs") or []:
+            self.assets.mount_pack(pack_path)
+        atlas_cfg = self.config.get("atlas") or {}
+        if atlas_cfg.get("index"):
+            self.assets.load_atlas(atlas_cfg["index"])
+        # frame cap and cache profiles from ``performance_config``
+        self.performance_manager = performance_manager or PerformanceManager(
+            self.config.get("performance_config", "config/performance.yaml"),
+            asset_manager=self.assets,
+        )
+        cache_limit = self.config.get("asset_cache_limit_mb")
+        if performance_manager is None and cache_limit is not None:
+            # the top-level setting wins over the performance file's default
+            self.performance_manager.max_cache_size_mb = cache_limit
+            self.assets.set_memory_limit(cache_limit)
+        # simulation time in ms, advanced by :meth:`update`
+        self.clock_ms = 0.0
+        self.scene_start_time = 0.0
         self.scenes_dir = self.config.get("scenes_dir", "game/scenes")
+        self.scene_cache = SceneCache(
+            write_disk=bool(self.config.get("scene_cache_disk", True))
+        )
+        self.prefetcher: ScenePrefetcher | None = None
+        prefetch_cfg = self.config.get("prefetch") or {}
+        if prefetch_cfg.get("enabled"):
+            self.prefetcher = ScenePrefetcher(
+                self,
+                depth=prefetch_cfg.get("depth", 1),
+                memory_budget_mb=prefetch_cfg.get("memory_budget_mb", 64),
+                idle_delay=prefetch_cfg.get("idle_delay", 0.25),
+            )
+        self.transition: SceneTransition | None = None
+        self.hot_reloader: HotReloader | None = None
+        reload_cfg = self.config.get("hot_reload") or {}
+        if reload_cfg.get("enabled"):
+            self.hot_reloader = HotReloader(reload_cfg.get("interval", 0.5))
+            self.hot_reloader.watch_scenes(self)
+            if self.content_report is not None:
+                self.hot_reloader.watch_content(
+                    self.content_report,
+                    dialogues=self.dialogue_engine,
+                    locales=self.locale_manager,
+                    puzzles=self.puzzle_manager.engine,
+                )
+        self.scene_pool = ActivatedScenePool(self.config.get("scene_pool_size", 8))
+        self.unload_idle_scenes = bool(self.config.get("unload_idle_scenes", True))
+        self.held_scene: str | None = None
+        self.current_music: str | None = None
         self.world_manager: WorldManager | None = None
         self.current_region: Region | None = None
         self.current_scene_id: str | None = None
@@ -46,6 +150,29 @@ class SceneManager:
     # ------------------------------------------------------------------
     # Scene Loading
     # ------------------------------------------------------------------
+    def load_content(self) -> ContentReport | None:
+        """Bulk load items, recipes, locales, dialogues and puzzles.
+
+        One :class:`ContentLoader` pass over ``content.root`` and
+        ``content.locales_dir`` replaces the per-folder loaders, parsing in a
+        process pool once there are ``content.min_parallel_files`` files.
+        """
+        content_cfg = self.config.get("content") or {}
+        if not content_cfg.get("enabled", True):
+            return None
+        loader = ContentLoader(
+            content_cfg.get("root", "game"),
+            content_cfg.get("locales_dir", "locales"),
+            max_workers=content_cfg.get("workers"),
+            min_parallel_files=int(content_cfg.get("min_parallel_files", 16)),
+        )
+        return loader.load(
+            inventory=self.inventory,
+            locales=self.locale_manager,
+            dialogues=self.dialogue_engine,
+            puzzles=self.puzzle_manager.engine,
+        )
+
     def load_start_scene(self):
         """Load the starting scene defined in ``config.yaml``."""
         scene_path = self.config.get("start_scene")
@@ -55,6 +182,8 @@ class SceneManager:
         self.current_scene = self.load_scene(scene_path)
         self.current_scene_id = self.current_scene.id
         self.activate_scene(self.current_scene)
+        if self.prefetcher and self.current_scene_id:
+            self.prefetcher.schedule(self.current_scene_id)
 
     def load_start_world(self) -> None:
         """Load the starting world and initialize the first region."""
@@ -80,13 +209,18 @@ class SceneManager:
             self.open_scene(scene_id)
 
     def load_scene(self, path):
-        """Read a YAML file and return a :class:`Scene` instance."""
+        """Read a YAML file and return a :class:`Scene` instance.
+
+        Scenes go through :attr:`scene_cache`, so repeated loads of an
+        unchanged file reuse the already compiled :class:`Scene`.
+        """
         if not os.path.exists(path):
             raise FileNotFoundError(f"Scene file not found: {path}")
+        return self.scene_cache.load(path, self.build_scene)
 
-        with open(path, "r") as fh:
-            data = yaml.safe_load(fh) or {}
-
+    @staticmethod
+    def build_scene(data: dict) -> Scene:
+        """Create a :class:`Scene` from parsed scene YAML ``data``."""
         scene_data = data.get("scene", {})
         hotspots_data = data.get("hotspots", []) or []
         events_data = data.get("events", []) or []
@@ -104,6 +238,8 @@ class SceneManager:
                     action=hs.get("action", ""),
                     target=hs.get("target"),
                     condition=hs.get("condition"),
+                    polygon=parse_polygon(hs.get("polygon")),
+                    mask=hs.get("mask"),
                 )
             )
         return Scene(
@@ -117,50 +253,210 @@ class SceneManager:
         )
 
     def activate_scene(self, scene: Scene):
-        """Load assets and enable features for the given scene."""
-        self.assets.preload_scene(scene)
-        self.overlays = []
-        self.active_features = scene.features or {}
-        self.hotspots = scene.hotspots or []
-        self.scene_start_time = pygame.time.get_ticks()
+        """Load assets and enable features for the given scene.
+
+        The derived state is pooled, so re-activating the same scene (for
+        example when a ``time_loop`` expires) only rewinds timers and events.
+        """
+        activated = self.scene_pool.get(scene)
+        if activated is None:
+            activated = self._build_activation(scene)
+            self.scene_pool.put(activated)
+
+        self.overlays = activated.overlays
+        self.static_layers = activated.layers
+        self.active_features = activated.features
+        self.hotspots = activated.hotspots
+        self.hotspot_index = activated.hotspot_index
+        self.scene_start_time = self.clock_ms
+        # the active scene's assets stay cached whatever the memory budget
+        paths = self.scene_asset_paths(scene)
+        self.assets.set_pinned(paths)
+        self._hold_scene_assets(scene.id or "", paths)
         self.timeline_engine.events = []
-        if scene.events:
-            self.timeline_engine.add_events(scene.events, self.scene_start_time, scene.id)
-
-        music_path = self.active_features.get("music")
-        if music_path:
-            cached = self.assets.get_music(music_path)
-            if cached and pygame:
-                try:
-                    pygame.mixer.music.load(cached)
-                    pygame.mixer.music.play(-1)
-                except pygame.error as exc:  # pragma: no cover - UI only
-                    print(f"Failed to play music '{music_path}': {exc}")
+        if activated.events:
+            self.timeline_engine.schedule_events(activated.events, None, scene.id)
+        self._play_music(activated.music)
 
+    @staticmethod
+    def scene_asset_paths(scene: Scene) -> list[str]:
+        """Images, sounds and music ``scene`` uses while it is active."""
+        assets = AssetManager.scene_assets(scene)
+        paths = assets["images"] + assets["sounds"] + assets["music"]
+        paths.extend(hs.mask for hs in scene.hotspots or [] if hs.mask)
+        return paths
+
+    def _hold_scene_assets(self, scene_id: str, paths: list[str]) -> None:
+        """Reference the active scene's assets and release the previous scene's."""
+        previous = self.held_scene
+        self.assets.acquire_scene(scene_id, paths)
+        self.held_scene = scene_id
+        if previous is None or previous == scene_id:
+            return
+        if self.prefetcher:
+            # the prefetcher releases it once it is no longer a neighbour
+            self.prefetcher.adopt(
+                previous, sorted(self.assets.scene_refs.get(previous, ()))
+            )
+        self.release_scene_assets(previous)
+
+    def release_scene_assets(
+        self, holder: str, scene_id: str | None = None
+    ) -> list[str]:
+        """Drop ``holder``'s asset references, unloading what nothing else uses.
+
+        Assets are only unloaded with ``unload_idle_scenes``; the pooled
+        activation of ``scene_id`` is discarded with them so its surfaces
+        are freed too.
+        """
+        released = self.assets.release_scene(holder, unload=self.unload_idle_scenes)
+        if released and self.unload_idle_scenes:
+            self.scene_pool.discard(scene_id or holder)
+        return released
+
+    def _build_activation(self, scene: Scene) -> ActivatedScene:
+        self.assets.preload_scene(scene)
+        features = scene.features or {}
+        music_path = features.get("music")
+        overlays = []
         for overlay_path in scene.overlays:
-            image = self.assets.get_image(overlay_path)
+            image = self.assets.get_scaled_image(overlay_path)
             if image:
-                self.overlays.append(image)
+                overlays.append(image)
+        background = (
+            self.assets.get_scaled_image(scene.background) if scene.background else None
+        )
+        layers = ([background] if background else []) + overlays
+        hotspots = scene.hotspots if scene.hotspots is not None else []
+        return ActivatedScene(
+            scene=scene,
+            overlays=overlays,
+            layers=layers,
+            hotspots=hotspots,
+            hotspot_index=self._build_hotspot_index(hotspots),
+            events=self.timeline_engine.parse_events(scene.events or []),
+            features=features,
+            music=self.assets.get_music(music_path) if music_path else None,
+        )
+
+    def _play_music(self, track: str | None) -> None:
+        if not track or not pygame:
+            return
+        if track == self.current_music:
+            try:
+                if pygame.mixer.music.get_busy():
+                    return
+            except pygame.error:  # pragma: no cover - mixer not initialised
+                pass
+        try:
+            pygame.mixer.music.load(self.assets.music_source(track), track)
+            pygame.mixer.music.play(-1)
+            self.current_music = track
+        except pygame.error as exc:  # pragma: no cover - UI only
+            print(f"Failed to play music '{track}': {exc}")
 
     # ------------------------------------------------------------------
     # Hotspot Actions
     # ------------------------------------------------------------------
+    def hotspots_at(self, pos) -> list[Hotspot]:
+        """Return the active hotspots under ``pos`` in declaration order.
+
+        The numpy index keeps hotspot conditions in its ``active`` mask,
+        refreshed only when game flags change, so the query filters them.
+        """
+        index = self.hotspot_index
+        if isinstance(index, HotspotArrayIndex) and index.hotspots is self.hotspots:
+            index.sync_active(self.game_state)
+            return index.query(pos, active_only=True)
+        if isinstance(index, ShapedHotspotIndex) and index.hotspots is self.hotspots:
+            candidates = index.query(pos, self.game_state)
+        elif index is not None and index.hotspots is self.hotspots:
+            candidates = index.query(pos)
+        else:
+            candidates = [hs for hs in self.hotspots if hs.check_click(pos)]
+        return [hs for hs in candidates if hs.is_active(self.game_state)]
+
+    def handle_click(self, pos) -> None:
+        """Trigger every active hotspot under ``pos``."""
+        for hs in self.hotspots_at(pos):
+            hs.trigger(self)
+
+    def refresh_hotspot_index(self) -> None:
+        """Rebuild :attr:`hotspot_index` after hotspots were edited in place."""
+        shaped = any(hs.shaped for hs in self.hotspots)
+        if self.hotspot_index is not None and shaped == isinstance(
+            self.hotspot_index, ShapedHotspotIndex
+        ):
+            self.hotspot_index.rebuild()
+            return
+        self.hotspot_index = self._build_hotspot_index(self.hotspots)
+        if self.current_scene is not None and self.current_scene.id:
+            self.scene_pool.discard(self.current_scene.id)
+
+    def _build_hotspot_index(self, hotspots: list[Hotspot]) -> HotspotIndex:
+        return build_hotspot_index(
+            hotspots,
+            self.hotspot_backend,
+            self.hotspot_cell_size,
+            size=self.view_size(),
+            scale=self.hotspot_id_scale,
+            mask_loader=self._load_hotspot_mask,
+        )
+
+    def _load_hotspot_mask(self, path: str):
+        image = self.assets.get_image(path)
+        if image is None or not pygame:
+            return None
+        return pygame.mask.from_surface(image)
+
     def scene_path_from_id(self, scene_id: str) -> str:
         return os.path.join(self.scenes_dir, f"{scene_id}.yaml")
 
-    def open_scene(self, path: str) -> None:
-        """Load another scene from ``path`` or scene id and activate it."""
+    def resolve_scene_path(self, path: str) -> tuple[str, str]:
+        """Return the file path and scene id for a scene path or id."""
         if not os.path.exists(path):
             path = self.scene_path_from_id(path)
-            self.current_scene_id = os.path.splitext(os.path.basename(path))[0]
-        else:
-            self.current_scene_id = os.path.splitext(os.path.basename(path))[0]
+        return path, os.path.splitext(os.path.basename(path))[0]
+
+    def open_scene(self, path: str) -> None:
+        """Load another scene from ``path`` or scene id and activate it.
+
+        When :attr:`transition` is set the load happens off-thread and the
+        scene is activated by a later :meth:`SceneTransition.poll`.
+        """
+        if self.transition:
+            self.transition.request(path)
+            return
+        self.enter_scene(self.prepare_scene(path))
+
+    def prepare_scene(self, path: str) -> PreparedScene:
+        """Parse a scene and decode its images and sounds.
+
+        Safe to call from a worker thread: files are only read and decoded
+        here (see :meth:`AssetManager.request_scene_assets`). Display
+        conversion, scaling and caching happen in :meth:`enter_scene`, and
+        music is left for :meth:`activate_scene` so the playing track is not
+        interrupted.
+        """
+        path, scene_id = self.resolve_scene_path(path)
         scene = self.load_scene(path)
+        handles = self.assets.request_scene_assets(scene)
+        for handle in handles:
+            if handle.future is not None:
+                handle.future.exception()
+        return PreparedScene(path=path, scene_id=scene_id, scene=scene, handles=handles)
+
+    def enter_scene(self, prepared: PreparedScene) -> None:
+        """Make a prepared scene current. Must run on the main thread."""
+        scene = prepared.scene
+        self.current_scene_id = prepared.scene_id
         self.current_scene = scene
         if scene.id and scene.id not in self.game_state.unlocked_scenes:
             self.game_state.unlocked_scenes.append(scene.id)
             self.game_state.save()
         self.activate_scene(scene)
+        if self.prefetcher:
+            self.prefetcher.schedule(self.current_scene_id)
 
     def teleport(self, region_id: str, scene_id: str | None = None) -> None:
         if not self.world_manager:
@@ -185,41 +481,131 @@ class SceneManager:
         self.game_state.toggle_flag(flag)
         self.game_state.save()
 
-    def run(self):
-        clock = pygame.time.Clock()
+    # ------------------------------------------------------------------
+    # Simulation
+    # ------------------------------------------------------------------
+    def update(self, dt: float) -> None:
+        """Advance the simulation by ``dt`` seconds."""
+        self.clock_ms += dt * 1000.0
+        self.timeline_engine.advance(dt, self.current_scene_id)
+        self.dialogue_engine.update(dt)
+        self.puzzle_manager.update(dt)
+
+        if self.active_features.get("time_loop"):
+            duration = self.active_features.get("time_loop")
+            if isinstance(duration, bool):
+                duration = 5000  # Default duration when True
+            try:
+                duration = int(duration)
+            except (TypeError, ValueError):
+                duration = 5000
+
+            if self.clock_ms - self.scene_start_time >= duration:
+                self.activate_scene(self.current_scene)
+
+    def view_size(self) -> tuple[int, int] | None:
+        """Size of the surface scenes are drawn on (logical or window size)."""
+        if self.logical_size:
+            return self.logical_size
+        return self.screen.get_size() if self.screen is not None else None
+
+    def create_renderer(
+        self, dirty_rects: bool | None = None, scale_mode: str | None = None
+    ) -> Renderer:
+        """Build the :class:`Renderer` for the ``renderer`` and ``window`` config.
+
+        The logical size is always :attr:`logical_size`, the space hotspots
+        are indexed in; ``dirty_rects`` and ``scale_mode`` override the config.
+        """
+        render_cfg = self.config.get("renderer") or {}
+        window_cfg = self.config.get("window") or {}
+        if dirty_rects is None:
+            dirty_rects = bool(render_cfg.get("dirty_rects", False))
+        return Renderer(
+            self.screen,
+            dirty_rects=dirty_rects,
+            clear_color=(30, 30, 30),  # Dark background
+            logical_size=self.logical_size,
+            scale_mode=scale_mode or window_cfg.get("scale_mode", "smooth"),
+        )
+
+    def create_scheduler(
+        self,
+        target_fps: int | None = None,
+        performance: PerformanceManager | None = None,
+    ) -> FrameScheduler:
+        """Build the :class:`FrameScheduler` described by the ``frame`` config.
+
+        ``performance`` replaces :attr:`performance_manager` as the source of
+        the frame cap; ``target_fps`` replaces ``frame.target_fps``.
+        """
+        frame_cfg = self.config.get("frame") or {}
+        if target_fps is None:
+            target_fps = int(frame_cfg.get("target_fps", 60))
+        return FrameScheduler(
+            step=1.0 / float(frame_cfg.get("update_rate", 60)),
+            target_fps=target_fps,
+            max_steps=int(frame_cfg.get("max_steps", 5)),
+            max_frame_skip=int(frame_cfg.get("max_frame_skip", 2)),
+            performance=performance or self.performance_manager,
+            clock=pygame.time.Clock(),
+        )
+
+    def run(self, max_frames: int | None = None) -> int:
+        """Run the main loop and return the number of frames rendered.
+
+        ``max_frames`` stops the loop after that many frames, for headless
+        runs and benchmarks. With ``async_transitions`` (the default) scenes
+        opened while the loop runs are prepared off-thread by a
+        :class:`SceneTransition` and clicks are ignored until they are ready.
+        """
+        scheduler = self.create_scheduler()
+        renderer = self.create_renderer()
+        owns_transition = self.transition is None and bool(
+            self.config.get("async_transitions", True)
+        )
+        if owns_transition:
+            self.transition = SceneTransition(
+                self, show_overlay=bool(self.config.get("transition_overlay", True))
+            )
+        transition = self.transition
         while self.running:
+            if max_frames is not None and scheduler.frames >= max_frames:
+                break
+            timing = scheduler.tick()
+            if transition:
+                transition.poll()
+            if self.hot_reloader:
+                self.hot_reloader.poll()
+            self.assets.process_pending(self.asset_budget_ms)
+            if self.prefetcher:
+                self.prefetcher.process_releases()
+            loading = bool(transition and transition.loading)
             for event in pygame.event.get():
+                if self.prefetcher and event.type != pygame.ACTIVEEVENT:
+                    self.prefetcher.notify_activity()
                 if event.type == pygame.QUIT:
                     self.running = False
-                if self.dialogue_engine.active:
-                    self.dialogue_engine.handle_event(event)
+                if self.dialogue_engine.is_active():
+                    self.dialogue_engine.handle_input(event)
+                    continue
+                if loading:
                     continue
                 if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-                    for hs in self.hotspots:
-                        if not hs.is_active(self.game_state):
-                            continue
-                        if hs.check_click(event.pos):
-                            hs.trigger(self)
-
-            self.screen.fill((30, 30, 30))  # Dark background
-
-            for overlay in self.overlays:
-                self.screen.blit(overlay, (0, 0))
-
-            self.timeline_engine.update(pygame.time.get_ticks(), self.current_scene_id)
-
-            if self.active_features.get("time_loop"):
-                duration = self.active_features.get("time_loop")
-                if isinstance(duration, bool):
-                    duration = 5000  # Default duration when True
-                try:
-                    duration = int(duration)
-                except (TypeError, ValueError):
-                    duration = 5000
-
-                if pygame.time.get_ticks() - self.scene_start_time >= duration:
-                    self.activate_scene(self.current_scene)
-
-            self.dialogue_engine.draw(self.screen)
-            pygame.display.flip()
-            clock.tick(60)
+                    self.handle_click(renderer.to_logical(event.pos))
+
+            for _ in range(timing.steps):
+                self.update(scheduler.step)
+            if not timing.render:
+                continue
+
+            renderer.begin_frame(self.static_layers, self.current_scene_id)
+            self.dialogue_engine.draw(renderer.target)
+            if transition:
+                transition.draw_overlay(renderer.target)
+            renderer.end_frame()
+
+        if owns_transition and transition:
+            transition.shutdown()
+            self.transition = None
+        return renderer.frames
@@ -0,0 +1,70 @@
+"""Pool of activated scene snapshots reused across activations."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+from .hotspot import Hotspot
+from .hotspot_index import HotspotIndex
+from .scene import Scene
+from .timeline_engine import TimelineEvent
+
+
+@dataclass
+class ActivatedScene:
+    """Everything :meth:`SceneManager.activate_scene` derives from a scene."""
+
+    scene: Scene
+    overlays: List[Any] = field(default_factory=list)
+    layers: List[Any] = field(default_factory=list)
+    hotspots: List[Hotspot] = field(default_factory=list)
+    hotspot_index: Optional[HotspotIndex] = None
+    events: List[TimelineEvent] = field(default_factory=list)
+    features: Dict[str, Any] = field(default_factory=dict)
+    music: Optional[str] = None
+
+
+class ActivatedScenePool:
+    """Keep the most recently activated scenes ready for an instant rewind.
+
+    Entries are tied to the :class:`Scene` object they were built from, so a
+    scene reloaded from a changed file never reuses a stale snapshot.
+    """
+
+    def __init__(self, max_size: int = 8) -> None:
+        self.max_size = max(1, int(max_size))
+        self._entries: "OrderedDict[str, ActivatedScene]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _key(scene: Scene) -> str:
+        return scene.id or f"@{id(scene)}"
+
+    def get(self, scene: Scene) -> Optional[ActivatedScene]:
+        key = self._key(scene)
+        entry = self._entries.get(key)
+        if entry is None or entry.scene is not scene:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry
+
+    def put(self, activated: ActivatedScene) -> None:
+        key = self._key(activated.scene)
+        self._entries[key] = activated
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def discard(self, scene_id: str) -> None:
+        self._entries.pop(scene_id, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
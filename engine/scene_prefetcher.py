@@ -0,0 +1,288 @@
+"""Background prefetching of scenes reachable from the active scene."""
+
+from __future__ import annotations
+
+import logging
+import queue
+import threading
+import time
+from typing import TYPE_CHECKING, Dict, List, Optional, Set, Tuple
+
+from .asset_manager import AssetManager, sound_bytes, surface_bytes
+from .asset_requests import AssetHandle
+from .scene import Scene
+
+if TYPE_CHECKING:  # pragma: no cover - only for type hints
+    from .scene_manager import SceneManager
+
+logger = logging.getLogger(__name__)
+
+
+class ScenePrefetcher:
+    """Parse and warm assets for neighbouring scenes on a worker thread.
+
+    Edges of the scene graph come from ``open_scene`` and ``teleport``
+    hotspot targets (plus ``goto_scene`` timeline events). Teleports that
+    only name a region resolve to that region's entry scene through the
+    :class:`WorldManager`. Work only starts once the player has been idle
+    for ``idle_delay`` seconds, and assets stop being warmed once
+    ``memory_budget_mb`` worth of pixels has been prefetched.
+
+    Each prefetched scene holds asset references under :meth:`holder`, so
+    its assets survive the active scene being left. When the neighbourhood
+    changes, scenes that are no longer reachable are queued, and
+    :meth:`process_releases` (called once per frame on the main thread)
+    releases their references through :meth:`SceneManager.release_scene_assets`.
+    """
+
+    HOLDER_PREFIX = "prefetch:"
+
+    def __init__(
+        self,
+        scene_manager: "SceneManager",
+        depth: int = 1,
+        memory_budget_mb: float = 64.0,
+        idle_delay: float = 0.25,
+    ) -> None:
+        self.scene_manager = scene_manager
+        self.depth = max(0, int(depth))
+        self.memory_budget = int(float(memory_budget_mb) * 1024 * 1024)
+        self.idle_delay = float(idle_delay)
+        self.graph: Dict[str, Set[str]] = {}
+        self.prefetched: Dict[str, int] = {}
+        # scenes whose assets are referenced by the prefetcher
+        self.holding: Set[str] = set()
+        self.bytes_used = 0
+        self._queue: "queue.Queue[Tuple[int, str]]" = queue.Queue()
+        # scenes dropped from the neighbourhood, released by the main thread
+        self._releases: "queue.Queue[str]" = queue.Queue()
+        self._generation = 0
+        self._last_activity = 0.0
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._running = False
+
+    # ------------------------------------------------------------------
+    # Graph helpers
+    # ------------------------------------------------------------------
+    def _resolve_target(self, action: str, target: Optional[str]) -> Optional[str]:
+        if not target:
+            return None
+        if action == "teleport":
+            region_id, _, scene_id = target.partition(":")
+            if scene_id:
+                return scene_id
+            world = getattr(self.scene_manager.world_manager, "world", None)
+            region = world.regions.get(region_id) if world else None
+            if not region:
+                return None
+            return region.entry_scene or (region.scenes[0] if region.scenes else None)
+        return self.scene_manager.resolve_scene_path(target)[1]
+
+    def neighbours(self, scene: Scene) -> Set[str]:
+        """Return the ids of scenes directly reachable from ``scene``."""
+        targets: Set[str] = set()
+        for hs in scene.hotspots:
+            if hs.action in {"open_scene", "teleport"}:
+                scene_id = self._resolve_target(hs.action, hs.target)
+                if scene_id:
+                    targets.add(scene_id)
+        for event in scene.events:
+            if isinstance(event, dict) and event.get("action") == "goto_scene":
+                params = event.get("params") or {}
+                scene_id = self._resolve_target("open_scene", params.get("scene"))
+                if scene_id:
+                    targets.add(scene_id)
+        return targets
+
+    def _load(self, scene_id: str) -> Optional[Scene]:
+        path, _ = self.scene_manager.resolve_scene_path(scene_id)
+        try:
+            scene = self.scene_manager.load_scene(path)
+        except (OSError, ValueError) as exc:
+            logger.debug("Skipping prefetch of '%s': %s", scene_id, exc)
+            return None
+        with self._lock:
+            self.graph[scene_id] = self.neighbours(scene)
+        return scene
+
+    def reachable(self, scene_id: str) -> List[str]:
+        """Return scenes within ``depth`` hops of ``scene_id`` in BFS order."""
+        seen = {scene_id}
+        order: List[str] = []
+        frontier = [scene_id]
+        for _ in range(self.depth):
+            next_frontier: List[str] = []
+            for current in frontier:
+                if current not in self.graph and self._load(current) is None:
+                    continue
+                for target in sorted(self.graph.get(current, ())):
+                    if target not in seen:
+                        seen.add(target)
+                        order.append(target)
+                        next_frontier.append(target)
+            frontier = next_frontier
+        return order
+
+    # ------------------------------------------------------------------
+    # Prefetching
+    # ------------------------------------------------------------------
+    def prefetch_scene(self, scene_id: str) -> bool:
+        """Parse ``scene_id`` and decode its images and sounds.
+
+        Assets go through :meth:`AssetManager.request_image` and
+        :meth:`~AssetManager.request_sound`, so this thread only reads and
+        decodes files; :meth:`AssetManager.process_pending` converts and
+        caches them on the main thread. Only assets that were not cached
+        yet count towards the budget, which is checked after every asset.
+        Returns ``False`` when the scene is missing or the budget is used up.
+
+        Music is left alone because loading it would interrupt the track
+        that is currently playing.
+        """
+        if scene_id in self.prefetched:
+            return True
+        scene = self._load(scene_id)
+        if scene is None or self.bytes_used >= self.memory_budget:
+            return False
+        assets = self.scene_manager.assets
+        paths = AssetManager.scene_assets(scene)
+        requests = [(assets.request_image, path) for path in paths["images"]]
+        requests += [(assets.request_sound, path) for path in paths["sounds"]]
+        used = 0
+        requested: List[str] = []
+        for request, path in requests:
+            used += self._new_bytes(request(path))
+            requested.append(path)
+            if self.bytes_used + used >= self.memory_budget:
+                break
+        with self._lock:
+            assets.acquire_scene(self.holder(scene_id), requested)
+            self.holding.add(scene_id)
+            self.prefetched[scene_id] = used
+            self.bytes_used += used
+        logger.debug("Prefetched scene '%s' (%d bytes)", scene_id, used)
+        return True
+
+    @staticmethod
+    def _new_bytes(handle: AssetHandle) -> int:
+        """Wait for ``handle`` to decode and return its size if it was not cached."""
+        if handle.future is None:
+            return 0
+        try:
+            value = handle.future.result()
+        except Exception:
+            return 0
+        if handle.key[0] == "sound":
+            return sound_bytes(value)
+        return surface_bytes(value)
+
+    def schedule(self, scene_id: str) -> None:
+        """Queue the neighbourhood of ``scene_id`` for background prefetch."""
+        with self._lock:
+            self._generation += 1
+            generation = self._generation
+            self.prefetched.clear()
+            self.bytes_used = 0
+        self._queue.put((generation, scene_id))
+        self._ensure_worker()
+
+    def forget(self, scene_id: str) -> None:
+        """Drop the cached exits of ``scene_id`` so they are read again."""
+        with self._lock:
+            self.graph.pop(scene_id, None)
+
+    @classmethod
+    def holder(cls, scene_id: str) -> str:
+        """Name under which prefetched ``scene_id`` holds asset references."""
+        return cls.HOLDER_PREFIX + scene_id
+
+    def adopt(self, scene_id: str, paths: List[str]) -> None:
+        """Keep a scene that was just left referenced until it is out of reach."""
+        with self._lock:
+            self.scene_manager.assets.acquire_scene(self.holder(scene_id), paths)
+            self.holding.add(scene_id)
+
+    def release_unreachable(self, keep: Set[str]) -> None:
+        """Queue the held scenes not in ``keep`` for :meth:`process_releases`.
+
+        Called from the worker thread; unloading assets is left to the main
+        thread because the loop may be drawing them.
+        """
+        with self._lock:
+            stale = sorted(self.holding - keep)
+            self.holding -= set(stale)
+        for scene_id in stale:
+            self._releases.put(scene_id)
+
+    def process_releases(self) -> int:
+        """Release queued scenes on the main thread; returns how many were released.
+
+        Scenes prefetched again since they were queued are kept.
+        """
+        count = 0
+        while True:
+            try:
+                scene_id = self._releases.get_nowait()
+            except queue.Empty:
+                return count
+            with self._lock:
+                if scene_id in self.holding:
+                    continue
+                self.scene_manager.release_scene_assets(self.holder(scene_id), scene_id)
+            count += 1
+
+    def notify_activity(self) -> None:
+        """Mark the player as busy so prefetching backs off."""
+        self._last_activity = time.monotonic()
+
+    def is_prefetched(self, scene_id: str) -> bool:
+        return scene_id in self.prefetched
+
+    # ------------------------------------------------------------------
+    # Worker thread
+    # ------------------------------------------------------------------
+    def _ensure_worker(self) -> None:
+        if self._thread and self._thread.is_alive():
+            return
+        self._running = True
+        self._thread = threading.Thread(
+            target=self._worker, name="scene-prefetch", daemon=True
+        )
+        self._thread.start()
+
+    def _stale(self, generation: int) -> bool:
+        return generation != self._generation or not self._running
+
+    def _wait_for_idle(self, generation: int) -> bool:
+        while not self._stale(generation):
+            idle_for = time.monotonic() - self._last_activity
+            if idle_for >= self.idle_delay:
+                return True
+            time.sleep(self.idle_delay - idle_for)
+        return False
+
+    def _worker(self) -> None:
+        while self._running:
+            generation, scene_id = self._queue.get()
+            if not self._wait_for_idle(generation):
+                continue
+            try:
+                targets = self.reachable(scene_id)
+                if not self._stale(generation):
+                    self.release_unreachable(set(targets) | {scene_id})
+                for target in targets:
+                    if not self._wait_for_idle(generation):
+                        break
+                    if self.bytes_used >= self.memory_budget:
+                        break
+                    self.prefetch_scene(target)
+            except Exception as exc:  # pragma: no cover - defensive
+                logger.error("Scene prefetch failed: %s", exc)
+
+    def stop(self) -> None:
+        """Stop the worker thread after its current scene."""
+        self._running = False
+        with self._lock:
+            self._generation += 1
+        self._queue.put((self._generation, ""))
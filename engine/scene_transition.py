@@ -0,0 +1,130 @@
+"""Asynchronous scene transitions for the main loop."""
+
+from __future__ import annotations
+
+import logging
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, List, Optional, Tuple
+
+try:  # pragma: no cover - allow running tests without pygame
+    import pygame
+except Exception:  # pragma: no cover - allow running tests without pygame
+    pygame = None
+
+from .asset_requests import AssetHandle
+from .scene import Scene
+
+if TYPE_CHECKING:  # pragma: no cover - only for type hints
+    from .scene_manager import SceneManager
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class PreparedScene:
+    """A scene that has been parsed and had its assets decoded.
+
+    ``handles`` are the decode requests for its images and sounds; they are
+    converted and cached on the main thread when the scene is entered.
+    """
+
+    path: str
+    scene_id: str
+    scene: Scene
+    handles: List[AssetHandle] = field(default_factory=list)
+
+
+class SceneTransition:
+    """Prepare scenes on a worker thread and activate them on the main thread.
+
+    :meth:`request` hands the parse and asset decode to a single worker so
+    the loop keeps ticking. :meth:`poll` must be called once per frame from
+    the main thread; it swaps the finished scene in through
+    :meth:`SceneManager.enter_scene` in one step, which is also where the
+    decoded images are converted to the display format and scaled. When several requests
+    arrive while loading, only the most recent one is activated.
+    """
+
+    def __init__(
+        self,
+        scene_manager: "SceneManager",
+        show_overlay: bool = True,
+        overlay_delay_ms: int = 150,
+        overlay_color: Tuple[int, int, int, int] = (0, 0, 0, 160),
+    ) -> None:
+        self.scene_manager = scene_manager
+        self.show_overlay = show_overlay
+        self.overlay_delay = overlay_delay_ms / 1000.0
+        self.overlay_color = overlay_color
+        self.pending_target: Optional[str] = None
+        self._pending: Optional[Future] = None
+        self._started_at = 0.0
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="scene-load"
+        )
+        self._overlay_surface: Optional["pygame.Surface"] = None
+
+    # ------------------------------------------------------------------
+    # Requests
+    # ------------------------------------------------------------------
+    @property
+    def loading(self) -> bool:
+        return self._pending is not None
+
+    def request(self, path: str) -> None:
+        """Start preparing the scene at ``path`` (or scene id) off-thread."""
+        if self._pending:
+            self._pending.cancel()
+        self.pending_target = path
+        self._started_at = time.monotonic()
+        self._pending = self._executor.submit(self.scene_manager.prepare_scene, path)
+
+    def poll(self) -> bool:
+        """Activate the pending scene if it is ready. Returns ``True`` if so."""
+        future = self._pending
+        if not future or not future.done():
+            return False
+        self._pending = None
+        self.pending_target = None
+        try:
+            prepared = future.result()
+        except Exception as exc:
+            logger.error("Scene transition failed: %s", exc)
+            return False
+        self.scene_manager.enter_scene(prepared)
+        return True
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Block until the pending scene is ready and activate it."""
+        if self._pending:
+            try:
+                self._pending.exception(timeout)
+            except Exception:
+                return False
+        return self.poll()
+
+    # ------------------------------------------------------------------
+    # Rendering
+    # ------------------------------------------------------------------
+    def draw_overlay(
+        self, surface: "pygame.Surface"
+    ) -> None:  # pragma: no cover - UI only
+        """Dim the screen while a slow transition is in flight."""
+        if not pygame or not self.show_overlay or not self.loading:
+            return
+        if time.monotonic() - self._started_at < self.overlay_delay:
+            return
+        size = surface.get_size()
+        if not self._overlay_surface or self._overlay_surface.get_size() != size:
+            self._overlay_surface = pygame.Surface(size, pygame.SRCALPHA)
+            self._overlay_surface.fill(self.overlay_color)
+        surface.blit(self._overlay_surface, (0, 0))
+
+    def shutdown(self) -> None:
+        """Stop the worker thread, dropping any pending transition."""
+        if self._pending:
+            self._pending.cancel()
+            self._pending = None
+        self._executor.shutdown(wait=False)
@@ -0,0 +1,162 @@
+"""Word wrapping and incremental (typewriter) text rendering."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+
+try:
+    import pygame  # type: ignore
+except Exception:  # pragma: no cover - allow running tests without pygame
+    pygame = None
+
+Color = Tuple[int, ...]
+
+
+class WordWidths:
+    """Cache of ``font.size(word)`` widths, kept per font."""
+
+    def __init__(self) -> None:
+        self._widths: Dict[Any, Dict[str, int]] = {}
+
+    def width(self, font: "pygame.font.Font", word: str) -> int:
+        widths = self._widths.setdefault(font, {})
+        value = widths.get(word)
+        if value is None:
+            value = widths[word] = font.size(word)[0]
+        return value
+
+    def clear(self) -> None:
+        self._widths.clear()
+
+
+def wrap_text(
+    text: str, font: "pygame.font.Font", max_width: int, widths: WordWidths
+) -> List[str]:
+    """Split ``text`` into lines no wider than ``max_width``.
+
+    Lines break at spaces and explicit newlines; a word wider than a whole
+    line is broken between characters.
+    """
+    space = widths.width(font, " ")
+    lines: List[str] = []
+    for paragraph in text.split("\n"):
+        current: List[str] = []
+        current_width = 0
+        for word in paragraph.split(" "):
+            word_width = widths.width(font, word)
+            if current and current_width + space + word_width > max_width:
+                lines.append(" ".join(current))
+                current, current_width = [], 0
+            if word_width > max_width:
+                while len(word) > 1 and font.size(word)[0] > max_width:
+                    cut = len(word) - 1
+                    while cut > 1 and font.size(word[:cut])[0] > max_width:
+                        cut -= 1
+                    lines.append(word[:cut])
+                    word = word[cut:]
+                word_width = widths.width(font, word)
+            current_width += (space if current else 0) + word_width
+            current.append(word)
+        lines.append(" ".join(current))
+    return lines
+
+
+class RevealedText:
+    """A wrapped text block revealed a few characters at a time.
+
+    Text is laid out once. :meth:`reveal_to` renders only the characters
+    revealed since the previous call, as one glyph run per affected line,
+    onto a persistent canvas, so a typewriter effect costs O(new
+    characters) per frame and a fully revealed block costs one blit.
+    """
+
+    def __init__(
+        self,
+        text: str,
+        font: "pygame.font.Font",
+        color: Color,
+        max_width: int,
+        widths: Optional[WordWidths] = None,
+    ) -> None:
+        self.font = font
+        self.color = color
+        self.lines = wrap_text(text, font, max_width, widths or WordWidths())
+        self.line_height = font.get_linesize()
+        # character offset of each line start; line breaks count as one char
+        self.offsets: List[int] = []
+        total = 0
+        for line in self.lines:
+            self.offsets.append(total)
+            total += len(line) + 1
+        self.length = max(total - 1, 0)
+        width = max([font.size(line)[0] for line in self.lines] + [1])
+        self.size = (width, max(self.line_height * len(self.lines), 1))
+        self.canvas: Optional["pygame.Surface"] = None
+        self.revealed = 0
+
+    @property
+    def complete(self) -> bool:
+        return self.revealed >= self.length
+
+    def _reset(self) -> None:
+        self.canvas = pygame.Surface(self.size, pygame.SRCALPHA)
+        self.revealed = 0
+
+    def reveal_to(self, count: Optional[int] = None) -> None:
+        """Render characters up to ``count`` (everything when ``None``)."""
+        target = self.length if count is None else max(0, min(int(count), self.length))
+        if self.canvas is None or target < self.revealed:
+            self._reset()
+        if target == self.revealed:
+            return
+        for idx, line in enumerate(self.lines):
+            start = self.offsets[idx]
+            end = start + len(line)
+            if end <= self.revealed or not line:
+                continue
+            if start >= target:
+                break
+            first = max(self.revealed - start, 0)
+            last = min(target - start, len(line))
+            piece = line[first:last]
+            if piece.strip():
+                x = self.font.size(line[:first])[0] if first else 0
+                run = self.font.render(piece, True, self.color)
+                self.canvas.blit(run, (x, idx * self.line_height))
+        self.revealed = target
+
+    def draw(self, surface: "pygame.Surface", position: Tuple[int, int]) -> None:
+        if self.canvas is None:
+            self.reveal_to(self.revealed)
+        surface.blit(self.canvas, position)
+
+
+class TextLayoutCache:
+    """LRU of :class:`RevealedText` blocks keyed by text, font, colour and width."""
+
+    def __init__(self, max_entries: int = 32) -> None:
+        self.max_entries = max(1, int(max_entries))
+        self.widths = WordWidths()
+        self._blocks: "OrderedDict[Hashable, RevealedText]" = OrderedDict()
+
+    def get(
+        self, text: str, font: "pygame.font.Font", color: Color, max_width: int
+    ) -> RevealedText:
+        key = (text, font, tuple(color), int(max_width))
+        block = self._blocks.get(key)
+        if block is None:
+            block = RevealedText(text, font, color, max_width, self.widths)
+            self._blocks[key] = block
+            if len(self._blocks) > self.max_entries:
+                self._blocks.popitem(last=False)
+        else:
+            self._blocks.move_to_end(key)
+        return block
+
+    def clear(self) -> None:
+        self._blocks.clear()
+        self.widths.clear()
+
+    def __len__(self) -> int:
+        return len(self._blocks)
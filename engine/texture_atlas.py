@@ -0,0 +1,206 @@
+"""Pack small images (icons, UI sprites) into shared atlas pages."""
+
+from __future__ import annotations
+
+import json
+import os
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple
+
+try:
+    import pygame  # type: ignore
+except Exception:  # pragma: no cover - allow running tests without pygame
+    pygame = None
+
+INDEX_VERSION = 1
+
+
+@dataclass(frozen=True)
+class AtlasRegion:
+    """Where one image lives inside an atlas: page number and pixel rect."""
+
+    page: int
+    x: int
+    y: int
+    width: int
+    height: int
+
+    @property
+    def rect(self) -> Tuple[int, int, int, int]:
+        return (self.x, self.y, self.width, self.height)
+
+
+class ShelfPacker:
+    """Place rectangles on horizontal shelves of a fixed-size page.
+
+    Each rectangle goes on the shelf that wastes the least height; a new
+    shelf is opened below the last one when none fits. Feeding rectangles
+    tallest first keeps shelves tight.
+    """
+
+    def __init__(self, width: int, height: int, padding: int = 1) -> None:
+        self.width = int(width)
+        self.height = int(height)
+        self.padding = max(0, int(padding))
+        # [top, shelf height, next free x]
+        self.shelves: List[List[int]] = []
+        self.used_height = 0
+
+    def insert(self, width: int, height: int) -> Optional[Tuple[int, int]]:
+        """Reserve ``width`` x ``height`` and return its top-left, or ``None``."""
+        w = width + self.padding
+        h = height + self.padding
+        best = None
+        for shelf in self.shelves:
+            if h <= shelf[1] and shelf[2] + w <= self.width + self.padding:
+                if best is None or shelf[1] < best[1]:
+                    best = shelf
+        if best is None:
+            top = self.used_height
+            if top + h > self.height + self.padding or w > self.width + self.padding:
+                return None
+            best = [top, h, 0]
+            self.shelves.append(best)
+            self.used_height = top + h
+        position = (best[2], best[0])
+        best[2] += w
+        return position
+
+
+def pack(
+    sizes: Mapping[str, Tuple[int, int]], page_size: int = 1024, padding: int = 1
+) -> Tuple[Dict[str, AtlasRegion], List[Tuple[int, int]]]:
+    """Assign every entry of ``sizes`` a region on as few pages as needed.
+
+    Returns the regions and the size of each page, trimmed to the height
+    actually used. Entries larger than a page raise :class:`ValueError`.
+    """
+    order = sorted(sizes, key=lambda key: (-sizes[key][1], -sizes[key][0], key))
+    packers: List[ShelfPacker] = []
+    regions: Dict[str, AtlasRegion] = {}
+    for key in order:
+        width, height = sizes[key]
+        if width > page_size or height > page_size:
+            raise ValueError(
+                f"{key} ({width}x{height}) does not fit a {page_size} page"
+            )
+        for page, packer in enumerate(packers):
+            position = packer.insert(width, height)
+            if position is not None:
+                break
+        else:
+            packers.append(ShelfPacker(page_size, page_size, padding))
+            page = len(packers) - 1
+            position = packers[page].insert(width, height)
+        regions[key] = AtlasRegion(page, position[0], position[1], width, height)
+    page_sizes = [
+        (page_size, max(1, min(page_size, packer.used_height))) for packer in packers
+    ]
+    return regions, page_sizes
+
+
+class TextureAtlas:
+    """A set of page surfaces plus the region of every packed image.
+
+    :meth:`get` hands out subsurfaces of the pages, so callers blit them
+    like any other image while all packed images share a few allocations.
+    """
+
+    def __init__(
+        self, pages: List["pygame.Surface"], regions: Dict[str, AtlasRegion]
+    ) -> None:
+        self.pages = pages
+        self.regions = regions
+        self._subsurfaces: Dict[str, "pygame.Surface"] = {}
+
+    @classmethod
+    def build(
+        cls,
+        images: Mapping[str, "pygame.Surface"],
+        page_size: int = 1024,
+        padding: int = 1,
+    ) -> "TextureAtlas":
+        """Pack ``images`` (key -> surface) into new page surfaces."""
+        sizes = {key: surf.get_size() for key, surf in images.items()}
+        regions, page_sizes = pack(sizes, page_size, padding)
+        pages = [pygame.Surface(size, pygame.SRCALPHA) for size in page_sizes]
+        for page in pages:
+            page.fill((0, 0, 0, 0))
+        for key, region in regions.items():
+            pages[region.page].blit(images[key], (region.x, region.y))
+        if pygame.display.get_surface() is not None:
+            pages = [page.convert_alpha() for page in pages]
+        return cls(pages, regions)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.regions
+
+    def __len__(self) -> int:
+        return len(self.regions)
+
+    def keys(self) -> Iterable[str]:
+        return self.regions.keys()
+
+    def get(self, key: str) -> Optional["pygame.Surface"]:
+        """Return the packed image ``key`` as a subsurface of its page."""
+        surf = self._subsurfaces.get(key)
+        if surf is None:
+            region = self.regions.get(key)
+            if region is None:
+                return None
+            surf = self.pages[region.page].subsurface(region.rect)
+            self._subsurfaces[key] = surf
+        return surf
+
+    def source(
+        self, key: str
+    ) -> Optional[Tuple["pygame.Surface", Tuple[int, int, int, int]]]:
+        """Return ``(page, rect)`` for ``surface.blit(page, dest, rect)``."""
+        region = self.regions.get(key)
+        if region is None:
+            return None
+        return self.pages[region.page], region.rect
+
+    # ------------------------------------------------------------------
+    # Offline atlases
+    # ------------------------------------------------------------------
+    def save(self, index_path: str) -> None:
+        """Write the pages as PNGs next to a JSON index at ``index_path``."""
+        folder = os.path.dirname(os.path.abspath(index_path))
+        stem = os.path.splitext(os.path.basename(index_path))[0]
+        os.makedirs(folder, exist_ok=True)
+        page_files = []
+        for idx, page in enumerate(self.pages):
+            name = f"{stem}_{idx}.png"
+            pygame.image.save(page, os.path.join(folder, name))
+            page_files.append(name)
+        index = {
+            "version": INDEX_VERSION,
+            "pages": page_files,
+            "regions": {
+                key: [r.page, r.x, r.y, r.width, r.height]
+                for key, r in sorted(self.regions.items())
+            },
+        }
+        with open(index_path, "w", encoding="utf-8") as fh:
+            json.dump(index, fh, indent=1)
+
+    @classmethod
+    def load(cls, index_path: str) -> "TextureAtlas":
+        """Load an atlas written by :meth:`save`."""
+        with open(index_path, "r", encoding="utf-8") as fh:
+            index = json.load(fh)
+        if index.get("version") != INDEX_VERSION:
+            raise ValueError(f"Unsupported atlas index version in {index_path}")
+        folder = os.path.dirname(os.path.abspath(index_path))
+        pages = []
+        for name in index["pages"]:
+            page = pygame.image.load(os.path.join(folder, name))
+            if pygame.display.get_surface() is not None:
+                page = page.convert_alpha()
+            pages.append(page)
+        regions = {
+            os.path.normpath(key): AtlasRegion(*value)
+            for key, value in index["regions"].items()
+        }
+        return cls(pages, regions)
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from typing import List, Optional, Dict
 
 from .game_state import GameState
@@ -63,7 +63,9 @@ class TimelineEvent:
 class TimelineEngine:
     """Manage time-based events and optional looping timelines."""
 
-    def __init__(self, state: GameState, scene_manager: "SceneManager | None" = None) -> None:
+    def __init__(
+        self, state: GameState, scene_manager: "SceneManager | None" = None
+    ) -> None:
         self.events: List[TimelineEvent] = []
         self.elapsed_time: float = 0.0
         self.loop_enabled: bool = False
@@ -107,9 +109,34 @@ class TimelineEngine:
     # ------------------------------------------------------------------
     # Compatibility loader
     # ------------------------------------------------------------------
-    def add_events(self, entries: List[Dict[str, object]], current_ticks: int, scene: Optional[str] = None) -> None:
+    def add_events(
+        self,
+        entries: List[Dict[str, object]],
+        current_ticks: int,
+        scene: Optional[str] = None,
+    ) -> None:
         """Backwards compatible loader using ticks."""
-        self._sync_ticks(current_ticks)
+        self.schedule_events(self.parse_events(entries), current_ticks, scene)
+
+    def schedule_events(
+        self,
+        templates: List[TimelineEvent],
+        current_ticks: Optional[int] = None,
+        scene: Optional[str] = None,
+    ) -> None:
+        """Schedule fresh copies of already parsed ``templates``.
+
+        Pass ``current_ticks=None`` when time is driven by :meth:`advance`.
+        """
+        if current_ticks is not None:
+            self._sync_ticks(current_ticks)
+        for template in templates:
+            self.add_event(replace(template, triggered=False), scene)
+
+    @staticmethod
+    def parse_events(entries: List[Dict[str, object]]) -> List[TimelineEvent]:
+        """Turn raw scene ``events`` entries into unscheduled events."""
+        parsed: List[TimelineEvent] = []
         for entry in entries:
             if not isinstance(entry, dict):
                 continue
@@ -125,22 +152,32 @@ class TimelineEngine:
                 delay = float(time_val)
             except (TypeError, ValueError):
                 delay = 0.0
-            ev = TimelineEvent(
-                id=str(entry.get("id", "")),
-                trigger=str(trigger),
-                time=delay,
-                action=str(action),
-                params=params,
-                condition=entry.get("condition"),
+            parsed.append(
+                TimelineEvent(
+                    id=str(entry.get("id", "")),
+                    trigger=str(trigger),
+                    time=delay,
+                    action=str(action),
+                    params=params,
+                    condition=entry.get("condition"),
+                )
             )
-            self.add_event(ev, scene)
+        return parsed
 
     # ------------------------------------------------------------------
     # Update
     # ------------------------------------------------------------------
     def update(self, current_ticks: int, current_scene: Optional[str] = None) -> None:
-        """Advance timers and fire ready events."""
+        """Advance timers to ``current_ticks`` and fire ready events."""
         self._sync_ticks(current_ticks)
+        self._fire_ready(current_scene)
+
+    def advance(self, dt: float, current_scene: Optional[str] = None) -> None:
+        """Advance timers by ``dt`` seconds and fire ready events."""
+        self.elapsed_time += max(dt, 0.0)
+        self._fire_ready(current_scene)
+
+    def _fire_ready(self, current_scene: Optional[str]) -> None:
         to_remove: List[TimelineEvent] = []
         for event in self.events:
             if event.scene and current_scene and event.scene != current_scene:
@@ -0,0 +1,103 @@
+"""Caches for surfaces the UI would otherwise rebuild every frame."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+try:
+    import pygame  # type: ignore
+except Exception:  # pragma: no cover - allow running tests without pygame
+    pygame = None
+
+Color = Tuple[int, ...]
+
+
+class TextCache:
+    """LRU cache of rendered text surfaces.
+
+    Entries are keyed by ``(text, font, size, color, antialias)``, so the
+    same string drawn by a different font or theme colour is a separate
+    entry. Clear the cache when fonts or colours change to release surfaces
+    that will not be drawn again.
+    """
+
+    def __init__(self, max_entries: int = 256) -> None:
+        self.max_entries = max(1, int(max_entries))
+        self._entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def render(
+        self,
+        font: "pygame.font.Font",
+        text: str,
+        color: Color,
+        size: Optional[int] = None,
+        antialias: bool = True,
+    ) -> "pygame.Surface":
+        """Return ``font.render(text, antialias, color)``, cached."""
+        key = (text, font, size, tuple(color), antialias)
+        surf = self._entries.get(key)
+        if surf is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return surf
+        self.misses += 1
+        surf = font.render(text, antialias, color)
+        self._entries[key] = surf
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return surf
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def stats(self) -> Dict[str, float]:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "entries": len(self._entries),
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class PanelPool:
+    """Pre-filled translucent panels reused across frames.
+
+    ``get`` returns the same ``SRCALPHA`` surface for a given size and
+    colour every time, so drawing a box does not allocate or fill. Panels
+    must be treated as read-only. Call :meth:`clear` when the screen size
+    or theme changes.
+    """
+
+    def __init__(self, max_entries: int = 32) -> None:
+        self.max_entries = max(1, int(max_entries))
+        self._panels: "OrderedDict[Tuple[int, int, Color], Any]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, size: Tuple[int, int], color: Color) -> "pygame.Surface":
+        key = (int(size[0]), int(size[1]), tuple(color))
+        panel = self._panels.get(key)
+        if panel is not None:
+            self._panels.move_to_end(key)
+            self.hits += 1
+            return panel
+        self.misses += 1
+        panel = pygame.Surface((key[0], key[1]), pygame.SRCALPHA)
+        panel.fill(color)
+        self._panels[key] = panel
+        if len(self._panels) > self.max_entries:
+            self._panels.popitem(last=False)
+        return panel
+
+    def clear(self) -> None:
+        self._panels.clear()
+
+    def __len__(self) -> int:
+        return len(self._panels)
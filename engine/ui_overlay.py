@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Optional, Tuple, List, Dict
+from typing import TYPE_CHECKING, Optional, Tuple, List, Dict
 
 try:
     import pygame  # type: ignore
@@ -8,6 +8,11 @@ except Exception:  # pragma: no cover - allow running tests without pygame
     pygame = None
 
 from .hotspot import Hotspot
+from .text_layout import TextLayoutCache
+from .ui_cache import PanelPool, TextCache
+
+if TYPE_CHECKING:  # pragma: no cover - only for type hints
+    from .hotspot_index import HotspotIndex
 
 
 class UIOverlay:
@@ -41,6 +46,12 @@ class UIOverlay:
         )
         self.hover_text: Optional[str] = None
         self.hover_pos: Tuple[int, int] | None = None
+        self.text_cache = TextCache()
+        self.panels = PanelPool()
+        self.layouts = TextLayoutCache()
+        self._panel_screen_size: Tuple[int, int] | None = None
+        self._option_source: List[str] = []
+        self._option_labels: List[str] = []
 
     # ------------------------------------------------------------------
     # Drawing helpers
@@ -48,25 +59,49 @@ class UIOverlay:
     def _draw_box(
         self, rect: "pygame.Rect", color: Tuple[int, int, int, int]
     ) -> "pygame.Surface":
-        surf = pygame.Surface((rect.width, rect.height), pygame.SRCALPHA)
-        surf.fill(color)
+        size = self.screen.get_size()
+        if size != self._panel_screen_size:
+            self.panels.clear()
+            self._panel_screen_size = size
+        surf = self.panels.get((rect.width, rect.height), color)
         self.screen.blit(surf, rect.topleft)
         return surf
 
     def _render_text(self, text: str) -> Optional["pygame.Surface"]:
         if not pygame or not self.font:
             return None
-        return self.font.render(text, True, self.theme["font_color"])
+        return self.text_cache.render(
+            self.font, text, self.theme["font_color"], int(self.theme["font_size"])
+        )
+
+    def invalidate_cache(self) -> None:
+        """Drop cached surfaces after the font or theme changed."""
+        self.text_cache.clear()
+        self.panels.clear()
+        self.layouts.clear()
 
     # ------------------------------------------------------------------
     # Public API
     # ------------------------------------------------------------------
-    def draw_dialogue_box(self, text: str, speaker: Optional[str] = None) -> None:
+    def draw_dialogue_box(
+        self, text: str, speaker: Optional[str] = None, reveal: Optional[int] = None
+    ) -> None:
+        """Draw ``text`` word-wrapped in a box at the bottom of the screen.
+
+        ``reveal`` limits how many characters are shown (typewriter effect);
+        ``None`` shows the whole line.
+        """
         if not pygame or not self.font:
             return
         width, height = self.screen.get_size()
         padding = int(self.theme["padding"])
-        box_height = self.font.get_height() * 4 + padding * 2
+        block = self.layouts.get(
+            text, self.font, self.theme["font_color"], width - padding * 4
+        )
+        block.reveal_to(reveal)
+        speaker_height = self.font.get_height() + 4 if speaker else 0
+        box_height = max(self.font.get_height() * 4, speaker_height + block.size[1])
+        box_height += padding * 2
         rect = pygame.Rect(
             padding,
             height - box_height - padding,
@@ -81,9 +116,7 @@ class UIOverlay:
             if speaker_surf:
                 self.screen.blit(speaker_surf, (rect.left + padding, y))
                 y += speaker_surf.get_height() + 4
-        text_surf = self._render_text(text)
-        if text_surf:
-            self.screen.blit(text_surf, (rect.left + padding, y))
+        block.draw(self.screen, (rect.left + padding, y))
 
     def draw_options(self, options: List[str]) -> None:  # pragma: no cover - UI only
         """Render a numbered list of options below the dialogue box."""
@@ -92,8 +125,13 @@ class UIOverlay:
         padding = int(self.theme["padding"])
         width, height = self.screen.get_size()
         y = height - padding - self.font.get_height() * len(options) - 5
-        for idx, text in enumerate(options, 1):
-            surf = self._render_text(f"{idx}. {text}")
+        if options != self._option_source:
+            self._option_source = list(options)
+            self._option_labels = [
+                f"{idx}. {text}" for idx, text in enumerate(options, 1)
+            ]
+        for label in self._option_labels:
+            surf = self._render_text(label)
             if surf:
                 self.screen.blit(surf, (padding * 2, y))
                 y += surf.get_height() + 4
@@ -133,12 +171,26 @@ class UIOverlay:
         self.hover_text = None
         self.hover_pos = None
 
-    def update_mouse_hover(self, hotspots: List[Hotspot]) -> None:
+    def update_mouse_hover(
+        self,
+        hotspots: List[Hotspot],
+        index: Optional["HotspotIndex"] = None,
+        pos: Optional[Tuple[int, int]] = None,
+    ) -> None:
+        """Show a tooltip for the hotspot under the mouse.
+
+        Pass the scene's ``index`` to avoid testing every hotspot, and
+        ``pos`` when drawing at a logical resolution
+        (``renderer.to_logical(pygame.mouse.get_pos())``).
+        """
         if not pygame:
             return
-        pos = pygame.mouse.get_pos()
+        if pos is None:
+            pos = pygame.mouse.get_pos()
         self.hover_text = None
         self.hover_pos = pos
+        if index is not None:
+            hotspots = index.candidates(pos)
         for hs in hotspots:
             if hs.rect().collidepoint(pos):
                 self.hover_text = hs.id
@@ -1,21 +1,27 @@
 from dataclasses import dataclass, field
 from typing import Dict, List, Optional
 import os
-import yaml
+
+from .yaml_loader import load_yaml
+
 
 @dataclass
 class Region:
     """Simple region containing a list of scene identifiers."""
+
     id: str
     scenes: List[str] = field(default_factory=list)
 
+
 @dataclass
 class World:
     """World data parsed from YAML."""
+
     id: str
     title: str
     regions: Dict[str, Region] = field(default_factory=dict)
 
+
 class WorldLoader:
     """Load a world YAML file defining regions and scenes."""
 
@@ -26,8 +32,7 @@ class WorldLoader:
     def load_world(self, path: str) -> World:
         if not os.path.exists(path):
             raise FileNotFoundError(f"World file not found: {path}")
-        with open(path, "r") as fh:
-            data = yaml.safe_load(fh) or {}
+        data = load_yaml(path) or {}
         world_data = data.get("world", {})
         regions_data = world_data.get("regions", []) or []
         regions: Dict[str, Region] = {}
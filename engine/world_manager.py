@@ -3,9 +3,10 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from typing import Dict, List, Optional
 import os
-import yaml
 import json
 
+from .yaml_loader import load_yaml
+
 
 @dataclass
 class Region:
@@ -72,8 +73,7 @@ class WorldManager:
     def _load_world_file(self, path: str) -> World:
         if not os.path.exists(path):
             raise FileNotFoundError(f"World file not found: {path}")
-        with open(path, "r") as fh:
-            data = yaml.safe_load(fh) or {}
+        data = load_yaml(path) or {}
         world_data = data.get("world", {}) or {}
 
         # expose raw data and metadata for the simplified API
@@ -126,9 +126,8 @@ class WorldManager:
         if start_region:
             region = self.world.regions.get(start_region)
             if region:
-                self.state.current_scene = (
-                    region.entry_scene
-                    or (region.scenes[0] if region.scenes else None)
+                self.state.current_scene = region.entry_scene or (
+                    region.scenes[0] if region.scenes else None
                 )
 
     # ------------------------------------------------------------------
@@ -230,4 +229,3 @@ class WorldManager:
             data = json.load(fh)
         self.state.current_region = data.get("current_region")
         self.state.current_scene = data.get("current_scene")
-
@@ -0,0 +1,114 @@
+"""Shared YAML loading for every engine and editor entry point.
+
+Parsing uses LibYAML's ``CSafeLoader`` when PyYAML was built with it and
+falls back to the pure Python ``SafeLoader`` otherwise. Without PyYAML
+the files are read as JSON, matching the engine's historic fallback.
+
+:func:`load_yaml` keeps a per-file cache keyed by path, mtime and size.
+Cached documents are stored as ``marshal`` blobs (or deep-copied when not
+marshallable) so every caller receives its own mutable copy. The cache is
+an LRU of at most :data:`MAX_ENTRIES` files (see :func:`set_cache_limit`).
+"""
+
+from __future__ import annotations
+
+import copy
+import json
+import marshal
+import os
+import threading
+from collections import OrderedDict
+from typing import IO, Any, Dict, Optional, Tuple
+
+try:  # pragma: no cover - allow tests without PyYAML
+    import yaml  # type: ignore
+except Exception:  # pragma: no cover - fallback when PyYAML missing
+    yaml = None
+
+PySafeLoader = getattr(yaml, "SafeLoader", None)
+SafeLoader = getattr(yaml, "CSafeLoader", None) or PySafeLoader
+HAS_LIBYAML = SafeLoader is not None and SafeLoader is not PySafeLoader
+
+# files kept parsed by default, least recently used are dropped first
+MAX_ENTRIES = 128
+
+_cache: "OrderedDict[str, Tuple[Tuple[int, int], bool, Any]]" = OrderedDict()
+_max_entries = MAX_ENTRIES
+_lock = threading.Lock()
+_stats = {"hits": 0, "misses": 0, "evictions": 0}
+
+
+def safe_load(stream: IO[str] | str, loader: Any = None) -> Any:
+    """Parse a YAML document like ``yaml.safe_load`` using ``loader``."""
+    loader = loader or SafeLoader
+    if loader is None:
+        if isinstance(stream, str):
+            return json.loads(stream)
+        return json.load(stream)
+    return yaml.load(stream, Loader=loader)
+
+
+def load_yaml(path: str, use_cache: bool = True) -> Any:
+    """Return the parsed contents of the YAML file at ``path``."""
+    key = os.path.abspath(path)
+    if not use_cache:
+        return _parse_file(key)
+
+    st = os.stat(key)
+    stamp = (st.st_mtime_ns, st.st_size)
+    with _lock:
+        entry = _cache.get(key)
+        if entry and entry[0] == stamp:
+            _stats["hits"] += 1
+            _cache.move_to_end(key)
+            _, is_blob, stored = entry
+            return marshal.loads(stored) if is_blob else copy.deepcopy(stored)
+        _stats["misses"] += 1
+
+    data = _parse_file(key)
+    try:
+        entry = (stamp, True, marshal.dumps(data))
+    except ValueError:
+        # dates and other YAML types marshal can't store
+        entry = (stamp, False, copy.deepcopy(data))
+    with _lock:
+        _cache[key] = entry
+        _cache.move_to_end(key)
+        _trim()
+    return data
+
+
+def _trim() -> None:
+    while len(_cache) > _max_entries:
+        _cache.popitem(last=False)
+        _stats["evictions"] += 1
+
+
+def _parse_file(path: str) -> Any:
+    with open(path, "r", encoding="utf-8") as fh:
+        return safe_load(fh)
+
+
+def set_cache_limit(max_entries: int) -> None:
+    """Keep at most ``max_entries`` parsed files (``0`` disables caching)."""
+    global _max_entries
+    with _lock:
+        _max_entries = max(0, int(max_entries))
+        _trim()
+
+
+def clear_cache(path: Optional[str] = None) -> None:
+    """Forget the cached document for ``path``, or everything and the counters."""
+    with _lock:
+        if path is not None:
+            _cache.pop(os.path.abspath(path), None)
+            return
+        _cache.clear()
+        for name in _stats:
+            _stats[name] = 0
+
+
+def cache_info() -> Dict[str, int]:
+    """Return hit/miss/eviction counters and the number of cached files."""
+    with _lock:
+        return {**_stats, "entries": len(_cache), "max_entries": _max_entries}
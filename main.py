@@ -1,15 +1,17 @@
 import pygame
-import yaml
 import sys
 import os
 
+from engine.headless import create_window
 from engine.scene_manager import SceneManager
+from engine.yaml_loader import load_yaml
+
 
 def load_config(path="config.yaml"):
     if not os.path.exists(path):
         raise FileNotFoundError(f"Config file not found: {path}")
-    with open(path, 'r') as f:
-        return yaml.safe_load(f)
+    return load_yaml(path)
+
 
 class Launcher:
     def __init__(self, config):
@@ -18,13 +20,8 @@ class Launcher:
         self.scene_manager = None
 
     def init_window(self):
-        width = self.config.get("window", {}).get("width", 800)
-        height = self.config.get("window", {}).get("height", 600)
-        title = self.config.get("window", {}).get("title", "game-engine")
-
-        pygame.init()
-        self.screen = pygame.display.set_mode((width, height))
-        pygame.display.set_caption(title)
+        # ``window.headless`` runs without a display (see engine.headless)
+        self.screen = create_window(self.config)
 
     def run(self):
         print("🚀 Launching game-engine...")
@@ -32,6 +29,7 @@ class Launcher:
         self.scene_manager = SceneManager(self.screen, self.config)
         self.scene_manager.run()
 
+
 if __name__ == "__main__":
     try:
         config = load_config()
@@ -3,8 +3,11 @@ import os
 import sys
 import types
 
+import pytest
+
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
+
 class DummyRect:
     def __init__(self, *args, **kwargs):
         pass
@@ -15,6 +18,7 @@ class DummyRect:
 
 class DummyPygame(types.SimpleNamespace):
     Rect = DummyRect
+
     class image:
         @staticmethod
         def load(path):
@@ -24,6 +28,11 @@ class DummyPygame(types.SimpleNamespace):
 
             return DummySurf()
 
+    class display:
+        @staticmethod
+        def get_surface():
+            return None
+
     class mixer:
         class music:
             @staticmethod
@@ -34,11 +43,14 @@ class DummyPygame(types.SimpleNamespace):
 def test_preload_without_pygame(monkeypatch, caplog):
     monkeypatch.setitem(sys.modules, "pygame", DummyPygame)
     from engine.asset_manager import AssetManager
+
     Scene = types.SimpleNamespace
 
     monkeypatch.setattr("engine.asset_manager.pygame", None)
     manager = AssetManager()
-    scene = Scene(id="s", background="bg.png", overlays=["ov.png"], features={"music": "song.mp3"})
+    scene = Scene(
+        id="s", background="bg.png", overlays=["ov.png"], features={"music": "song.mp3"}
+    )
     with caplog.at_level(logging.INFO):
         manager.preload_scene(scene)
     assert manager.images == {}
@@ -82,3 +94,153 @@ def test_load_real_files(monkeypatch, tmp_path):
     assert music == str(audio_path)
     assert manager.get_music(str(audio_path)) == str(audio_path)
 
+
+def test_get_music_does_not_load_the_track(monkeypatch, tmp_path):
+    monkeypatch.setitem(sys.modules, "pygame", DummyPygame)
+    from engine.asset_manager import AssetManager
+
+    monkeypatch.setattr("engine.asset_manager.pygame", DummyPygame)
+    loaded = []
+    monkeypatch.setattr(DummyPygame.mixer.music, "load", staticmethod(loaded.append))
+    (tmp_path / "theme.ogg").write_bytes(b"aud")
+
+    manager = AssetManager(base_path=str(tmp_path))
+    assert manager.get_music("theme.ogg") == str(tmp_path / "theme.ogg")
+    manager.unload("theme.ogg")
+    assert manager.get_music("theme.ogg") == str(tmp_path / "theme.ogg")
+    assert loaded == []
+
+
+def _real_pygame(monkeypatch):
+    # the stub tests above may have been the first to import the module
+    pygame = pytest.importorskip("pygame")
+    monkeypatch.setattr("engine.asset_manager.pygame", pygame)
+    return pygame
+
+
+def test_opaque_images_drop_alpha(monkeypatch, tmp_path):
+    pygame = _real_pygame(monkeypatch)
+    from engine.asset_manager import AssetManager
+
+    monkeypatch.setenv("SDL_VIDEODRIVER", "dummy")
+    pygame.display.init()
+    try:
+        pygame.display.set_mode((32, 32))
+        opaque = pygame.Surface((8, 8), pygame.SRCALPHA)
+        opaque.fill((10, 20, 30, 255))
+        clear = opaque.copy()
+        clear.set_at((3, 3), (10, 20, 30, 100))
+        pygame.image.save(opaque, str(tmp_path / "opaque.png"))
+        pygame.image.save(clear, str(tmp_path / "clear.png"))
+
+        manager = AssetManager(base_path=str(tmp_path))
+        assert AssetManager.is_opaque(opaque) and not AssetManager.is_opaque(clear)
+        assert not manager.get_image("opaque.png").get_flags() & pygame.SRCALPHA
+        assert manager.get_image("clear.png").get_flags() & pygame.SRCALPHA
+    finally:
+        pygame.display.quit()
+
+
+def test_scaled_variants_built_once(monkeypatch, tmp_path):
+    pygame = _real_pygame(monkeypatch)
+    from engine.asset_manager import AssetManager
+
+    image = pygame.Surface((40, 30))
+    image.fill((200, 0, 0))
+    pygame.image.save(image, str(tmp_path / "bg.png"))
+
+    manager = AssetManager(
+        base_path=str(tmp_path), art_resolution=(40, 30), target_resolution=(80, 60)
+    )
+    manager.preload_scene({"id": "s", "background": "bg.png"})
+    variant = manager.get_scaled_image("bg.png")
+    assert variant.get_size() == (80, 60)
+    assert manager.get_scaled_image("bg.png") is variant
+    assert len(manager.scaled_cache) == 1
+    assert manager.get_scaled_image("bg.png", (20, 15)).get_size() == (20, 15)
+
+    manager.set_resolution((40, 30))
+    assert manager.scaled_cache == {}
+    assert manager.get_scaled_image("bg.png") is manager.get_image("bg.png")
+
+
+def _save_images(pygame, folder, names, size=(64, 64)):
+    for name in names:
+        surf = pygame.Surface(size)
+        surf.fill((40, 80, 120))
+        pygame.image.save(surf, str(folder / name))
+
+
+def test_lru_evicts_unpinned_under_budget(monkeypatch, tmp_path):
+    pygame = _real_pygame(monkeypatch)
+    from engine.asset_manager import MB, AssetManager, surface_bytes
+
+    _save_images(pygame, tmp_path, ["a.png", "b.png", "c.png", "d.png"])
+    one = 64 * 64 * pygame.image.load(str(tmp_path / "a.png")).get_bytesize()
+    manager = AssetManager(base_path=str(tmp_path), memory_limit_mb=3 * one / MB)
+    manager.pin(["a.png"])
+    for name in ("a.png", "b.png", "c.png"):
+        manager.get_image(name)
+    assert manager.bytes_used == 3 * one
+    assert surface_bytes(manager.get_image("b.png")) == one
+
+    manager.get_image("d.png")
+    # c.png was the least recently used unpinned image
+    assert set(manager.images) == {"a.png", "b.png", "d.png"}
+    assert manager.bytes_used == 3 * one and manager.evictions == 1
+
+    manager.clear_unpinned()
+    assert set(manager.images) == {"a.png"}
+    assert manager.memory_usage()["image"] == one
+
+
+def test_performance_manager_reports_pixel_bytes(monkeypatch, tmp_path):
+    pygame = _real_pygame(monkeypatch)
+    from engine.asset_manager import MB, AssetManager
+    from engine.performance_manager import PerformanceManager
+
+    _save_images(pygame, tmp_path, ["bg.png", "ov.png"], size=(512, 512))
+    assets = AssetManager(base_path=str(tmp_path))
+    perf = PerformanceManager(str(tmp_path / "missing.yaml"), asset_manager=assets)
+    assets.get_image("bg.png")
+    assets.get_image("ov.png")
+    size = perf.cache_size_mb()
+    assert size == pytest.approx(
+        2 * 512 * 512 * assets.images["bg.png"].get_bytesize() / MB
+    )
+
+    assets.set_pinned(["bg.png"])
+    perf.max_cache_size_mb = size / 2
+    perf.trim_cache()
+    assert list(assets.images) == ["bg.png"]
+
+
+def test_scene_refcounts_unload_only_unused(monkeypatch, tmp_path):
+    pygame = _real_pygame(monkeypatch)
+    from engine.asset_manager import AssetManager
+    from engine.performance_manager import PerformanceManager
+
+    _save_images(
+        pygame, tmp_path, ["hall.png", "door.png", "yard.png", "map.png"], (8, 8)
+    )
+    manager = AssetManager(base_path=str(tmp_path))
+    manager.acquire_scene("hall", ["hall.png", "door.png"])
+    manager.acquire_scene("prefetch:yard", ["yard.png", "door.png"])
+    for name in ("hall.png", "door.png", "yard.png", "map.png"):
+        manager.get_scaled_image(name, (4, 4))
+    manager.pin(["map.png"])
+
+    perf = PerformanceManager(str(tmp_path / "missing.yaml"), asset_manager=manager)
+    assert perf.flush_scene_cache("hall") == ["hall.png"]
+    assert set(manager.images) == {"door.png", "yard.png", "map.png"}
+    assert {key[0] for key in manager.scaled_cache} == {
+        "door.png",
+        "yard.png",
+        "map.png",
+    }
+
+    manager.acquire_scene("prefetch:yard", ["yard.png"])
+    assert "door.png" not in manager.ref_counts
+    assert manager.release_scene("prefetch:yard", unload=False) == ["yard.png"]
+    assert "yard.png" in manager.images
+    assert not manager.unload("map.png")
@@ -0,0 +1,128 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from engine.asset_manifest import AssetManifest
+from tools import asset_manifest as manifest_tool
+
+
+@pytest.fixture
+def roots(tmp_path):
+    base = tmp_path / "assets"
+    extra = tmp_path / "mods"
+    (base / "icons").mkdir(parents=True)
+    (base / ".cache").mkdir()
+    extra.mkdir()
+    (base / "icons" / "key.png").write_bytes(b"key")
+    (base / "bg.png").write_bytes(b"base background")
+    (base / ".cache" / "junk.bin").write_bytes(b"x")
+    (extra / "bg.png").write_bytes(b"mod background")
+    (extra / "music.ogg").write_bytes(b"ogg")
+    return str(base), str(extra)
+
+
+def test_scan_indexes_roots_in_order(roots):
+    base, extra = roots
+    manifest = AssetManifest.scan(roots, hashes=True)
+    assert sorted(manifest.names()) == sorted(
+        ["bg.png", os.path.normpath("icons/key.png"), "music.ogg"]
+    )
+    assert manifest.resolve("bg.png") == os.path.join(base, "bg.png")
+    assert manifest.resolve("./icons//key.png") == os.path.join(
+        base, "icons", "key.png"
+    )
+    assert manifest.resolve("music.ogg") == os.path.join(extra, "music.ogg")
+    assert manifest.get("bg.png").size == len(b"base background")
+    assert len(manifest.get("bg.png").hash) == 40
+    assert manifest.missing(["bg.png", "none.png", "none.png"]) == ["none.png"]
+
+
+def test_save_load_and_diff(roots, tmp_path):
+    index = str(tmp_path / "assets" / "manifest.json")
+    manifest_tool.build(roots, index)
+    loaded = AssetManifest.load(index)
+    assert "manifest.json" not in loaded
+    assert (
+        loaded.entries == AssetManifest.scan(roots, hashes=True, skip=[index]).entries
+    )
+    assert manifest_tool.check(index) == {"added": [], "removed": [], "changed": []}
+
+    base = roots[0]
+    os.remove(os.path.join(base, "bg.png"))
+    with open(os.path.join(base, "new.png"), "wb") as fh:
+        fh.write(b"new")
+    with open(os.path.join(base, "icons", "key.png"), "wb") as fh:
+        fh.write(b"KEY")
+    assert manifest_tool.check(index) == {
+        "added": ["new.png"],
+        "removed": [],
+        "changed": ["bg.png", os.path.normpath("icons/key.png")],
+    }
+
+
+def test_asset_manager_resolves_without_stat(roots, monkeypatch):
+    pygame = pytest.importorskip("pygame")
+    monkeypatch.setattr("engine.asset_manager.pygame", pygame)
+    from engine.asset_manager import AssetManager
+
+    base, extra = roots
+    image = pygame.Surface((3, 2))
+    pygame.image.save(image, os.path.join(extra, "door.png"))
+    manager = AssetManager(base_path=base, search_paths=[extra])
+    manager.build_manifest()
+
+    def no_stat(path):
+        raise AssertionError(f"stat call for {path}")
+
+    with monkeypatch.context() as patch:
+        patch.setattr(os.path, "exists", no_stat)
+        assert manager._resolve_path("bg.png") == os.path.join(base, "bg.png")
+        assert manager.get_image("door.png").get_size() == (3, 2)
+    assert manager.get_image("missing.png").get_size() == (1, 1)
+    assert manager.missing_assets(["door.png", "missing.png"]) == ["missing.png"]
+    assert manager.get_sound("missing.ogg") is None
+
+
+def test_asset_manager_falls_back_to_disk(roots, monkeypatch):
+    pygame = pytest.importorskip("pygame")
+    monkeypatch.setattr("engine.asset_manager.pygame", pygame)
+    from engine.asset_manager import AssetManager
+
+    base, extra = roots
+    manager = AssetManager(base_path=base)
+    manager.build_manifest()
+    pygame.image.save(pygame.Surface((4, 4)), os.path.join(base, "new.png"))
+    manager.search_paths.append(extra)
+
+    assert manager.get_image("new.png").get_size() == (4, 4)
+    assert manager._locate("music.ogg") == os.path.join(extra, "music.ogg")
+
+
+def test_asset_manager_remembers_missing_names(roots, monkeypatch):
+    pygame = pytest.importorskip("pygame")
+    monkeypatch.setattr("engine.asset_manager.pygame", pygame)
+    from engine.asset_manager import AssetManager
+
+    base, extra = roots
+    manager = AssetManager(base_path=base)
+    manager.build_manifest()
+    assert manager.get_sound("music.ogg") is None
+
+    def no_stat(path):
+        raise AssertionError(f"stat call for {path}")
+
+    with monkeypatch.context() as patch:
+        patch.setattr(os.path, "exists", no_stat)
+        assert manager.get_sound("music.ogg") is None
+        assert manager.request_sound("music.ogg").get() is None
+
+    manager.search_paths.append(extra)
+    assert manager._locate("music.ogg") == os.path.join(extra, "music.ogg")
+    assert manager._locate("later.png") is None
+    pygame.image.save(pygame.Surface((2, 2)), os.path.join(base, "later.png"))
+    assert manager._locate("later.png") is None
+    manager.build_manifest()
+    assert manager._locate("later.png") == os.path.join(base, "later.png")
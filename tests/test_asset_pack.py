@@ -0,0 +1,91 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from engine.asset_pack import AssetPack, write_pack
+from tools import asset_pack as pack_tool
+
+
+def test_pack_roundtrip(tmp_path):
+    path = str(tmp_path / "test.pack")
+    write_pack({"a/one.txt": b"first", "two.bin": bytes(range(37)), "empty": b""}, path)
+    with AssetPack(path) as pack:
+        assert len(pack) == 3 and os.path.normpath("a/one.txt") in pack
+        view = pack.view("a/one.txt")
+        assert isinstance(view, memoryview) and view.readonly
+        assert bytes(view) == b"first"
+        assert pack.read("two.bin") == bytes(range(37))
+        assert pack.read("empty") == b"" and pack.read("none") is None
+        assert all(
+            (pack.data_start + e.offset) % 16 == 0 for e in pack.entries.values()
+        )
+        reader = pack.open("two.bin")
+        reader.seek(-5, os.SEEK_END)
+        assert reader.read() == bytes(range(32, 37)) and reader.tell() == 37
+        del view, reader
+
+
+def test_rejects_other_files(tmp_path):
+    path = tmp_path / "bad.pack"
+    path.write_bytes(b"PK\x03\x04 not a pack at all")
+    with pytest.raises(ValueError):
+        AssetPack(str(path))
+
+
+def test_builder_packs_folder_and_verifies(tmp_path):
+    assets = tmp_path / "assets"
+    (assets / "icons").mkdir(parents=True)
+    (assets / "icons" / "key.png").write_bytes(b"key")
+    (assets / "bg.png").write_bytes(b"background")
+    (assets / "old.pack").write_bytes(b"x")
+    out = str(assets / "base.pack")
+
+    report = pack_tool.build(str(assets), out)
+    assert report["files"] == 2
+    assert pack_tool.build(str(assets), out, sources=["icons"])["files"] == 1
+    pack_tool.build(str(assets), out)
+    assert pack_tool.verify(out) == []
+
+    with AssetPack(out) as pack:
+        position = pack.data_start + pack.entries["bg.png"].offset
+    with open(out, "r+b") as fh:
+        fh.seek(position)
+        fh.write(b"B")
+    assert pack_tool.verify(out) == ["bg.png"]
+
+
+def test_asset_manager_serves_packed_assets(tmp_path, monkeypatch):
+    pygame = pytest.importorskip("pygame")
+    monkeypatch.setattr("engine.asset_manager.pygame", pygame)
+    from engine.asset_manager import AssetManager
+
+    source = tmp_path / "src"
+    source.mkdir()
+    surf = pygame.Surface((5, 4))
+    surf.fill((30, 60, 90))
+    pygame.image.save(surf, str(source / "door.png"))
+    loose = tmp_path / "assets"
+    loose.mkdir()
+    pack_path = str(loose / "base.pack")
+    write_pack({"rooms/door.png": str(source / "door.png")}, pack_path)
+
+    manager = AssetManager(base_path=str(loose))
+    assert manager.mount_pack("base.pack") is not None
+    handle = manager.request_image("rooms/door.png")
+    handle.future.exception(timeout=5)
+    assert manager.process_pending() == 1
+    image = manager.get_image("rooms/door.png")
+    assert handle.get() is image
+    assert image.get_size() == (5, 4) and image.get_at((0, 0))[:3] == (30, 60, 90)
+    assert manager.missing_assets(["rooms/door.png", "rooms/none.png"]) == [
+        os.path.normpath("rooms/none.png")
+    ]
+    assert manager.mount_pack("none.pack") is None
+    del image, handle
+    manager.clear_cache()
+    manager.decoder.shutdown(wait=True)
+    manager.unmount_packs()
+    assert manager.packs == []
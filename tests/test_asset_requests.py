@@ -0,0 +1,103 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+pygame = pytest.importorskip("pygame")
+
+from engine.asset_manager import AssetManager
+
+
+@pytest.fixture
+def manager(monkeypatch, tmp_path):
+    # other tests may have imported the module with a stubbed pygame
+    monkeypatch.setattr("engine.asset_manager.pygame", pygame)
+    for idx in range(5):
+        surf = pygame.Surface((6, 6))
+        surf.fill((idx * 40, 10, 10))
+        pygame.image.save(surf, str(tmp_path / f"img{idx}.png"))
+    (tmp_path / "broken.png").write_bytes(b"not an image")
+    manager = AssetManager(base_path=str(tmp_path))
+    yield manager
+    manager.decoder.shutdown(wait=True)
+
+
+def _wait(*handles):
+    for handle in handles:
+        if handle.future is not None:
+            handle.future.exception(timeout=5)
+
+
+def test_request_serves_placeholder_until_finished(manager):
+    handle = manager.request_image("img1.png")
+    assert handle.get() is manager.placeholder()
+    landed = []
+    handle.add_done_callback(landed.append)
+    assert manager.request_image("img1.png") is handle
+
+    _wait(handle)
+    assert handle.decoded and not handle.ready
+    assert manager.process_pending() == 1
+    assert landed == [handle]
+    image = handle.get()
+    assert image.get_size() == (6, 6) and image.get_at((0, 0))[:3] == (40, 10, 10)
+    assert manager.get_image("img1.png") is image
+    assert manager.request_image("img1.png").get() is image
+
+
+def test_process_pending_spreads_work(manager):
+    handles = [manager.request_image(f"img{idx}.png") for idx in range(5)]
+    _wait(*handles)
+    assert manager.process_pending(max_items=2) == 2
+    assert manager.process_pending(max_items=2) == 2
+    assert manager.process_pending(max_items=2) == 1
+    assert manager.process_pending() == 0
+    assert all(handle.ready for handle in handles)
+    assert len(manager.images) == 5
+
+
+def test_get_image_finishes_pending_request(manager, monkeypatch):
+    calls = []
+    decode = AssetManager._decode_image
+    monkeypatch.setattr(
+        AssetManager,
+        "_decode_image",
+        staticmethod(lambda *args: calls.append(args[0]) or decode(*args)),
+    )
+    handle = manager.request_image("img2.png")
+    image = manager.get_image("img2.png")
+    assert handle.ready and handle.get() is image
+    assert len(calls) == 1
+    assert manager.process_pending() == 0
+
+
+def test_failed_decode_keeps_placeholder(manager, caplog):
+    handle = manager.request_image("broken.png")
+    _wait(handle)
+    manager.process_pending()
+    assert handle.ready and handle.error is not None
+    assert handle.get().get_at((0, 0)) == (255, 0, 255, 255)
+    assert "Failed to load image" in caplog.text
+
+
+def test_scene_requests_leave_caching_to_main_thread(manager):
+    scene = {"background": "img0.png", "overlays": ["img1.png"]}
+    handles = manager.request_scene_assets(scene)
+    _wait(*handles)
+    assert len(handles) == 2
+    assert manager.images == {}
+
+    background = manager.get_scaled_image("img0.png")
+    assert handles[0].ready and handles[0].get() is background
+    assert set(manager.images) == {"img0.png"}
+
+
+def test_finish_runs_once_per_handle(manager):
+    handle = manager.request_image("img3.png")
+    _wait(handle)
+    image = manager.decoder.finish(handle, manager._finalize_request)
+    assert manager.decoder.finish(handle, manager._finalize_request) is image
+    assert manager.decoder.finish_ready(manager._finalize_request) == 0
+    assert manager.decoder.finished == 1
@@ -0,0 +1,120 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+yaml = pytest.importorskip("yaml")
+
+from engine.content_loader import ContentLoader
+from engine.dialogue_engine import DialogueEngine
+from engine.game_state import GameState
+from engine.inventory_system import InventorySystem
+from engine.locale_manager import LocaleManager
+from engine.puzzle_engine import PuzzleEngine
+
+
+def _content(tmp_path):
+    root = tmp_path / "game"
+    (root / "items").mkdir(parents=True)
+    (root / "recipes").mkdir()
+    (root / "dialogues" / "act1").mkdir(parents=True)
+    (root / "scenes").mkdir()
+    (root / "items" / "key.yaml").write_text("item:\n  id: key\n")
+    (root / "recipes" / "torch.yaml").write_text("recipe:\n  id: torch\n")
+    (root / "dialogues" / "act1" / "hi.yaml").write_text(
+        "dialogue:\n  id: hi\n  lines:\n    - text: Hello\n"
+    )
+    (root / "puzzles.yaml").write_text("puzzles:\n  - id: gate\n    type: logic\n")
+    (root / "scenes" / "ignored.yaml").write_text("scene: {id: ignored}\n")
+    locales = tmp_path / "locales"
+    locales.mkdir()
+    (locales / "fr.yaml").write_text("ui:\n  start: Commencer\n")
+    return str(root), str(locales)
+
+
+def _subsystems(tmp_path):
+    state = GameState(save_path=str(tmp_path / "save.json"))
+    return {
+        "inventory": InventorySystem(state),
+        "locales": LocaleManager(),
+        "dialogues": DialogueEngine(state),
+        "puzzles": PuzzleEngine(state),
+    }
+
+
+def test_discover_classifies_files(tmp_path):
+    root, locales = _content(tmp_path)
+    files = ContentLoader(root, locales).discover()
+    kinds = {os.path.basename(f.path): f.kind for f in files}
+    assert kinds == {
+        "key.yaml": "items",
+        "torch.yaml": "recipes",
+        "hi.yaml": "dialogues",
+        "puzzles.yaml": "puzzles",
+        "fr.yaml": "locales",
+    }
+
+
+@pytest.mark.parametrize("min_parallel", [1, 100])
+def test_load_fills_registries(tmp_path, min_parallel):
+    root, locales = _content(tmp_path)
+    systems = _subsystems(tmp_path)
+    loader = ContentLoader(
+        root, locales, max_workers=2, min_parallel_files=min_parallel
+    )
+
+    report = loader.load(**systems)
+
+    assert "key" in systems["inventory"].item_data
+    assert "torch" in systems["inventory"].recipes
+    assert systems["locales"].translations["fr"]["ui.start"] == "Commencer"
+    assert "hi" in systems["dialogues"].dialogues
+    assert "gate" in systems["puzzles"].registry
+    assert len(report.timings) == 5
+    assert report.counts["items"] == 1
+    assert report.parallel is (min_parallel == 1)
+    assert "Loaded 5 files" in report.summary()
+
+
+def test_broken_file_is_reported(tmp_path):
+    root, locales = _content(tmp_path)
+    (tmp_path / "game" / "items" / "bad.yaml").write_text("item: [unclosed\n")
+    systems = _subsystems(tmp_path)
+
+    report = ContentLoader(root, locales).load(**systems)
+
+    assert any(path.endswith("bad.yaml") for path in report.errors)
+    assert "key" in systems["inventory"].item_data
+
+
+def test_scene_manager_loads_content_at_startup(tmp_path):
+    import types
+
+    from engine.puzzle_manager import PuzzleManager
+    from engine.scene_manager import SceneManager
+
+    root, locales = _content(tmp_path)
+    systems = _subsystems(tmp_path)
+    state = GameState(save_path=str(tmp_path / "save.json"))
+    manager = types.SimpleNamespace(
+        config={"content": {"root": root, "locales_dir": locales}},
+        inventory=systems["inventory"],
+        locale_manager=systems["locales"],
+        dialogue_engine=systems["dialogues"],
+        puzzle_manager=PuzzleManager(state),
+    )
+
+    report = SceneManager.load_content(manager)
+
+    assert report.counts == {
+        "items": 1,
+        "recipes": 1,
+        "dialogues": 1,
+        "puzzles": 1,
+        "locales": 1,
+    }
+    assert "gate" in manager.puzzle_manager.engine.registry
+    manager.config["content"]["enabled"] = False
+    assert SceneManager.load_content(manager) is None
@@ -3,6 +3,8 @@ import sys
 import types
 import types as _types
 
+import pytest
+
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
 
@@ -33,12 +35,21 @@ def test_scene_stack_changes(monkeypatch):
             self.hotspots = []
             self.overlays = []
             self.game_state = types.SimpleNamespace()
-            self.dialogue_engine = types.SimpleNamespace(active=False, handle_event=lambda e: None, draw=lambda s: None)
+            self.dialogue_engine = types.SimpleNamespace(
+                active=False, handle_event=lambda e: None, draw=lambda s: None
+            )
             self.timeline_engine = types.SimpleNamespace(update=lambda t, scene: None)
             self.active_features = {}
             self.scene_start_time = 0
             self.current_scene_id = None
             self.current_scene = None
+            self.logical_size = None
+
+        def create_renderer(self, **kw):
+            return types.SimpleNamespace()
+
+        def create_scheduler(self, **kw):
+            return types.SimpleNamespace(clock=DummyClock())
 
         def open_scene(self, path: str) -> None:
             self.opened.append(path)
@@ -61,3 +72,25 @@ def test_scene_stack_changes(monkeypatch):
 
     loop.pop_scene()
     assert loop.running is False
+
+
+def test_renderer_and_scheduler_come_from_scene_manager(monkeypatch):
+    dummy_pg = types.SimpleNamespace(time=types.SimpleNamespace(Clock=lambda: "clock"))
+    monkeypatch.setattr("engine.engine_loop.pygame", dummy_pg, raising=False)
+    from engine.engine_loop import EngineLoop
+
+    calls = {}
+    manager = types.SimpleNamespace(
+        logical_size=(320, 180),
+        create_renderer=lambda **kw: calls.setdefault("renderer", kw) and "renderer",
+        create_scheduler=lambda **kw: calls.setdefault("scheduler", kw)
+        and types.SimpleNamespace(clock="clock"),
+    )
+    loop = EngineLoop(None, "start", manager, dirty_rects=True, logical_size=(320, 180))
+    assert loop.renderer == "renderer"
+    assert loop.clock == "clock"
+    assert calls["renderer"] == {"dirty_rects": True, "scale_mode": None}
+    assert calls["scheduler"] == {"target_fps": None, "performance": None}
+
+    with pytest.raises(ValueError):
+        EngineLoop(None, "start", manager, logical_size=(640, 360))
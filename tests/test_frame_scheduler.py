@@ -0,0 +1,112 @@
+import os
+import sys
+import types
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from engine.frame_scheduler import FrameScheduler
+from engine.game_state import GameState
+from engine.scene_manager import SceneManager
+from engine.timeline_engine import TimelineEngine
+
+
+class FakeTime:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class RecordingClock:
+    def __init__(self):
+        self.calls = []
+
+    def tick(self, fps):
+        self.calls.append(fps)
+
+
+def _run(scheduler, clock, frame_time, frames):
+    timings = []
+    for _ in range(frames):
+        clock.now += frame_time
+        timings.append(scheduler.tick())
+    return timings
+
+
+def test_fixed_steps_independent_of_frame_rate():
+    for fps in (30, 60, 144):
+        clock = FakeTime()
+        scheduler = FrameScheduler(step=1 / 60, time_source=clock, target_fps=fps)
+        assert scheduler.tick().steps == 0
+        timings = _run(scheduler, clock, 1 / fps, fps)
+        assert abs(sum(t.steps for t in timings) - 60) <= 1
+        assert all(t.render for t in timings)
+
+
+def test_overload_drops_time_and_skips_renders():
+    clock = FakeTime()
+    scheduler = FrameScheduler(
+        step=1 / 60, max_steps=5, max_frame_skip=2, time_source=clock
+    )
+    scheduler.tick()
+    timings = _run(scheduler, clock, 0.5, 4)
+    assert [t.steps for t in timings] == [5, 5, 5, 5]
+    assert [t.render for t in timings] == [False, False, True, False]
+    assert scheduler.dropped_time > 1.5
+    assert scheduler.skipped_frames == 3
+
+
+def test_performance_manager_sets_frame_cap():
+    perf = types.SimpleNamespace(target_fps=30, set_target_fps=lambda fps: None)
+    clock = RecordingClock()
+    scheduler = FrameScheduler(performance=perf, clock=clock, time_source=FakeTime())
+    scheduler.tick()
+    perf.target_fps = 120
+    scheduler.tick()
+    assert clock.calls == [30, 120]
+
+
+def test_run_frame_calls_update_and_render():
+    clock = FakeTime()
+    scheduler = FrameScheduler(step=0.1, target_fps=4, time_source=clock)
+    scheduler.tick()
+    updates, renders = [], []
+    clock.now += 0.25
+    scheduler.run_frame(updates.append, renders.append)
+    assert updates == [0.1, 0.1]
+    assert len(renders) == 1 and abs(renders[0] - 0.5) < 1e-9
+
+
+def test_scene_manager_update_drives_timeline(tmp_path):
+    state = GameState(str(tmp_path / "save.json"))
+    timeline = TimelineEngine(state)
+    timeline.schedule_events(
+        TimelineEngine.parse_events(
+            [{"id": "e", "time": 1.0, "action": "set_flag", "flag": "done"}]
+        ),
+        None,
+        "room",
+    )
+    reactivated = []
+    puzzle_steps = []
+    manager = types.SimpleNamespace(
+        clock_ms=0.0,
+        scene_start_time=0.0,
+        current_scene_id="room",
+        current_scene="scene",
+        timeline_engine=timeline,
+        dialogue_engine=types.SimpleNamespace(update=lambda dt: None),
+        puzzle_manager=types.SimpleNamespace(update=puzzle_steps.append),
+        active_features={"time_loop": 1500},
+        activate_scene=reactivated.append,
+    )
+    for _ in range(59):
+        SceneManager.update(manager, 1 / 60)
+    assert state.get_flag("done") is False
+    SceneManager.update(manager, 1 / 60)
+    assert state.get_flag("done") is True
+    for _ in range(30):
+        SceneManager.update(manager, 1 / 60)
+    assert reactivated == ["scene"]
+    assert len(puzzle_steps) == 90 and puzzle_steps[0] == 1 / 60
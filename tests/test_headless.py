@@ -0,0 +1,57 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+pygame = pytest.importorskip("pygame")
+
+from engine.headless import create_display, headless_mode
+from engine.renderer import Renderer
+from tools import frame_benchmark
+
+
+@pytest.fixture
+def dummy_env(monkeypatch):
+    monkeypatch.setenv("SDL_VIDEODRIVER", "dummy")
+    monkeypatch.setenv("SDL_AUDIODRIVER", "dummy")
+    yield
+    pygame.quit()
+
+
+def test_headless_mode_values():
+    assert headless_mode(False) is None
+    assert headless_mode("off") is None
+    assert headless_mode(True) == "dummy"
+    assert headless_mode("Offscreen") == "offscreen"
+    with pytest.raises(ValueError):
+        headless_mode("vulkan")
+
+
+def test_dummy_display_sets_mode(dummy_env):
+    screen = create_display((64, 48), headless=True)
+    assert pygame.display.get_surface() is screen
+    assert screen.get_size() == (64, 48)
+
+
+def test_offscreen_renderer_never_presents(dummy_env, monkeypatch):
+    screen = create_display((64, 48), headless="offscreen")
+    assert pygame.display.get_surface() is None
+    calls = []
+    monkeypatch.setattr(pygame.display, "flip", lambda: calls.append("flip"))
+    renderer = Renderer(screen)
+    layer = pygame.Surface((64, 48))
+    layer.fill((0, 0, 255))
+    renderer.begin_frame([layer])
+    renderer.end_frame()
+    assert calls == []
+    assert renderer.frames == 1
+    assert screen.get_at((5, 5))[:3] == (0, 0, 255)
+
+
+def test_frame_benchmark_runs_headless(dummy_env):
+    result = frame_benchmark.benchmark(frames=5, size=(160, 120), mode="offscreen")
+    assert result["frames"] == 5
+    assert result["fps"] > 0
+    assert result["full_frames"] == 5
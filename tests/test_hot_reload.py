@@ -0,0 +1,202 @@
+import os
+import sys
+import types
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+yaml = pytest.importorskip("yaml")
+
+from engine.dialogue_engine import DialogueEngine
+from engine.game_state import GameState
+from engine.hot_reload import HotReloader, patch_hotspots, reload_scene
+from engine.hotspot import Hotspot
+from engine.locale_manager import LocaleManager
+from engine.puzzle_engine import PuzzleEngine
+from engine.scene_cache import SceneCache
+from engine.scene_manager import SceneManager
+
+
+def _rewrite(path, content):
+    stamp = os.stat(path).st_mtime_ns if os.path.exists(path) else 0
+    path.write_text(content)
+    os.utime(path, ns=(stamp + 1_000_000, stamp + 1_000_000))
+
+
+def test_patch_hotspots_keeps_identity():
+    door = Hotspot(id="door", area=(0, 0, 10, 10), action="open_scene", target="a")
+    lamp = Hotspot(id="lamp", area=(5, 5, 1, 1), action="toggle_flag", target="lit")
+    live = [door, lamp]
+    new = [
+        Hotspot(id="door", area=(0, 0, 20, 20), action="open_scene", target="a"),
+        Hotspot(id="bell", area=(1, 1, 1, 1), action="toggle_flag", target="rang"),
+    ]
+
+    diff = patch_hotspots(live, new)
+
+    assert live[0] is door and door.area == (0, 0, 20, 20)
+    assert [hs.id for hs in live] == ["door", "bell"]
+    assert (diff.added, diff.changed, diff.removed) == (["bell"], ["door"], ["lamp"])
+
+
+def test_patch_hotspots_resets_shape_caches():
+    live = [Hotspot(id="door", area=(0, 0, 10, 10), action="noop", mask="old.png")]
+    door = live[0]
+    door.rect()
+    door._mask_bits = object()
+
+    patch_hotspots(
+        live, [Hotspot(id="door", area=(0, 0, 20, 20), action="noop", mask="new.png")]
+    )
+
+    assert door._mask_bits is None and door._rect_cache is None
+    assert tuple(door.rect()) == (0, 0, 20, 20)
+
+
+def test_watch_content_registers_loaded_files(tmp_path):
+    from engine.content_loader import ContentLoader
+
+    root = tmp_path / "game"
+    (root / "dialogues").mkdir(parents=True)
+    _rewrite(
+        root / "dialogues" / "hi.yaml",
+        "dialogue:\n  id: hi\n  lines: [{text: Hello}]\n",
+    )
+    _rewrite(root / "puzzles.yaml", "puzzles:\n  - id: gate\n    solution: 1\n")
+    loc_dir = tmp_path / "locales"
+    loc_dir.mkdir()
+    _rewrite(loc_dir / "en.yaml", "ui:\n  start: Start\n")
+    state = GameState(save_path=str(tmp_path / "s.json"))
+    dialogues, locales, puzzles = (
+        DialogueEngine(state),
+        LocaleManager(),
+        PuzzleEngine(state),
+    )
+    report = ContentLoader(str(root), str(loc_dir)).load(
+        locales=locales, dialogues=dialogues, puzzles=puzzles
+    )
+
+    reloader = HotReloader(interval=0)
+    reloader.watch_content(
+        report, dialogues=dialogues, locales=locales, puzzles=puzzles
+    )
+    _rewrite(
+        root / "dialogues" / "hi.yaml", "dialogue:\n  id: hi\n  lines: [{text: Hey}]\n"
+    )
+    _rewrite(root / "puzzles.yaml", "puzzles:\n  - id: gate\n    solution: 2\n")
+    _rewrite(loc_dir / "en.yaml", "ui:\n  start: Begin\n")
+    assert len(reloader.poll()) == 3
+
+    assert dialogues.dialogues["hi"].lines[0].text == "Hey"
+    assert puzzles.registry["gate"].solution == 2
+    assert locales.translations["en"] == {"ui.start": "Begin"}
+
+
+def test_dialogue_reload_only_touches_its_file(tmp_path):
+    path = tmp_path / "talk.yaml"
+    _rewrite(
+        path,
+        "dialogues:\n  - id: a\n    lines: [{text: one}]\n"
+        "  - id: b\n    lines: [{text: two}]\n",
+    )
+    engine = DialogueEngine(GameState(save_path=str(tmp_path / "s.json")))
+    engine.load_file(str(path))
+    engine.load_dialogue("other", {"lines": [{"text": "keep"}]})
+    untouched = engine.dialogues["b"]
+
+    reloader = HotReloader(interval=0)
+    reloader.watch_dialogues(engine, str(path))
+    assert reloader.poll() == []
+
+    _rewrite(
+        path,
+        "dialogues:\n  - id: a\n    lines: [{text: uno}]\n"
+        "  - id: b\n    lines: [{text: two}]\n",
+    )
+    assert reloader.poll() == [str(path)]
+    assert engine.dialogues["a"].lines[0].text == "uno"
+    assert engine.dialogues["b"] is untouched
+    assert "other" in engine.dialogues
+
+    _rewrite(path, "dialogues:\n  - id: b\n    lines: [{text: two}]\n")
+    reloader.poll()
+    assert "a" not in engine.dialogues
+    assert "other" in engine.dialogues
+
+
+def test_locale_and_puzzle_reload(tmp_path):
+    loc_dir = tmp_path / "locales"
+    loc_dir.mkdir()
+    _rewrite(loc_dir / "en.yaml", "ui:\n  start: Start\n  quit: Quit\n")
+    locales = LocaleManager()
+    locales.load_locales(str(loc_dir))
+
+    puzzles_path = tmp_path / "puzzles.yaml"
+    _rewrite(puzzles_path, "puzzles:\n  - id: gate\n    solution: 1\n")
+    state = GameState(save_path=str(tmp_path / "s.json"))
+    puzzles = PuzzleEngine(state)
+    puzzles.load_file(str(puzzles_path))
+    puzzles.registry["gate"].solved = True
+
+    reloader = HotReloader(interval=0)
+    reloader.watch_locales(locales)
+    reloader.watch_puzzles(puzzles, str(puzzles_path))
+
+    _rewrite(loc_dir / "en.yaml", "ui:\n  start: Begin\n")
+    _rewrite(loc_dir / "fr.yaml", "ui:\n  start: Commencer\n")
+    _rewrite(puzzles_path, "puzzles:\n  - id: gate\n    solution: 2\n")
+    reloader.poll()
+
+    assert locales.translations["en"] == {"ui.start": "Begin"}
+    assert locales.translations["fr"] == {"ui.start": "Commencer"}
+    assert puzzles.registry["gate"].solution == 2
+    assert puzzles.registry["gate"].solved is True
+
+
+def test_broken_file_keeps_previous_state(tmp_path):
+    path = tmp_path / "talk.yaml"
+    _rewrite(path, "dialogue:\n  id: a\n  lines: [{text: one}]\n")
+    engine = DialogueEngine(GameState(save_path=str(tmp_path / "s.json")))
+    engine.load_file(str(path))
+    reloader = HotReloader(interval=0)
+    reloader.watch_dialogues(engine, str(path))
+
+    _rewrite(path, "dialogue: [unclosed\n")
+    assert reloader.poll() == []
+    assert engine.dialogues["a"].lines[0].text == "one"
+
+
+def test_reload_current_scene_patches_hotspots(tmp_path):
+    path = tmp_path / "room.yaml"
+    _rewrite(
+        path,
+        "scene: {id: room}\nhotspots:\n"
+        "  - {id: door, area: [0, 0, 5, 5], action: noop}\n",
+    )
+    cache = SceneCache(write_disk=False)
+    scene = cache.load(str(path), SceneManager.build_scene)
+    activated = []
+    manager = types.SimpleNamespace(
+        current_scene=scene,
+        current_scene_id="room",
+        hotspots=scene.hotspots,
+        resolve_scene_path=lambda target: (str(path), "room"),
+        load_scene=lambda p: cache.load(p, SceneManager.build_scene),
+        activate_scene=activated.append,
+    )
+    live = manager.hotspots
+
+    _rewrite(
+        path,
+        "scene: {id: room}\nhotspots:\n"
+        "  - {id: door, area: [0, 0, 9, 9], action: noop}\n",
+    )
+    diff = reload_scene(manager, str(path))
+    assert diff.changed == ["door"]
+    assert manager.hotspots is live and live[0].area == (0, 0, 9, 9)
+    assert activated == []
+
+    _rewrite(path, "scene: {id: room, overlays: [fog.png]}\nhotspots: []\n")
+    reload_scene(manager, str(path))
+    assert activated and activated[0].overlays == ["fog.png"]
@@ -0,0 +1,149 @@
+import os
+import random
+import sys
+import types
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+pygame = pytest.importorskip("pygame")
+
+from engine.game_state import GameState
+from engine.hotspot import Hotspot
+from engine.hotspot_index import HotspotGrid
+from engine.scene_manager import SceneManager
+
+
+def _random_hotspots(count: int, seed: int = 7) -> list:
+    rng = random.Random(seed)
+    return [
+        Hotspot(
+            id=f"hs{idx}",
+            area=(
+                rng.randint(-20, 600),
+                rng.randint(-20, 400),
+                rng.randint(0, 90),
+                rng.randint(0, 90),
+            ),
+            action="noop",
+        )
+        for idx in range(count)
+    ]
+
+
+def test_grid_matches_linear_scan():
+    hotspots = _random_hotspots(200)
+    grid = HotspotGrid(hotspots, cell_size=32)
+    rng = random.Random(1)
+    for _ in range(500):
+        pos = (rng.randint(-30, 700), rng.randint(-30, 500))
+        expected = [hs for hs in hotspots if hs.check_click(pos)]
+        assert grid.query(pos) == expected
+
+
+def test_rebuild_after_edit():
+    hotspots = [Hotspot(id="door", area=(0, 0, 10, 10), action="noop")]
+    grid = HotspotGrid(hotspots)
+    hotspots[0].area = (200, 200, 10, 10)
+    hotspots.append(Hotspot(id="chest", area=(0, 0, 5, 5), action="noop"))
+    assert grid.query((205, 205)) == []
+
+    grid.rebuild()
+    assert [hs.id for hs in grid.query((205, 205))] == ["door"]
+    assert [hs.id for hs in grid.query((1, 1))] == ["chest"]
+
+
+def test_rect_cache_follows_area():
+    hs = Hotspot(id="door", area=(0, 0, 10, 10), action="noop")
+    assert hs.rect() is hs.rect()
+    hs.area = (5, 5, 1, 1)
+    assert tuple(hs.rect()) == (5, 5, 1, 1)
+
+
+def test_scene_manager_hotspots_at_filters_conditions(tmp_path):
+    state = GameState(str(tmp_path / "save.json"))
+    hotspots = [
+        Hotspot(id="a", area=(0, 0, 50, 50), action="noop"),
+        Hotspot(id="b", area=(10, 10, 50, 50), action="noop", condition="has_key"),
+    ]
+    manager = types.SimpleNamespace(
+        hotspots=hotspots, hotspot_index=HotspotGrid(hotspots), game_state=state
+    )
+    assert [hs.id for hs in SceneManager.hotspots_at(manager, (20, 20))] == ["a"]
+
+    state.set_flag("has_key", True)
+    assert [hs.id for hs in SceneManager.hotspots_at(manager, (20, 20))] == ["a", "b"]
+
+
+def test_numpy_index_matches_grid():
+    pytest.importorskip("numpy")
+    from engine.hotspot_index import HotspotArrayIndex
+
+    hotspots = _random_hotspots(300)
+    grid = HotspotGrid(hotspots)
+    array_index = HotspotArrayIndex(hotspots)
+    rng = random.Random(3)
+    points = [(rng.randint(-30, 700), rng.randint(-30, 500)) for _ in range(300)]
+    for pos in points:
+        assert array_index.query(pos) == grid.query(pos)
+    assert array_index.query_many(points, chunk=64) == [
+        grid.query(pos) for pos in points
+    ]
+
+
+def test_numpy_active_mask(tmp_path):
+    pytest.importorskip("numpy")
+    from engine.hotspot_index import HotspotArrayIndex
+
+    state = GameState(str(tmp_path / "save.json"))
+    hotspots = [
+        Hotspot(id="a", area=(0, 0, 10, 10), action="noop"),
+        Hotspot(id="b", area=(0, 0, 10, 10), action="noop", condition="lamp_on"),
+    ]
+    index = HotspotArrayIndex(hotspots)
+    index.update_active(state)
+    assert [hs.id for hs in index.query((5, 5), active_only=True)] == ["a"]
+    state.set_flag("lamp_on", True)
+    index.update_active(state)
+    assert [hs.id for hs in index.query((5, 5), active_only=True)] == ["a", "b"]
+
+
+def test_scene_manager_uses_numpy_active_mask(tmp_path, monkeypatch):
+    pytest.importorskip("numpy")
+    from engine.hotspot_index import HotspotArrayIndex
+
+    state = GameState(str(tmp_path / "save.json"))
+    hotspots = [
+        Hotspot(id="a", area=(0, 0, 50, 50), action="noop"),
+        Hotspot(id="b", area=(10, 10, 50, 50), action="noop", condition="has_key"),
+    ]
+    index = HotspotArrayIndex(hotspots)
+    manager = types.SimpleNamespace(
+        hotspots=hotspots, hotspot_index=index, game_state=state
+    )
+    assert [hs.id for hs in SceneManager.hotspots_at(manager, (20, 20))] == ["a"]
+
+    checks = []
+    monkeypatch.setattr(
+        Hotspot, "is_active", lambda hs, st: checks.append(hs.id) or True
+    )
+    assert [hs.id for hs in SceneManager.hotspots_at(manager, (20, 20))] == ["a"]
+    assert checks == []
+
+    state.set_flag("has_key", True)
+    assert [hs.id for hs in SceneManager.hotspots_at(manager, (20, 20))] == ["a", "b"]
+    assert checks == ["b"]
+
+
+def test_build_hotspot_index_backends():
+    from engine import hotspot_index
+
+    few = _random_hotspots(3)
+    assert isinstance(hotspot_index.build_hotspot_index(few), HotspotGrid)
+    assert isinstance(hotspot_index.build_hotspot_index(few, "grid"), HotspotGrid)
+    many = _random_hotspots(hotspot_index.NUMPY_MIN_HOTSPOTS)
+    expected = (
+        HotspotGrid if hotspot_index.np is None else hotspot_index.HotspotArrayIndex
+    )
+    assert isinstance(hotspot_index.build_hotspot_index(many), expected)
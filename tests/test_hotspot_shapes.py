@@ -0,0 +1,105 @@
+import os
+import sys
+import types
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+pygame = pytest.importorskip("pygame")
+
+from engine.game_state import GameState
+from engine.hotspot import Hotspot
+from engine.hotspot_index import ShapedHotspotIndex, build_hotspot_index
+from engine.hotspot_shapes import HotspotIdBuffer, point_in_polygon
+from engine.scene_manager import SceneManager
+
+TRIANGLE = ((10, 10), (60, 10), (10, 60))
+
+
+def test_polygon_buffer_matches_point_test():
+    buffer = HotspotIdBuffer(80, 80)
+    buffer.paint_polygon(TRIANGLE, 1)
+    for x in range(80):
+        for y in range(80):
+            expected = point_in_polygon(x + 0.5, y + 0.5, TRIANGLE)
+            assert (buffer.lookup((x, y)) == 1) == expected, (x, y)
+
+
+def test_reduced_resolution_buffer():
+    buffer = HotspotIdBuffer(100, 100, scale=4)
+    assert len(buffer.cells) == 25 * 25
+    buffer.paint_polygon(((0, 0), (40, 0), (40, 40), (0, 40)), 3)
+    assert buffer.lookup((20, 20)) == 3
+    assert buffer.lookup((60, 60)) == 0
+    assert buffer.lookup((500, 5)) == 0
+
+
+def test_polygon_hotspot_bounds_and_click():
+    hs = Hotspot(id="tri", area=(0, 0, 0, 0), action="noop", polygon=TRIANGLE)
+    assert hs.area == (10, 10, 51, 51)
+    assert hs.check_click((15, 15))
+    assert not hs.check_click((55, 55))
+
+
+def test_mask_hotspot_uses_alpha():
+    mask = pygame.mask.Mask((20, 20))
+    mask.set_at((5, 5), 1)
+    hotspots = [
+        Hotspot(id="rect", area=(0, 0, 100, 100), action="noop"),
+        Hotspot(id="blob", area=(30, 30, 20, 20), action="noop", mask="blob.png"),
+    ]
+    index = ShapedHotspotIndex(
+        hotspots, (100, 100), scale=1, mask_loader=lambda path: mask
+    )
+    assert [hs.id for hs in index.query((35, 35))] == ["rect", "blob"]
+    assert [hs.id for hs in index.query((36, 36))] == ["rect"]
+    assert hotspots[1].check_click((35, 35)) and not hotspots[1].check_click((36, 36))
+
+
+def test_build_index_for_shaped_scene():
+    data = {
+        "scene": {"id": "room"},
+        "hotspots": [
+            {"id": "door", "area": [0, 0, 10, 10], "action": "noop"},
+            {"id": "rug", "polygon": [[10, 10], [60, 10], [10, 60]], "action": "noop"},
+        ],
+    }
+    scene = SceneManager.build_scene(data)
+    index = build_hotspot_index(scene.hotspots, size=(80, 80), scale=1)
+    assert isinstance(index, ShapedHotspotIndex)
+    assert [hs.id for hs in index.query((12, 12))] == ["rug"]
+    assert [hs.id for hs in index.query((5, 5))] == ["door"]
+    assert index.query((55, 55)) == []
+
+
+def test_inactive_top_polygon_does_not_hide_active_one(tmp_path):
+    state = GameState(str(tmp_path / "save.json"))
+    square = [[0, 0], [40, 0], [40, 40], [0, 40]]
+    hotspots = [
+        Hotspot(
+            id="floor",
+            polygon=square,
+            area=(0, 0, 0, 0),
+            action="noop",
+            condition="lit",
+        ),
+        Hotspot(
+            id="trap",
+            polygon=square,
+            area=(0, 0, 0, 0),
+            action="noop",
+            condition="armed",
+        ),
+    ]
+    index = ShapedHotspotIndex(hotspots, (50, 50), scale=1)
+    manager = types.SimpleNamespace(
+        hotspots=hotspots, hotspot_index=index, game_state=state
+    )
+    assert SceneManager.hotspots_at(manager, (10, 10)) == []
+
+    state.set_flag("lit")
+    assert [hs.id for hs in SceneManager.hotspots_at(manager, (10, 10))] == ["floor"]
+    state.set_flag("armed")
+    assert [hs.id for hs in SceneManager.hotspots_at(manager, (10, 10))] == ["trap"]
+    assert index.buffer.lookup_all((10, 10)) == (1, 2)
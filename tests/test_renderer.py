@@ -0,0 +1,150 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+pygame = pytest.importorskip("pygame")
+
+from engine.renderer import Renderer
+
+
+@pytest.fixture
+def screen(monkeypatch):
+    monkeypatch.setenv("SDL_VIDEODRIVER", "dummy")
+    pygame.display.init()
+    surface = pygame.display.set_mode((100, 80))
+    calls = []
+    monkeypatch.setattr(pygame.display, "flip", lambda: calls.append("flip"))
+    monkeypatch.setattr(
+        pygame.display, "update", lambda rects: calls.append(list(rects))
+    )
+    yield surface, calls
+    pygame.display.quit()
+
+
+def _overlay(color):
+    surf = pygame.Surface((100, 80))
+    surf.fill(color)
+    return surf
+
+
+def test_full_mode_flips_every_frame(screen):
+    surface, calls = screen
+    renderer = Renderer(surface)
+    overlays = [_overlay((0, 0, 255))]
+    for _ in range(3):
+        renderer.begin_frame(overlays)
+        renderer.end_frame()
+    assert calls == ["flip"] * 3
+    assert renderer.target is surface
+
+
+def test_dirty_mode_updates_only_changed_regions(screen):
+    surface, calls = screen
+    renderer = Renderer(surface, dirty_rects=True)
+    overlays = [_overlay((0, 0, 255))]
+    box = pygame.Surface((10, 10))
+    box.fill((255, 0, 0))
+
+    renderer.begin_frame(overlays, "room")
+    renderer.target.blit(box, (5, 5))
+    renderer.end_frame()
+    assert calls == ["flip"]
+
+    renderer.begin_frame(overlays, "room")
+    renderer.target.blit(box, (30, 30))
+    renderer.end_frame()
+    assert calls[-1] == [pygame.Rect(5, 5, 10, 10), pygame.Rect(30, 30, 10, 10)]
+    # the old box position was restored from the static layers
+    assert surface.get_at((6, 6))[:3] == (0, 0, 255)
+    assert surface.get_at((31, 31))[:3] == (255, 0, 0)
+
+    renderer.begin_frame(overlays, "room")
+    renderer.end_frame()
+    assert calls[-1] == [pygame.Rect(30, 30, 10, 10)]
+
+    renderer.begin_frame(overlays, "room")
+    renderer.end_frame()
+    assert len(calls) == 3
+
+
+def test_scene_change_falls_back_to_flip(screen):
+    surface, calls = screen
+    renderer = Renderer(surface, dirty_rects=True)
+    renderer.begin_frame([_overlay((0, 0, 255))], "a")
+    renderer.end_frame()
+    renderer.begin_frame([_overlay((0, 255, 0))], "b")
+    renderer.end_frame()
+    assert calls == ["flip", "flip"]
+    assert surface.get_at((50, 50))[:3] == (0, 255, 0)
+    assert renderer.full_frames == 2
+
+
+def test_large_dirty_area_flips(screen):
+    surface, calls = screen
+    renderer = Renderer(surface, dirty_rects=True, full_redraw_ratio=0.5)
+    overlays = []
+    renderer.begin_frame(overlays)
+    renderer.end_frame()
+    renderer.begin_frame(overlays)
+    renderer.target.fill((1, 2, 3), pygame.Rect(0, 0, 100, 60))
+    renderer.end_frame()
+    assert calls == ["flip", "flip"]
+
+
+def test_static_layers_composited_once(screen):
+    surface, _ = screen
+    renderer = Renderer(surface)
+    half = pygame.Surface((100, 40), pygame.SRCALPHA)
+    half.fill((255, 0, 0, 255))
+    layers = [_overlay((0, 0, 255)), half]
+    for _ in range(5):
+        renderer.begin_frame(layers, "room")
+        renderer.end_frame()
+    assert renderer.composites_built == 1
+    assert surface.get_at((10, 10))[:3] == (255, 0, 0)
+    assert surface.get_at((10, 60))[:3] == (0, 0, 255)
+
+    other = [_overlay((0, 255, 0))]
+    renderer.begin_frame(other, "hall")
+    renderer.begin_frame(layers, "room")
+    assert renderer.composites_built == 2
+
+
+def test_logical_canvas_scaled_once_to_window(screen):
+    surface, calls = screen
+    renderer = Renderer(surface, logical_size=(50, 40), scale_mode="fast")
+    assert renderer.target.get_size() == (50, 40)
+    half = pygame.Surface((50, 40), pygame.SRCALPHA)
+    half.fill((255, 0, 0, 255), pygame.Rect(0, 0, 25, 40))
+    renderer.begin_frame([_overlay((0, 0, 255)), half])
+    renderer.end_frame()
+    assert calls == ["flip"]
+    assert surface.get_at((45, 10))[:3] == (255, 0, 0)
+    assert surface.get_at((55, 10))[:3] == (0, 0, 255)
+    assert renderer.to_logical((99, 79)) == (49, 39)
+    assert renderer.to_logical((50, 20)) == (25, 10)
+
+
+def test_integer_scaling_letterboxes(screen):
+    surface, calls = screen
+    renderer = Renderer(
+        surface, dirty_rects=True, logical_size=(30, 20), scale_mode="integer"
+    )
+    box = pygame.Surface((2, 2))
+    box.fill((255, 0, 0))
+    layers = [_overlay((0, 0, 255))]
+    renderer.begin_frame(layers)
+    renderer.end_frame()
+    assert renderer.viewport == pygame.Rect(5, 10, 90, 60)
+    assert surface.get_at((2, 40))[:3] == (0, 0, 0)
+    assert renderer.to_logical((5, 10)) == (0, 0)
+
+    renderer.begin_frame(layers)
+    renderer.target.blit(box, (10, 10))
+    renderer.end_frame()
+    # dirty rects are mapped to window space (with a pixel of margin)
+    assert calls[-1] == [pygame.Rect(34, 39, 8, 8)]
+    assert surface.get_at((36, 41))[:3] == (255, 0, 0)
@@ -0,0 +1,69 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+yaml = pytest.importorskip("yaml")
+
+from engine.scene_cache import SceneCache
+from engine.scene_manager import SceneManager
+
+SCENE_YAML = """
+scene:
+  id: cached
+  background: bg.png
+hotspots:
+  - id: door
+    area: [1, 2, 3, 4]
+    action: open_scene
+    target: other
+"""
+
+
+def _write_scene(path, content=SCENE_YAML):
+    path.write_text(content)
+    return str(path)
+
+
+def test_memory_hit_reuses_scene(tmp_path):
+    path = _write_scene(tmp_path / "cached.yaml")
+    cache = SceneCache()
+
+    first = cache.load(path, SceneManager.build_scene)
+    second = cache.load(path, SceneManager.build_scene)
+
+    assert first is second
+    assert first.hotspots[0].area == (1, 2, 3, 4)
+    assert cache.stats()["misses"] == 1
+    assert cache.stats()["hits"] == 1
+
+
+def test_disk_cache_skips_yaml(tmp_path, monkeypatch):
+    path = _write_scene(tmp_path / "cached.yaml")
+    SceneCache().load(path, SceneManager.build_scene)
+    assert os.path.exists(SceneCache.compiled_path(path))
+
+    def fail(*args, **kwargs):
+        raise AssertionError("YAML parser should not run")
+
+    monkeypatch.setattr("engine.scene_cache.load_yaml", fail)
+    cache = SceneCache()
+    scene = cache.load(path, SceneManager.build_scene)
+    assert scene.id == "cached"
+    assert cache.stats()["disk_hits"] == 1
+
+
+def test_changed_file_is_reparsed(tmp_path):
+    path = _write_scene(tmp_path / "cached.yaml")
+    cache = SceneCache(write_disk=False)
+    first = cache.load(path, SceneManager.build_scene)
+
+    _write_scene(tmp_path / "cached.yaml", SCENE_YAML.replace("cached", "renamed!"))
+    second = cache.load(path, SceneManager.build_scene)
+
+    assert second is not first
+    assert second.id == "renamed!"
+    assert cache.stats()["misses"] == 2
+    assert not os.path.exists(SceneCache.compiled_path(path))
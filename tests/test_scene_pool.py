@@ -0,0 +1,38 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from engine.scene import Scene
+from engine.scene_pool import ActivatedScene, ActivatedScenePool
+
+
+def test_pool_returns_snapshot_for_same_scene():
+    pool = ActivatedScenePool()
+    scene = Scene(id="loop", background=None)
+    activated = ActivatedScene(scene=scene, overlays=["ov"])
+    pool.put(activated)
+
+    assert pool.get(scene) is activated
+    assert pool.hits == 1
+
+
+def test_reloaded_scene_misses():
+    pool = ActivatedScenePool()
+    pool.put(ActivatedScene(scene=Scene(id="loop", background=None)))
+
+    assert pool.get(Scene(id="loop", background=None)) is None
+    assert pool.misses == 1
+
+
+def test_pool_evicts_least_recent():
+    pool = ActivatedScenePool(max_size=2)
+    scenes = [Scene(id=name, background=None) for name in ("a", "b", "c")]
+    for scene in scenes[:2]:
+        pool.put(ActivatedScene(scene=scene))
+    pool.get(scenes[0])
+    pool.put(ActivatedScene(scene=scenes[2]))
+
+    assert len(pool) == 2
+    assert pool.get(scenes[1]) is None
+    assert pool.get(scenes[0]) is not None
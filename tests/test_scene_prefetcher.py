@@ -0,0 +1,182 @@
+import os
+import sys
+import time
+import types
+from concurrent.futures import Future
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+yaml = pytest.importorskip("yaml")
+
+from engine.asset_requests import AssetHandle
+from engine.scene_cache import SceneCache
+from engine.scene_manager import SceneManager
+from engine.scene_prefetcher import ScenePrefetcher
+from engine.world_manager import Region
+
+
+class DummySurface:
+    def get_width(self):
+        return 10
+
+    def get_height(self):
+        return 10
+
+    def get_bytesize(self):
+        return 4
+
+
+class DummyAssets:
+    def __init__(self):
+        self.loaded = []
+        self.cached = set()
+        self.held = {}
+
+    def request_image(self, path):
+        self.loaded.append(path)
+        if path in self.cached:
+            return AssetHandle.completed(("image", path), DummySurface())
+        future = Future()
+        future.set_result(DummySurface())
+        return AssetHandle(("image", path), future)
+
+    def request_sound(self, path):
+        self.loaded.append(path)
+        return AssetHandle.completed(("sound", path), None)
+
+    def acquire_scene(self, holder, paths):
+        self.held[holder] = list(paths)
+
+
+def _manager(tmp_path):
+    scenes = {
+        "a": "scene: {id: a}\nhotspots:\n"
+        "  - {id: b, area: [0, 0, 1, 1], action: open_scene, target: b}\n"
+        "  - {id: t, area: [0, 0, 1, 1], action: teleport, target: port}\n",
+        "b": "scene: {id: b, background: b.png}\nhotspots:\n"
+        "  - {id: c, area: [0, 0, 1, 1], action: open_scene, target: c}\n",
+        "c": "scene: {id: c, background: c.png}\n",
+        "d": "scene: {id: d, overlays: [d.png]}\n",
+    }
+    for name, content in scenes.items():
+        (tmp_path / f"{name}.yaml").write_text(content)
+
+    cache = SceneCache(write_disk=False)
+
+    def resolve(target):
+        path = os.path.join(str(tmp_path), f"{target}.yaml")
+        return path, target
+
+    world = types.SimpleNamespace(
+        regions={"port": Region(id="port", entry_scene="d", scenes=["d"])}
+    )
+    assets = DummyAssets()
+    return types.SimpleNamespace(
+        resolve_scene_path=resolve,
+        load_scene=lambda path: cache.load(path, SceneManager.build_scene),
+        assets=assets,
+        world_manager=types.SimpleNamespace(world=world),
+        release_scene_assets=lambda holder, scene_id: assets.held.pop(holder, None),
+    )
+
+
+def test_reachable_respects_depth(tmp_path):
+    manager = _manager(tmp_path)
+    prefetcher = ScenePrefetcher(manager, depth=1)
+    assert prefetcher.reachable("a") == ["b", "d"]
+
+    prefetcher.depth = 2
+    assert prefetcher.reachable("a") == ["b", "d", "c"]
+
+
+def test_prefetch_respects_memory_budget(tmp_path):
+    manager = _manager(tmp_path)
+    prefetcher = ScenePrefetcher(manager, memory_budget_mb=400 / (1024 * 1024))
+
+    assert prefetcher.prefetch_scene("b")
+    assert prefetcher.bytes_used == 400
+    assert not prefetcher.prefetch_scene("c")
+    assert manager.assets.loaded == ["b.png"]
+
+
+def test_prefetch_counts_only_new_bytes(tmp_path):
+    manager = _manager(tmp_path)
+    manager.assets.cached.add("b.png")
+    prefetcher = ScenePrefetcher(manager, memory_budget_mb=400 / (1024 * 1024))
+
+    assert prefetcher.prefetch_scene("b")
+    assert prefetcher.bytes_used == 0
+    assert prefetcher.prefetch_scene("c")
+    assert prefetcher.bytes_used == 400
+
+
+def test_prefetch_checks_budget_after_each_asset(tmp_path):
+    manager = _manager(tmp_path)
+    (tmp_path / "e.yaml").write_text(
+        "scene: {id: e, overlays: [e1.png, e2.png, e3.png]}\n"
+    )
+    prefetcher = ScenePrefetcher(manager, memory_budget_mb=700 / (1024 * 1024))
+
+    assert prefetcher.prefetch_scene("e")
+    assert manager.assets.loaded == ["e1.png", "e2.png"]
+    assert manager.assets.held["prefetch:e"] == ["e1.png", "e2.png"]
+    assert prefetcher.bytes_used == 800
+
+
+def test_worker_prefetches_neighbours(tmp_path):
+    manager = _manager(tmp_path)
+    prefetcher = ScenePrefetcher(manager, depth=1, idle_delay=0.0)
+    prefetcher.schedule("a")
+
+    deadline = time.monotonic() + 2.0
+    while time.monotonic() < deadline and len(prefetcher.prefetched) < 2:
+        time.sleep(0.01)
+    prefetcher.stop()
+
+    assert prefetcher.is_prefetched("b")
+    assert prefetcher.is_prefetched("d")
+    assert set(manager.assets.loaded) == {"b.png", "d.png"}
+
+
+def test_unreachable_scenes_release_assets(tmp_path):
+    manager = _manager(tmp_path)
+    prefetcher = ScenePrefetcher(manager)
+    assert prefetcher.prefetch_scene("b")
+    assert prefetcher.prefetch_scene("d")
+    prefetcher.adopt("a", [])
+    assert set(manager.assets.held) == {"prefetch:a", "prefetch:b", "prefetch:d"}
+
+    prefetcher.release_unreachable({"b", "a"})
+    assert prefetcher.holding == {"a", "b"}
+    assert "prefetch:d" in manager.assets.held
+
+    assert prefetcher.process_releases() == 1
+    assert set(manager.assets.held) == {"prefetch:a", "prefetch:b"}
+
+
+def test_release_skips_scenes_prefetched_again(tmp_path):
+    manager = _manager(tmp_path)
+    prefetcher = ScenePrefetcher(manager)
+    assert prefetcher.prefetch_scene("d")
+    prefetcher.release_unreachable(set())
+    prefetcher.prefetched.clear()
+    assert prefetcher.prefetch_scene("d")
+
+    assert prefetcher.process_releases() == 0
+    assert "prefetch:d" in manager.assets.held
+
+
+def test_forget_rereads_scene_exits(tmp_path):
+    manager = _manager(tmp_path)
+    prefetcher = ScenePrefetcher(manager, depth=1)
+    assert prefetcher.reachable("a") == ["b", "d"]
+
+    (tmp_path / "a.yaml").write_text(
+        "scene: {id: a}\nhotspots:\n"
+        "  - {id: c, area: [0, 0, 1, 1], action: open_scene, target: c}\n"
+    )
+    assert prefetcher.reachable("a") == ["b", "d"]
+    prefetcher.forget("a")
+    assert prefetcher.reachable("a") == ["c"]
@@ -0,0 +1,52 @@
+import os
+import sys
+import threading
+import types
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from engine.scene_transition import PreparedScene, SceneTransition
+
+
+class DummySceneManager:
+    def __init__(self):
+        self.release = threading.Event()
+        self.entered = []
+
+    def prepare_scene(self, path):
+        self.release.wait(2.0)
+        scene = types.SimpleNamespace(id=path)
+        return PreparedScene(path=f"{path}.yaml", scene_id=path, scene=scene)
+
+    def enter_scene(self, prepared):
+        self.entered.append(prepared.scene_id)
+
+
+def test_activation_waits_for_worker():
+    manager = DummySceneManager()
+    transition = SceneTransition(manager)
+    try:
+        transition.request("next")
+        assert transition.loading
+        assert transition.poll() is False
+        assert manager.entered == []
+
+        manager.release.set()
+        assert transition.wait(2.0) is True
+        assert manager.entered == ["next"]
+        assert not transition.loading
+    finally:
+        transition.shutdown()
+
+
+def test_latest_request_wins():
+    manager = DummySceneManager()
+    transition = SceneTransition(manager)
+    try:
+        transition.request("first")
+        transition.request("second")
+        manager.release.set()
+        assert transition.wait(2.0) is True
+        assert manager.entered == ["second"]
+    finally:
+        transition.shutdown()
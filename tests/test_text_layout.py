@@ -0,0 +1,96 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+pygame = pytest.importorskip("pygame")
+
+from engine.dialogue_engine import DialogueEngine
+from engine.game_state import GameState
+from engine.text_layout import RevealedText, WordWidths, wrap_text
+
+TEXT = (
+    "You're not from around here, are you? "
+    "These ruins swallow careless travellers whole."
+)
+
+
+class CountingFont:
+    """Real font that records what gets rasterized."""
+
+    def __init__(self, font):
+        self.font = font
+        self.rendered = []
+
+    def render(self, text, aa, color):
+        self.rendered.append(text)
+        return self.font.render(text, aa, color)
+
+    def __getattr__(self, name):
+        return getattr(self.font, name)
+
+
+@pytest.fixture(scope="module")
+def font():
+    pygame.font.init()
+    yield pygame.font.Font(None, 18)
+    pygame.font.quit()
+
+
+def test_wrap_fits_width(font):
+    widths = WordWidths()
+    lines = wrap_text(TEXT, font, 120, widths)
+    assert len(lines) > 1
+    assert all(font.size(line)[0] <= 120 for line in lines)
+    assert " ".join(lines) == TEXT
+
+
+def test_wrap_breaks_long_words(font):
+    lines = wrap_text("a" * 80, font, 50, WordWidths())
+    assert "".join(lines) == "a" * 80
+    assert all(font.size(line)[0] <= 50 for line in lines)
+
+
+def test_word_widths_are_cached(font):
+    counting = CountingFont(font)
+    calls = []
+    counting.size = lambda text: calls.append(text) or font.size(text)
+    widths = WordWidths()
+    wrap_text("the cat and the dog", counting, 500, widths)
+    wrap_text("the dog and the cat", counting, 500, widths)
+    assert sorted(calls) == sorted([" ", "the", "cat", "and", "dog"])
+
+
+def test_reveal_renders_only_new_characters(font):
+    counting = CountingFont(font)
+    block = RevealedText(TEXT, counting, (255, 255, 255), 120)
+    for count in range(0, block.length + 3, 3):
+        block.reveal_to(count)
+    assert block.complete
+    rendered = "".join(counting.rendered)
+    assert len(rendered) <= len(TEXT)
+    assert rendered.replace(" ", "") == TEXT.replace(" ", "")
+
+    counting.rendered.clear()
+    block.reveal_to(None)
+    assert counting.rendered == []
+
+
+def test_dialogue_typewriter_reveal():
+    engine = DialogueEngine(GameState(), text_speed=10)
+    engine.load_data(
+        {"dialogue": {"id": "d", "lines": [{"text": "Hello there"}, {"text": "Bye"}]}}
+    )
+    engine.start("d")
+    engine.update(0.5)
+    assert int(engine.visible_chars) == 5
+    assert not engine.line_revealed()
+    engine.reveal_line()
+    assert engine.line_revealed()
+
+    engine.advance()
+    engine.update(0.1)
+    assert engine.get_current_line() == "Bye"
+    assert int(engine.visible_chars) == 1
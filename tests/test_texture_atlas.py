@@ -0,0 +1,96 @@
+import os
+import random
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+pygame = pytest.importorskip("pygame")
+
+from engine.asset_manager import AssetManager
+from engine.texture_atlas import TextureAtlas, pack
+from tools import atlas_builder
+
+
+def _image(size, color):
+    surf = pygame.Surface(size, pygame.SRCALPHA)
+    surf.fill(color)
+    return surf
+
+
+def _overlap(a, b):
+    return a.page == b.page and pygame.Rect(a.rect).colliderect(pygame.Rect(b.rect))
+
+
+def test_pack_keeps_regions_apart_and_on_page():
+    rng = random.Random(4)
+    sizes = {f"img{i}": (rng.randint(4, 60), rng.randint(4, 60)) for i in range(120)}
+    regions, pages = pack(sizes, page_size=256, padding=1)
+    assert len(regions) == 120 and len(pages) > 1
+    for key, region in regions.items():
+        assert (region.width, region.height) == sizes[key]
+        width, height = pages[region.page]
+        assert region.x + region.width <= width and region.y + region.height <= height
+    items = list(regions.values())
+    for idx, a in enumerate(items):
+        assert not any(_overlap(a, b) for b in items[idx + 1 :])
+
+
+def test_pack_rejects_oversized():
+    with pytest.raises(ValueError):
+        pack({"big": (300, 10)}, page_size=256)
+
+
+def test_atlas_roundtrip(tmp_path):
+    images = {
+        "icons/a.png": _image((8, 8), (255, 0, 0, 255)),
+        "icons/b.png": _image((4, 12), (0, 255, 0, 128)),
+    }
+    atlas = TextureAtlas.build(images, page_size=64)
+    index = tmp_path / "atlas" / "ui.json"
+    atlas.save(str(index))
+    loaded = TextureAtlas.load(str(index))
+    assert len(loaded.pages) == 1
+    b = loaded.get(os.path.normpath("icons/b.png"))
+    assert b.get_size() == (4, 12)
+    assert tuple(b.get_at((1, 1))) == (0, 255, 0, 128)
+    assert b.get_parent() is loaded.pages[0]
+
+
+def test_asset_manager_serves_atlas_images(tmp_path):
+    icons = tmp_path / "icons"
+    icons.mkdir()
+    pygame.image.save(_image((16, 16), (10, 20, 30, 255)), str(icons / "key.png"))
+    pygame.image.save(_image((300, 20), (0, 0, 0, 255)), str(icons / "banner.png"))
+
+    manager = AssetManager(base_path=str(tmp_path))
+    atlas = manager.build_atlas(["icons/key.png", "icons/banner.png", "icons/none.png"])
+    assert list(atlas.keys()) == [os.path.normpath("icons/key.png")]
+    key = manager.get_image("icons/key.png")
+    assert key.get_parent() is atlas.pages[0]
+    assert tuple(key.get_at((0, 0))) == (10, 20, 30, 255)
+    page, rect = manager.get_region("icons/key.png")
+    assert page is atlas.pages[0] and rect[2:] == (16, 16)
+    assert manager.get_region("icons/banner.png") is None
+
+
+def test_builder_packs_item_icons(tmp_path):
+    assets = tmp_path / "assets"
+    (assets / "icons").mkdir(parents=True)
+    pygame.image.save(
+        _image((24, 24), (1, 2, 3, 255)), str(assets / "icons" / "key.png")
+    )
+    items = tmp_path / "items"
+    items.mkdir()
+    (items / "key.yaml").write_text("item:\n  id: key\n  icon: icons/key.png\n")
+    (items / "lamp.yaml").write_text("item:\n  id: lamp\n  icon: icons/lamp.png\n")
+
+    keys = atlas_builder.item_icons(str(items))
+    report = atlas_builder.build(keys, str(assets), str(assets / "atlas" / "ui.json"))
+    assert report["packed"] == [os.path.normpath("icons/key.png")]
+    assert report["missing"] == [os.path.normpath("icons/lamp.png")]
+
+    manager = AssetManager(base_path=str(assets))
+    assert manager.load_atlas("atlas/ui.json") is not None
+    assert manager.get_image("icons/key.png").get_size() == (24, 24)
@@ -10,15 +10,17 @@ from engine.game_state import GameState
 def test_delay_event_triggers():
     state = GameState()
     engine = TimelineEngine(state)
-    engine.load_events([
-        {
-            "id": "door_event",
-            "trigger": "delay",
-            "time": 1.0,
-            "action": "set_flag",
-            "params": {"flag": "door"},
-        }
-    ])
+    engine.load_events(
+        [
+            {
+                "id": "door_event",
+                "trigger": "delay",
+                "time": 1.0,
+                "action": "set_flag",
+                "params": {"flag": "door"},
+            }
+        ]
+    )
 
     engine.update(current_ticks=500)
     assert state.get_flag("door") is False
@@ -30,16 +32,18 @@ def test_delay_event_triggers():
 def test_condition_event(tmp_path):
     state = GameState(save_path=str(tmp_path / "save.json"))
     engine = TimelineEngine(state)
-    engine.load_events([
-        {
-            "id": "gate",
-            "trigger": "condition",
-            "time": 0.2,
-            "condition": "open",
-            "action": "set_flag",
-            "params": {"flag": "gate"},
-        }
-    ])
+    engine.load_events(
+        [
+            {
+                "id": "gate",
+                "trigger": "condition",
+                "time": 0.2,
+                "condition": "open",
+                "action": "set_flag",
+                "params": {"flag": "gate"},
+            }
+        ]
+    )
 
     engine.update(current_ticks=300)
     assert state.get_flag("gate") is False
@@ -54,15 +58,17 @@ def test_time_loop_resets():
     engine = TimelineEngine(state)
     engine.loop_enabled = True
     engine.loop_duration = 2.0
-    engine.load_events([
-        {
-            "id": "toggle",
-            "trigger": "delay",
-            "time": 1.0,
-            "action": "toggle_flag",
-            "params": {"flag": "door"},
-        }
-    ])
+    engine.load_events(
+        [
+            {
+                "id": "toggle",
+                "trigger": "delay",
+                "time": 1.0,
+                "action": "toggle_flag",
+                "params": {"flag": "door"},
+            }
+        ]
+    )
 
     engine.update(current_ticks=1100)
     assert state.get_flag("door") is True
@@ -72,3 +78,23 @@ def test_time_loop_resets():
 
     engine.update(current_ticks=1200 + 2100)  # another second after reset
     assert state.get_flag("door") is False
+
+
+def test_schedule_events_reuses_templates(tmp_path):
+    state = GameState(save_path=str(tmp_path / "save.json"))
+    engine = TimelineEngine(state)
+    templates = TimelineEngine.parse_events(
+        [{"trigger": "delay", "time": 0.5, "action": "set_flag", "flag": "bell"}]
+    )
+
+    engine.schedule_events(templates, 1000, "tower")
+    engine.update(current_ticks=1600, current_scene="tower")
+    assert state.get_flag("bell") is True
+    assert templates[0].triggered is False
+    assert templates[0].scene is None
+
+    state.set_flag("bell", False)
+    engine.events = []
+    engine.schedule_events(templates, 1600, "tower")
+    engine.update(current_ticks=2200, current_scene="tower")
+    assert state.get_flag("bell") is True
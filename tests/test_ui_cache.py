@@ -0,0 +1,143 @@
+import os
+import sys
+import types
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from engine import text_layout, ui_cache
+from engine.ui_cache import PanelPool, TextCache
+
+
+class CountingFont:
+    def __init__(self):
+        self.calls = []
+
+    def render(self, text, aa, color):
+        self.calls.append(text)
+        return types.SimpleNamespace(
+            text=text, get_width=lambda: len(text) * 5, get_height=lambda: 10
+        )
+
+    def size(self, text):
+        return len(text) * 5, 10
+
+    def get_height(self):
+        return 10
+
+    get_linesize = get_height
+
+
+class DummyRect:
+    def __init__(self, x, y, w, h):
+        self.left, self.top, self.width, self.height = x, y, w, h
+        self.topleft = (x, y)
+
+
+class DummySurface:
+    created = 0
+
+    def __init__(self, size=(200, 200), flags=None):
+        DummySurface.created += 1
+        self._size = size
+
+    def get_size(self):
+        return self._size
+
+    def blit(self, *args, **kwargs):
+        pass
+
+    def fill(self, *args, **kwargs):
+        pass
+
+
+def _dummy_pygame():
+    return types.SimpleNamespace(
+        SRCALPHA=1,
+        Rect=DummyRect,
+        Surface=DummySurface,
+        font=types.SimpleNamespace(Font=lambda path, size: CountingFont()),
+    )
+
+
+def test_text_cache_hits_and_lru():
+    font = CountingFont()
+    cache = TextCache(max_entries=2)
+    first = cache.render(font, "hello", (255, 255, 255))
+    assert cache.render(font, "hello", (255, 255, 255)) is first
+    cache.render(font, "hello", (0, 0, 0))
+    cache.render(font, "world", (0, 0, 0))
+    assert len(cache) == 2
+    cache.render(font, "hello", (255, 255, 255))
+    assert font.calls == ["hello", "hello", "world", "hello"]
+    stats = cache.stats()
+    assert stats["hits"] == 1 and stats["misses"] == 4
+    assert stats["hit_rate"] == 0.2
+
+
+def test_dialogue_steady_state_renders_nothing(monkeypatch):
+    dummy_pg = _dummy_pygame()
+    monkeypatch.setitem(sys.modules, "pygame", dummy_pg)
+    from engine import ui_overlay
+
+    monkeypatch.setattr(ui_overlay, "pygame", dummy_pg)
+    monkeypatch.setattr(ui_cache, "pygame", dummy_pg)
+    monkeypatch.setattr(text_layout, "pygame", dummy_pg)
+    overlay = ui_overlay.UIOverlay(DummySurface())
+    font = overlay.font
+    for _ in range(3):
+        overlay.draw_dialogue_box("Bonjour", "Guide")
+        overlay.draw_options(["Oui", "Non"])
+    assert sorted(font.calls) == sorted(["Guide", "Bonjour", "1. Oui", "2. Non"])
+    assert overlay.text_cache.stats()["hits"] == 6
+
+
+def test_accessibility_invalidates_text_cache(monkeypatch, tmp_path):
+    dummy_pg = _dummy_pygame()
+    monkeypatch.setitem(sys.modules, "pygame", dummy_pg)
+    from engine import accessibility_manager, ui_overlay
+
+    monkeypatch.setattr(ui_overlay, "pygame", dummy_pg)
+    monkeypatch.setattr(accessibility_manager, "pygame", dummy_pg)
+    monkeypatch.setattr(ui_cache, "pygame", dummy_pg)
+    overlay = ui_overlay.UIOverlay(DummySurface())
+    overlay._render_text("cached")
+    assert len(overlay.text_cache) == 1
+
+    accessibility_manager.AccessibilityManager(
+        save_file=str(tmp_path / "a11y.yaml"), ui_overlay=overlay, contrast_mode="night"
+    )
+    assert len(overlay.text_cache) == 0
+    assert overlay.theme["font_color"] == (200, 200, 200)
+
+
+def test_panel_pool_reuses_surfaces(monkeypatch):
+    monkeypatch.setattr(ui_cache, "pygame", _dummy_pygame())
+    pool = PanelPool(max_entries=2)
+    box = pool.get((10, 20), (0, 0, 0, 180))
+    assert pool.get((10, 20), (0, 0, 0, 180)) is box
+    assert pool.get((10, 20), (255, 255, 255, 230)) is not box
+    pool.get((5, 5), (0, 0, 0, 180))
+    assert len(pool) == 2 and pool.hits == 1
+
+
+def test_tooltip_boxes_allocated_once(monkeypatch):
+    dummy_pg = _dummy_pygame()
+    monkeypatch.setitem(sys.modules, "pygame", dummy_pg)
+    from engine import ui_overlay
+
+    monkeypatch.setattr(ui_overlay, "pygame", dummy_pg)
+    monkeypatch.setattr(ui_cache, "pygame", dummy_pg)
+    monkeypatch.setattr(text_layout, "pygame", dummy_pg)
+    screen = DummySurface()
+    overlay = ui_overlay.UIOverlay(screen)
+    overlay.draw_tooltip("door", (50, 50))
+    overlay.draw_dialogue_box("Bonjour")
+    created = DummySurface.created
+    for _ in range(5):
+        overlay.draw_tooltip("door", (50, 50))
+        overlay.draw_dialogue_box("Bonjour")
+    assert DummySurface.created == created
+
+    screen._size = (300, 300)
+    overlay.draw_tooltip("door", (50, 50))
+    assert DummySurface.created == created + 1
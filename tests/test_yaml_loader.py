@@ -0,0 +1,90 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+yaml = pytest.importorskip("yaml")
+
+from engine import yaml_loader
+from tools.yaml_benchmark import benchmark, find_yaml_files
+
+
+def test_prefers_libyaml_when_available():
+    if getattr(yaml, "CSafeLoader", None):
+        assert yaml_loader.SafeLoader is yaml.CSafeLoader
+        assert yaml_loader.HAS_LIBYAML
+    else:
+        assert yaml_loader.SafeLoader is yaml.SafeLoader
+        assert not yaml_loader.HAS_LIBYAML
+
+
+def test_cache_returns_independent_copies(tmp_path):
+    yaml_loader.clear_cache()
+    path = tmp_path / "data.yaml"
+    path.write_text("item:\n  id: key\n  tags: [a, b]\n")
+
+    first = yaml_loader.load_yaml(str(path))
+    first["item"]["tags"].append("mutated")
+    second = yaml_loader.load_yaml(str(path))
+
+    assert second == {"item": {"id": "key", "tags": ["a", "b"]}}
+    assert yaml_loader.cache_info()["hits"] == 1
+
+
+def test_cache_detects_changes(tmp_path):
+    yaml_loader.clear_cache()
+    path = tmp_path / "data.yaml"
+    path.write_text("value: 1\n")
+    assert yaml_loader.load_yaml(str(path)) == {"value": 1}
+
+    path.write_text("value: 22\n")
+    assert yaml_loader.load_yaml(str(path)) == {"value": 22}
+    assert yaml_loader.cache_info()["misses"] == 2
+
+
+def test_unmarshallable_documents_are_cached(tmp_path):
+    yaml_loader.clear_cache()
+    path = tmp_path / "dated.yaml"
+    path.write_text("released: 2024-01-01\n")
+
+    first = yaml_loader.load_yaml(str(path))
+    assert yaml_loader.load_yaml(str(path)) == first
+
+
+def test_cache_is_bounded_lru(tmp_path):
+    yaml_loader.clear_cache()
+    yaml_loader.set_cache_limit(2)
+    try:
+        paths = []
+        for name in "abc":
+            path = tmp_path / f"{name}.yaml"
+            path.write_text(f"name: {name}\n")
+            paths.append(str(path))
+        yaml_loader.load_yaml(paths[0])
+        yaml_loader.load_yaml(paths[1])
+        yaml_loader.load_yaml(paths[0])
+        yaml_loader.load_yaml(paths[2])
+
+        info = yaml_loader.cache_info()
+        assert info["entries"] == 2 and info["evictions"] == 1
+        yaml_loader.load_yaml(paths[0])
+        assert yaml_loader.cache_info()["hits"] == 2
+
+        yaml_loader.clear_cache(paths[0])
+        assert yaml_loader.cache_info()["entries"] == 1
+    finally:
+        yaml_loader.set_cache_limit(yaml_loader.MAX_ENTRIES)
+        yaml_loader.clear_cache()
+
+
+def test_benchmark_reports_loaders(tmp_path):
+    (tmp_path / "nested").mkdir()
+    (tmp_path / "nested" / "a.yaml").write_text("a: 1\n")
+    files = find_yaml_files([str(tmp_path)])
+    assert files == [str(tmp_path / "nested" / "a.yaml")]
+
+    results = benchmark(files, repeat=1)
+    assert "SafeLoader" in results
+    assert "load_yaml (cached)" in results
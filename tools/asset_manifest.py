@@ -0,0 +1,67 @@
+"""Build the asset manifest index used to resolve asset paths.
+
+Run from the project root (stored paths are relative to it)::
+
+    python -m tools.asset_manifest --out assets/manifest.json
+    python -m tools.asset_manifest --roots assets mods/assets --no-hashes
+    python -m tools.asset_manifest --check assets/manifest.json
+
+Point ``asset_manifest.index`` in ``config.yaml`` at the output (relative to
+``assets/``). ``--check`` reports files added, removed or changed since the
+index was written and exits with status 1 when it is out of date.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from typing import Dict, List, Sequence
+
+from engine.asset_manifest import AssetManifest
+
+
+def build(roots: Sequence[str], out: str, hashes: bool = True) -> AssetManifest:
+    """Scan ``roots`` and save the manifest at ``out``."""
+    manifest = AssetManifest.scan(roots, hashes=hashes, skip=[out])
+    manifest.save(out)
+    return manifest
+
+
+def check(index_path: str, roots: Sequence[str] | None = None) -> Dict[str, List[str]]:
+    """Compare the index at ``index_path`` with the files on disk now."""
+    saved = AssetManifest.load(index_path)
+    hashes = any(entry.hash for entry in saved.entries.values())
+    current = AssetManifest.scan(roots or saved.roots, hashes=hashes, skip=[index_path])
+    return saved.diff(current)
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--roots", nargs="+", default=["assets/"])
+    parser.add_argument("--out", default="assets/manifest.json")
+    parser.add_argument(
+        "--no-hashes", action="store_true", help="skip SHA-1 of each file"
+    )
+    parser.add_argument("--check", metavar="INDEX", help="report changes since INDEX")
+    args = parser.parse_args(argv)
+
+    if args.check:
+        report = check(args.check)
+        for reason in ("added", "removed", "changed"):
+            for key in report[reason]:
+                print(f"  {reason}: {key}")
+        if any(report.values()):
+            print(f"{args.check} is out of date")
+            sys.exit(1)
+        print(f"{args.check} is up to date")
+        return
+
+    manifest = build(args.roots, args.out, hashes=not args.no_hashes)
+    print(
+        f"indexed {len(manifest)} files "
+        f"({manifest.total_bytes() / (1024 * 1024):.1f} MB) into {args.out}"
+    )
+
+
+if __name__ == "__main__":
+    main()
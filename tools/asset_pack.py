@@ -0,0 +1,94 @@
+"""Pack an asset folder into a single memory-mapped archive.
+
+Run from the project root::
+
+    python -m tools.asset_pack --assets assets --out assets/base.pack
+    python -m tools.asset_pack icons ui --out assets/ui.pack --exclude .psd
+    python -m tools.asset_pack --verify assets/base.pack
+
+Positional arguments limit the pack to folders or files relative to
+``--assets``. Add the output (relative to ``assets/``) to ``asset_packs`` in
+``config.yaml``; loose copies of packed files can then be left out of a
+release.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+from typing import Dict, List, Sequence
+
+from engine.asset_manifest import AssetManifest
+from engine.asset_pack import AssetPack, write_pack
+
+
+def collect(
+    assets_dir: str,
+    sources: Sequence[str] = (),
+    exclude: Sequence[str] = (),
+    skip: Sequence[str] = (),
+) -> Dict[str, str]:
+    """Return ``{name: path}`` for the files to pack below ``assets_dir``."""
+    manifest = AssetManifest.scan([assets_dir], skip=skip)
+    prefixes = [os.path.normpath(source) for source in sources]
+    suffixes = tuple(ext.lower() for ext in exclude)
+    files: Dict[str, str] = {}
+    for name in sorted(manifest.names()):
+        if prefixes and not any(
+            name == prefix or name.startswith(prefix + os.sep) for prefix in prefixes
+        ):
+            continue
+        if suffixes and name.lower().endswith(suffixes):
+            continue
+        files[name] = manifest.entries[name].path
+    return files
+
+
+def build(
+    assets_dir: str,
+    out: str,
+    sources: Sequence[str] = (),
+    exclude: Sequence[str] = (".pack",),
+) -> Dict[str, int]:
+    """Write the pack at ``out`` and return its file count and size."""
+    files = collect(assets_dir, sources, exclude, skip=[out])
+    entries = write_pack(files, out)
+    return {"files": len(entries), "bytes": os.path.getsize(out)}
+
+
+def verify(pack_path: str) -> List[str]:
+    """Return the names whose stored bytes no longer match their hash."""
+    with AssetPack(pack_path) as pack:
+        return [name for name in sorted(pack.names()) if not pack.verify(name)]
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("sources", nargs="*", default=[])
+    parser.add_argument("--assets", default="assets")
+    parser.add_argument("--out", default="assets/base.pack")
+    parser.add_argument(
+        "--exclude", nargs="*", default=[".pack"], help="file extensions to leave loose"
+    )
+    parser.add_argument("--verify", metavar="PACK", help="check the hashes of PACK")
+    args = parser.parse_args(argv)
+
+    if args.verify:
+        bad = verify(args.verify)
+        for name in bad:
+            print(f"  corrupt: {name}")
+        if bad:
+            sys.exit(1)
+        print(f"{args.verify} is intact")
+        return
+
+    report = build(args.assets, args.out, args.sources, args.exclude)
+    print(
+        f"packed {report['files']} files ({report['bytes'] / (1024 * 1024):.1f} MB) "
+        f"into {args.out}"
+    )
+
+
+if __name__ == "__main__":
+    main()
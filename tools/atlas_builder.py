@@ -0,0 +1,116 @@
+"""Pack item icons and small UI images into a texture atlas.
+
+Run from the project root::
+
+    python -m tools.atlas_builder --items game/items --out assets/atlas/ui.json
+    python -m tools.atlas_builder icons ui --max-size 128
+
+Positional arguments are folders or files relative to ``--assets``. Item
+icons (``item.icon``) are added from ``--items``. Point ``atlas.index`` in
+``config.yaml`` at the output (relative to ``assets/``) to use it.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+from typing import Dict, List, Sequence
+
+import pygame
+
+from engine.texture_atlas import TextureAtlas
+from engine.yaml_loader import load_yaml
+
+IMAGE_EXTENSIONS = (".png", ".bmp", ".gif", ".jpg", ".jpeg", ".tga", ".webp")
+
+
+def item_icons(items_dir: str) -> List[str]:
+    """Return the ``icon`` of every item file in ``items_dir``."""
+    icons: List[str] = []
+    if not os.path.isdir(items_dir):
+        return icons
+    with os.scandir(items_dir) as entries:
+        for entry in sorted(entries, key=lambda e: e.name):
+            if entry.is_file() and entry.name.endswith((".yaml", ".yml")):
+                item = (load_yaml(entry.path) or {}).get("item") or {}
+                if isinstance(item, dict) and item.get("icon"):
+                    icons.append(item["icon"])
+    return icons
+
+
+def find_images(assets_dir: str, sources: Sequence[str]) -> List[str]:
+    """Expand ``sources`` (files or folders below ``assets_dir``) to image keys."""
+    keys: List[str] = []
+    for source in sources:
+        path = os.path.join(assets_dir, source)
+        if os.path.isfile(path):
+            keys.append(os.path.normpath(source))
+            continue
+        stack = [path] if os.path.isdir(path) else []
+        while stack:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.name.lower().endswith(IMAGE_EXTENSIONS):
+                        keys.append(
+                            os.path.normpath(os.path.relpath(entry.path, assets_dir))
+                        )
+    return keys
+
+
+def build(
+    keys: Sequence[str],
+    assets_dir: str,
+    out: str,
+    page_size: int = 1024,
+    max_size: int = 256,
+    padding: int = 1,
+) -> Dict[str, List[str]]:
+    """Pack ``keys`` into an atlas saved at ``out``; report what was skipped."""
+    images: Dict[str, "pygame.Surface"] = {}
+    report: Dict[str, List[str]] = {"packed": [], "missing": [], "too_large": []}
+    for key in dict.fromkeys(os.path.normpath(k) for k in keys):
+        path = os.path.join(assets_dir, key)
+        if not os.path.exists(path):
+            report["missing"].append(key)
+            continue
+        image = pygame.image.load(path)
+        if max(image.get_size()) > max_size:
+            report["too_large"].append(key)
+            continue
+        images[key] = image
+        report["packed"].append(key)
+    if images:
+        atlas = TextureAtlas.build(images, page_size, padding)
+        atlas.save(out)
+        report["pages"] = [f"{w}x{h}" for w, h in (p.get_size() for p in atlas.pages)]
+    return report
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("sources", nargs="*", default=[])
+    parser.add_argument("--assets", default="assets")
+    parser.add_argument("--items", default="game/items")
+    parser.add_argument("--out", default="assets/atlas/ui.json")
+    parser.add_argument("--page-size", type=int, default=1024)
+    parser.add_argument("--max-size", type=int, default=256)
+    parser.add_argument("--padding", type=int, default=1)
+    args = parser.parse_args(argv)
+
+    keys = item_icons(args.items) + find_images(args.assets, args.sources)
+    report = build(
+        keys, args.assets, args.out, args.page_size, args.max_size, args.padding
+    )
+    pages = len(report.get("pages", []))
+    print(f"packed {len(report['packed'])} images into {pages} page(s)")
+    if report.get("pages"):
+        print("pages: " + ", ".join(report["pages"]))
+    for reason in ("missing", "too_large"):
+        for key in report[reason]:
+            print(f"  skipped ({reason.replace('_', ' ')}): {key}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,157 @@
+"""Measure full-frame throughput without a display.
+
+Each frame draws the static scene layers through :class:`Renderer`, then a
+dialogue box, its options, a tooltip and an FPS label through
+:class:`UIOverlay`, and presents the frame. Run from the project root::
+
+    python -m tools.frame_benchmark --frames 2000
+    python -m tools.frame_benchmark --config config.yaml --mode dummy --fps 60
+
+``--mode dummy`` uses SDL's dummy video driver (``display.flip`` included),
+``--mode offscreen`` draws to a plain surface. ``--fps 0`` runs uncapped.
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import pygame
+
+from engine.frame_scheduler import FrameScheduler
+from engine.headless import create_display
+from engine.renderer import Renderer
+from engine.ui_overlay import UIOverlay
+
+DIALOGUE = (
+    "The lamps along the canal flicker as you pass. Somewhere behind the "
+    "warehouse a door slams, and the smell of wet stone follows you inside."
+)
+OPTIONS = ["Follow the sound", "Wait by the water", "Head back"]
+
+
+def synthetic_layers(
+    size: Tuple[int, int], overlays: int = 3
+) -> List["pygame.Surface"]:
+    """Return a background plus ``overlays`` translucent layers."""
+    width, height = size
+    background = pygame.Surface(size)
+    for y in range(0, height, 8):
+        shade = 40 + y * 120 // max(height, 1)
+        background.fill((shade // 2, shade // 2, shade), (0, y, width, 8))
+    layers = [background]
+    for idx in range(overlays):
+        layer = pygame.Surface(size, pygame.SRCALPHA)
+        step = width // (overlays + 1)
+        layer.fill(
+            (200, 180, 120, 90), (step * (idx + 1) - 40, height // 3, 80, height // 3)
+        )
+        layers.append(layer)
+    return layers
+
+
+def scene_layers(config_path: str, screen: "pygame.Surface") -> List[Any]:
+    """Load the start scene of ``config_path`` and return its static layers."""
+    from engine.scene_manager import SceneManager
+    from engine.yaml_loader import load_yaml
+
+    config = dict(load_yaml(config_path))
+    config["prefetch"] = {"enabled": False}
+    config["hot_reload"] = {"enabled": False}
+    manager = SceneManager(screen, config)
+    return manager.static_layers
+
+
+def benchmark(
+    frames: int = 1000,
+    size: Tuple[int, int] = (800, 600),
+    mode: str = "offscreen",
+    fps: int = 0,
+    dirty_rects: bool = False,
+    config_path: Optional[str] = None,
+    logical_size: Optional[Tuple[int, int]] = None,
+    scale_mode: str = "smooth",
+) -> Dict[str, float]:
+    """Render ``frames`` full frames and return timing figures.
+
+    With ``logical_size`` frames are drawn at that size and scaled to ``size``.
+    """
+    screen = create_display(size, "frame-benchmark", headless=mode)
+    renderer = Renderer(
+        screen,
+        dirty_rects=dirty_rects,
+        logical_size=logical_size,
+        scale_mode=scale_mode,
+    )
+    view = renderer.screen.get_size()
+    layers = (
+        scene_layers(config_path, screen) if config_path else synthetic_layers(view)
+    )
+    overlay = UIOverlay(renderer.target)
+    scheduler = FrameScheduler(target_fps=fps, clock=pygame.time.Clock())
+    label_clock = scheduler.clock
+
+    start = time.perf_counter()
+    for frame in range(frames):
+        scheduler.tick()
+        renderer.begin_frame(layers, "benchmark")
+        overlay.draw_dialogue_box(
+            DIALOGUE, "Guide", reveal=frame % (len(DIALOGUE) + 40)
+        )
+        overlay.draw_options(OPTIONS)
+        overlay.draw_tooltip("Warehouse door", (view[0] // 2, view[1] // 2))
+        overlay.draw_fps(label_clock)
+        renderer.end_frame()
+    seconds = time.perf_counter() - start
+    pygame.quit()
+
+    return {
+        "frames": frames,
+        "seconds": seconds,
+        "fps": frames / seconds if seconds else 0.0,
+        "ms_per_frame": seconds / frames * 1000 if frames else 0.0,
+        "full_frames": renderer.full_frames,
+        "text_hit_rate": overlay.text_cache.stats()["hit_rate"],
+    }
+
+
+def _parse_size(value: str) -> Tuple[int, int]:
+    width, _, height = value.lower().partition("x")
+    return int(width), int(height)
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--frames", type=int, default=1000)
+    parser.add_argument("--size", type=_parse_size, default=(800, 600))
+    parser.add_argument("--mode", choices=["dummy", "offscreen"], default="offscreen")
+    parser.add_argument("--fps", type=int, default=0, help="frame cap, 0 = uncapped")
+    parser.add_argument("--dirty-rects", action="store_true")
+    parser.add_argument("--config", help="draw the start scene of this config")
+    parser.add_argument("--logical", type=_parse_size, help="draw at WxH and scale")
+    parser.add_argument("--scale-mode", choices=Renderer.SCALE_MODES, default="smooth")
+    args = parser.parse_args(argv)
+
+    result = benchmark(
+        args.frames,
+        args.size,
+        args.mode,
+        args.fps,
+        args.dirty_rects,
+        args.config,
+        args.logical,
+        args.scale_mode,
+    )
+    print(
+        f"{result['frames']} frames in {result['seconds']:.3f}s  "
+        f"{result['fps']:8.1f} FPS  {result['ms_per_frame']:.3f} ms/frame"
+    )
+    print(
+        f"full frames: {result['full_frames']}  "
+        f"text cache hit rate: {result['text_hit_rate']:.0%}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""Compare YAML parse times across the loaders available to the engine.
+
+Run from the project root::
+
+    python -m tools.yaml_benchmark game locales --repeat 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import time
+from typing import Dict, List, Sequence
+
+from engine import yaml_loader
+
+DEFAULT_DIRS = ["game", "locales", "regions", "scenes", "config", "meta"]
+
+
+def find_yaml_files(directories: Sequence[str]) -> List[str]:
+    """Return every ``*.yaml``/``*.yml`` file below ``directories``."""
+    files: List[str] = []
+    stack = [d for d in directories if os.path.isdir(d)]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if not entry.name.startswith((".", "__")):
+                        stack.append(entry.path)
+                elif entry.name.endswith((".yaml", ".yml")):
+                    files.append(entry.path)
+    return sorted(files)
+
+
+def available_loaders() -> Dict[str, object]:
+    """Return the loader classes that can be benchmarked here."""
+    loaders: Dict[str, object] = {}
+    if yaml_loader.PySafeLoader is not None:
+        loaders["SafeLoader"] = yaml_loader.PySafeLoader
+    if yaml_loader.HAS_LIBYAML:
+        loaders["CSafeLoader"] = yaml_loader.SafeLoader
+    return loaders
+
+
+def benchmark(files: Sequence[str], repeat: int = 10) -> Dict[str, float]:
+    """Return the seconds each loader needs to parse ``files`` ``repeat`` times.
+
+    The ``load_yaml (cached)`` row measures repeat loads served from the
+    shared per-file cache.
+    """
+    texts = []
+    for path in files:
+        with open(path, "r", encoding="utf-8") as fh:
+            texts.append(fh.read())
+
+    results: Dict[str, float] = {}
+    for name, loader in available_loaders().items():
+        start = time.perf_counter()
+        for _ in range(repeat):
+            for text in texts:
+                yaml_loader.safe_load(text, loader=loader)
+        results[name] = time.perf_counter() - start
+
+    yaml_loader.clear_cache()
+    for path in files:
+        yaml_loader.load_yaml(path)
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for path in files:
+            yaml_loader.load_yaml(path)
+    results["load_yaml (cached)"] = time.perf_counter() - start
+    return results
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("dirs", nargs="*", default=DEFAULT_DIRS)
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args(argv)
+
+    files = find_yaml_files(args.dirs)
+    if not files:
+        print("No YAML files found")
+        return
+    print(f"{len(files)} files x {args.repeat} runs")
+    results = benchmark(files, args.repeat)
+    baseline = results.get("SafeLoader")
+    for name, seconds in results.items():
+        per_file = seconds / (len(files) * args.repeat) * 1000
+        speedup = f"  {baseline / seconds:5.1f}x" if baseline and seconds else ""
+        print(f"{name:<20} {seconds:8.4f}s  {per_file:7.3f} ms/file{speedup}")
+
+
+if __name__ == "__main__":
+    main()